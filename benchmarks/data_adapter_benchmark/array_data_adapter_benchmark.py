@@ -0,0 +1,68 @@
+"""Benchmark shuffled iteration over NumPy arrays in `ArrayDataAdapter`.
+
+This compares the per-batch slicing of the arrays against the fast path which
+gathers many batches at once into reused buffers.
+
+To run the benchmark, use the command below and change the flags according to
+your target:
+
+```
+python3 -m benchmarks.data_adapter_benchmark.array_data_adapter_benchmark \
+    --num_samples=10000000 \
+    --num_features=16 \
+    --num_inputs=4 \
+    --batch_size=256
+```
+"""
+
+import time
+from unittest import mock
+
+import numpy as np
+from absl import app
+from absl import flags
+
+from keras.src.trainers.data_adapters import array_data_adapter
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_integer("num_samples", 1000000, "Number of samples.")
+flags.DEFINE_integer("num_features", 16, "Number of features per input.")
+flags.DEFINE_integer("num_inputs", 4, "Number of input arrays.")
+flags.DEFINE_integer("batch_size", 256, "Batch size.")
+
+
+def benchmark_iteration(x, y, use_gather):
+    adapter = array_data_adapter.ArrayDataAdapter(
+        x, y=y, batch_size=FLAGS.batch_size, shuffle=True
+    )
+    with mock.patch.object(
+        array_data_adapter, "_can_gather", lambda _: use_gather
+    ):
+        start_time = time.time()
+        for _ in adapter.get_numpy_iterator():
+            pass
+        elapsed = time.time() - start_time
+    print(
+        f"use_gather={use_gather}: "
+        f"{FLAGS.num_samples / elapsed:.0f} samples/s "
+        f"({elapsed:.2f}s per epoch)"
+    )
+    return elapsed
+
+
+def main(_):
+    x = {
+        f"input_{i}": np.random.random(
+            (FLAGS.num_samples, FLAGS.num_features)
+        ).astype("float32")
+        for i in range(FLAGS.num_inputs)
+    }
+    y = np.random.randint(0, 2, size=(FLAGS.num_samples, 1))
+    slicing_time = benchmark_iteration(x, y, use_gather=False)
+    gather_time = benchmark_iteration(x, y, use_gather=True)
+    print(f"Speedup: {slicing_time / gather_time:.2f}x")
+
+
+if __name__ == "__main__":
+    app.run(main)
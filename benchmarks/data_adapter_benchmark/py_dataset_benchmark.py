@@ -0,0 +1,94 @@
+"""Benchmark the transport of `PyDataset` batches from worker processes.
+
+This compares sending batches back from the multiprocessing workers by
+pickling them (the default) against the shared memory ring enabled with
+`use_shared_memory=True`.
+
+To run the benchmark, use the command below and change the flags according to
+your target:
+
+```
+python3 -m benchmarks.data_adapter_benchmark.py_dataset_benchmark \
+    --num_batches=200 \
+    --batch_size=64 \
+    --image_size=224 \
+    --workers=4
+```
+"""
+
+import time
+
+import numpy as np
+from absl import app
+from absl import flags
+
+import keras
+from keras.src.trainers.data_adapters import py_dataset_adapter
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_integer("num_batches", 200, "Number of batches per epoch.")
+flags.DEFINE_integer("batch_size", 64, "Batch size.")
+flags.DEFINE_integer("image_size", 224, "Height and width of the images.")
+flags.DEFINE_integer("workers", 4, "Number of worker processes.")
+flags.DEFINE_integer("max_queue_size", 10, "Maximum number of queued batches.")
+flags.DEFINE_integer("epochs", 2, "Number of epochs to iterate over.")
+
+
+class ImagePyDataset(keras.utils.PyDataset):
+    def __init__(self, num_batches, batch_size, image_size, **kwargs):
+        super().__init__(**kwargs)
+        self._num_batches = num_batches
+        self.batch_size = batch_size
+        self.image_size = image_size
+
+    @property
+    def num_batches(self):
+        return self._num_batches
+
+    def __getitem__(self, idx):
+        x = np.full(
+            (self.batch_size, self.image_size, self.image_size, 3),
+            idx,
+            dtype="float32",
+        )
+        y = np.full((self.batch_size,), idx, dtype="int32")
+        return x, y
+
+
+def benchmark_transport(use_shared_memory):
+    py_dataset = ImagePyDataset(
+        FLAGS.num_batches,
+        FLAGS.batch_size,
+        FLAGS.image_size,
+        workers=FLAGS.workers,
+        use_multiprocessing=True,
+        max_queue_size=FLAGS.max_queue_size,
+        use_shared_memory=use_shared_memory,
+    )
+    adapter = py_dataset_adapter.PyDatasetAdapter(py_dataset)
+    num_bytes = 0
+    start_time = time.time()
+    for _ in range(FLAGS.epochs):
+        adapter.on_epoch_begin()
+        for x, y in adapter.get_numpy_iterator():
+            num_bytes += x.nbytes + y.nbytes
+        adapter.on_epoch_end()
+    elapsed = time.time() - start_time
+    num_steps = FLAGS.epochs * FLAGS.num_batches
+    print(
+        f"use_shared_memory={use_shared_memory}: "
+        f"{num_steps / elapsed:.1f} batches/s, "
+        f"{num_bytes / elapsed / 2**30:.2f} GiB/s"
+    )
+    return elapsed
+
+
+def main(_):
+    pickle_time = benchmark_transport(use_shared_memory=False)
+    shared_memory_time = benchmark_transport(use_shared_memory=True)
+    print(f"Speedup: {pickle_time / shared_memory_time:.2f}x")
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -0,0 +1,64 @@
+"""Benchmark the overhead of `Layer.__call__()` for built layers.
+
+This calls built layers eagerly on a tiny batch, and reports for each layer
+the time taken by `layer(x)`, the time taken by `layer.call(x)`, and the
+difference, which is the overhead of `__call__()` (conversion of the inputs,
+inference of `training` and masks, scopes, etc.).
+
+To run the benchmark, use the command below and change the flags according to
+your target:
+
+```
+python3 -m benchmarks.layer_benchmark.call_overhead_benchmark \
+    --num_calls=2000
+```
+"""
+
+import time
+
+import numpy as np
+from absl import app
+from absl import flags
+
+import keras
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_integer("num_calls", 2000, "Number of calls to average over.")
+
+
+def get_layers():
+    return {
+        "Dense": keras.layers.Dense(4),
+        "Activation": keras.layers.Activation("relu"),
+        "LayerNormalization": keras.layers.LayerNormalization(),
+        "Dropout": keras.layers.Dropout(0.5),
+    }
+
+
+def time_calls(fn, num_calls):
+    fn()
+    start = time.perf_counter()
+    for _ in range(num_calls):
+        fn()
+    return (time.perf_counter() - start) / num_calls
+
+
+def main(_):
+    x = keras.ops.convert_to_tensor(np.random.rand(1, 4).astype("float32"))
+    for name, layer in get_layers().items():
+        layer(x)
+        call_time = time_calls(lambda: layer.call(x), FLAGS.num_calls)
+        for pattern, fn in (
+            ("layer(x)", lambda: layer(x)),
+            ("layer(x, training=False)", lambda: layer(x, training=False)),
+        ):
+            dunder_call_time = time_calls(fn, FLAGS.num_calls)
+            print(
+                f"{name} {pattern}: {dunder_call_time * 1e6:.1f} us per call, "
+                f"{(dunder_call_time - call_time) * 1e6:.1f} us of overhead"
+            )
+
+
+if __name__ == "__main__":
+    app.run(main)
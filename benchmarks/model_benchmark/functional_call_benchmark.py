@@ -0,0 +1,86 @@
+"""Benchmark the per-call overhead of functional models.
+
+This builds a functional model of many small layers, with residual
+connections so that the graph also contains nodes with several inputs, and
+reports the time taken by an eager call on a tiny batch. With inputs this
+small the time is dominated by the Python overhead of running the graph and
+of calling the layers, rather than by the computations.
+
+The time taken by `keras.Function` on the same graph is reported as well,
+which excludes the handling of `training` and masks by `Functional`, along
+with the time taken to run the graph with operations that return their
+first argument, which only measures the routing of the tensors from node
+to node.
+
+To run the benchmark, use the command below and change the flags according to
+your target:
+
+```
+python3 -m benchmarks.model_benchmark.functional_call_benchmark \
+    --num_blocks=50 \
+    --num_calls=200
+```
+"""
+
+import time
+
+import numpy as np
+from absl import app
+from absl import flags
+
+import keras
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_integer("num_blocks", 50, "Number of residual blocks.")
+flags.DEFINE_integer("num_calls", 200, "Number of calls to average over.")
+flags.DEFINE_integer("units", 4, "Number of units of the Dense layers.")
+
+
+def build_model(num_blocks, units):
+    inputs = keras.Input((units,))
+    x = inputs
+    for _ in range(num_blocks):
+        y = keras.layers.Dense(units)(x)
+        y = keras.layers.Activation("relu")(y)
+        x = keras.layers.Add()([x, y])
+    return keras.Model(inputs, x)
+
+
+def time_calls(fn, x, num_calls):
+    # Warm up, e.g. to build the execution plan of the graph.
+    fn(x)
+    start = time.perf_counter()
+    for _ in range(num_calls):
+        fn(x)
+    return (time.perf_counter() - start) / num_calls
+
+
+def main(_):
+    model = build_model(FLAGS.num_blocks, FLAGS.units)
+    function = keras.Function(model.input, model.output)
+    x = keras.ops.convert_to_tensor(
+        np.random.rand(1, FLAGS.units).astype("float32")
+    )
+    num_nodes = 3 * FLAGS.num_blocks
+
+    def run_graph_only(x):
+        return function._run_through_graph(
+            x, call_fn=lambda op, x, *args, **kwargs: x
+        )
+
+    for name, fn in (
+        ("Model.__call__", model),
+        ("Model.predict_on_batch", model.predict_on_batch),
+        ("Function.__call__", function),
+        ("Graph routing only", run_graph_only),
+    ):
+        seconds = time_calls(fn, x, FLAGS.num_calls)
+        print(
+            f"{name}: {seconds * 1000:.3f} ms per call, "
+            f"{seconds / num_nodes * 1e6:.2f} us per node"
+        )
+
+
+if __name__ == "__main__":
+    app.run(main)
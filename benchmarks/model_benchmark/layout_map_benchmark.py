@@ -0,0 +1,87 @@
+"""Benchmark the `LayoutMap` lookups of models built under `ModelParallel`.
+
+This builds a model of `num_layers` Dense layers, with a kernel and a bias
+each (so 10k variables with the default flags), in the scope of a
+`ModelParallel` distribution whose `LayoutMap` has `num_rules` regex rules.
+Every variable created looks up its layout in the `LayoutMap`. It reports the
+time taken to build the model, and the time taken by the lookups of all the
+variable paths alone.
+
+This benchmark requires the JAX backend, which is the only backend supporting
+`ModelParallel`. To run the benchmark, use the command below and change the
+flags according to your target:
+
+```
+KERAS_BACKEND=jax python3 -m benchmarks.model_benchmark.layout_map_benchmark \
+    --num_layers=5000 \
+    --num_rules=50
+```
+"""
+
+import time
+
+from absl import app
+from absl import flags
+
+import keras
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_integer("num_layers", 5000, "Number of Dense layers.")
+flags.DEFINE_integer("num_rules", 50, "Number of rules of the LayoutMap.")
+flags.DEFINE_integer("units", 4, "Number of units of the Dense layers.")
+
+
+def get_layout_map(device_mesh, num_rules):
+    layout_map = keras.distribution.LayoutMap(device_mesh)
+    layout_map[r"dense_\d*0/kernel"] = (None, "model")
+    layout_map[r"dense_\d*0/bias"] = ("model",)
+    # Rules for layers which are not in the model, as large models have for
+    # the layers of their other blocks.
+    for i in range(num_rules - 2):
+        layout_map[f"block_{i}/.*/kernel"] = ("model", None)
+    return layout_map
+
+
+def build_model(num_layers, units):
+    inputs = keras.Input((units,))
+    x = inputs
+    for _ in range(num_layers):
+        x = keras.layers.Dense(units)(x)
+    return keras.Model(inputs, x)
+
+
+def main(_):
+    devices = keras.distribution.list_devices()
+    device_mesh = keras.distribution.DeviceMesh(
+        (1, len(devices)), ["batch", "model"], devices
+    )
+    layout_map = get_layout_map(device_mesh, FLAGS.num_rules)
+    distribution = keras.distribution.ModelParallel(
+        layout_map=layout_map, batch_dim_name="batch"
+    )
+
+    with distribution.scope():
+        start = time.perf_counter()
+        model = build_model(FLAGS.num_layers, FLAGS.units)
+        build_time = time.perf_counter() - start
+    print(
+        f"Built a model with {len(model.weights)} variables in "
+        f"{build_time:.2f} s"
+    )
+
+    paths = [variable.path for variable in model.weights]
+    layout_map = get_layout_map(device_mesh, FLAGS.num_rules)
+    for label in ("first", "memoized"):
+        start = time.perf_counter()
+        for path in paths:
+            layout_map[path]
+        lookup_time = time.perf_counter() - start
+        print(
+            f"Looked up the layouts of {len(paths)} paths ({label} lookups) "
+            f"in {lookup_time:.3f} s"
+        )
+
+
+if __name__ == "__main__":
+    app.run(main)
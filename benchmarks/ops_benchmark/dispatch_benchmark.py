@@ -0,0 +1,90 @@
+"""Benchmark the dispatch overhead of eager `keras.ops` calls.
+
+This calls a few `keras.ops` functions eagerly on tiny tensors, and reports
+for each of them the number of ops per second, along with the number of calls
+per second of the backend function the op dispatches to. The difference is
+the overhead of `Operation.__call__()` (symbolic check, traceback filtering,
+etc.).
+
+The backend is selected with the `KERAS_BACKEND` environment variable. To run
+the benchmark for the numpy, jax and torch backends, use the commands below
+and change the flags according to your target:
+
+```
+KERAS_BACKEND=numpy python3 -m benchmarks.ops_benchmark.dispatch_benchmark \
+    --num_calls=10000
+KERAS_BACKEND=jax python3 -m benchmarks.ops_benchmark.dispatch_benchmark \
+    --num_calls=10000
+KERAS_BACKEND=torch python3 -m benchmarks.ops_benchmark.dispatch_benchmark \
+    --num_calls=10000
+```
+"""
+
+import time
+
+import numpy as np
+from absl import app
+from absl import flags
+
+import keras
+from keras.src import backend
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_integer("num_calls", 10000, "Number of calls to average over.")
+flags.DEFINE_bool(
+    "traceback_filtering",
+    True,
+    "Whether to run with traceback filtering enabled.",
+)
+
+
+def get_ops(x, y):
+    return {
+        "add(x, y)": (
+            lambda: keras.ops.add(x, y),
+            lambda: backend.numpy.add(x, y),
+        ),
+        "multiply(x, 2.0)": (
+            lambda: keras.ops.multiply(x, 2.0),
+            lambda: backend.numpy.multiply(x, 2.0),
+        ),
+        "sum(x, axis=0)": (
+            lambda: keras.ops.sum(x, axis=0),
+            lambda: backend.numpy.sum(x, axis=0),
+        ),
+        "concatenate([x, y])": (
+            lambda: keras.ops.concatenate([x, y]),
+            lambda: backend.numpy.concatenate([x, y]),
+        ),
+    }
+
+
+def ops_per_second(fn, num_calls):
+    fn()
+    start = time.perf_counter()
+    for _ in range(num_calls):
+        fn()
+    return num_calls / (time.perf_counter() - start)
+
+
+def main(_):
+    if FLAGS.traceback_filtering:
+        keras.config.enable_traceback_filtering()
+    else:
+        keras.config.disable_traceback_filtering()
+    x = keras.ops.convert_to_tensor(np.random.rand(2, 4).astype("float32"))
+    y = keras.ops.convert_to_tensor(np.random.rand(2, 4).astype("float32"))
+    print(f"Backend: {backend.backend()}")
+    for name, (op_fn, backend_fn) in get_ops(x, y).items():
+        op_rate = ops_per_second(op_fn, FLAGS.num_calls)
+        backend_rate = ops_per_second(backend_fn, FLAGS.num_calls)
+        overhead = 1 / op_rate - 1 / backend_rate
+        print(
+            f"{name}: {op_rate:.0f} ops/s, {backend_rate:.0f} backend calls/s, "
+            f"{overhead * 1e6:.1f} us of overhead per op"
+        )
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -0,0 +1,88 @@
+"""Benchmark the deserialization of large functional model configs.
+
+This serializes a functional model made of a chain of `num_layers` small
+layers, and reports the time taken to rebuild it from its config with
+`keras.saving.deserialize_keras_object()`, which is what loading a model
+does before reading its weights. The layers alternate between `Dense`,
+`LayerNormalization` and `Activation` layers, so that several classes have
+to be resolved from the config.
+
+Use `--num_registered_objects` to register dummy custom objects, as large
+projects do, which used to make every nested config more expensive to
+deserialize.
+
+To run the benchmark, use the command below and change the flags according to
+your target:
+
+```
+python3 -m benchmarks.saving_benchmark.deserialization_benchmark \
+    --num_layers=5000 \
+    --num_runs=3 \
+    --num_registered_objects=0
+```
+"""
+
+import json
+import time
+
+from absl import app
+from absl import flags
+
+import keras
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_integer("num_layers", 5000, "Number of layers of the model.")
+flags.DEFINE_integer("num_runs", 3, "Number of deserializations to average.")
+flags.DEFINE_integer(
+    "num_registered_objects", 0, "Number of dummy custom objects to register."
+)
+
+
+def build_model(num_layers):
+    inputs = keras.Input((8,))
+    x = inputs
+    for i in range(num_layers):
+        if i % 3 == 0:
+            x = keras.layers.Dense(8)(x)
+        elif i % 3 == 1:
+            x = keras.layers.LayerNormalization()(x)
+        else:
+            x = keras.layers.Activation("relu")(x)
+    return keras.Model(inputs, x)
+
+
+def register_objects(num_objects):
+    for i in range(num_objects):
+        keras.saving.register_keras_serializable(package="benchmark")(
+            type(f"CustomLayer{i}", (keras.layers.Layer,), {})
+        )
+
+
+def main(_):
+    register_objects(FLAGS.num_registered_objects)
+    model = build_model(FLAGS.num_layers)
+    # Go through JSON as when loading a saved model. The config is parsed
+    # for every run since deserializing it modifies it.
+    config_json = json.dumps(keras.saving.serialize_keras_object(model))
+    del model
+
+    # Deserialize once to warm up the caches.
+    keras.saving.deserialize_keras_object(json.loads(config_json))
+    elapsed = 0.0
+    for _ in range(FLAGS.num_runs):
+        config = json.loads(config_json)
+        start_time = time.time()
+        keras.saving.deserialize_keras_object(config)
+        elapsed += time.time() - start_time
+    elapsed /= FLAGS.num_runs
+    print(
+        f"num layers: {FLAGS.num_layers}, "
+        f"registered objects: {FLAGS.num_registered_objects}, "
+        f"deserialization time: {elapsed:.3f} s, "
+        f"per layer: {elapsed / FLAGS.num_layers * 1e6:.1f} us"
+    )
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -0,0 +1,100 @@
+"""Benchmark the loading of `.keras` archives.
+
+This saves MLPs of increasing sizes and reports, for each archive size, the
+time taken by `keras.saving.load_model()` and the peak memory allocated
+while loading, as traced by `tracemalloc`. The weights are streamed from
+the archive and read ahead of their assignment, so the memory used on top
+of the variables themselves should stay close to the size of the largest
+tensors rather than grow with the size of the archive. Note that the
+variables are included in the traced memory when the backend keeps the
+NumPy arrays they are assigned from, e.g. with JAX on CPU.
+
+Use `--weights_format=raw` to compare with the memory-mapped "raw" weights
+format, which reads the variables from views on the archive file.
+
+To run the benchmark, use the command below and change the flags according to
+your target:
+
+```
+python3 -m benchmarks.saving_benchmark.load_model_benchmark \
+    --sizes_mb=16,64,256 \
+    --num_layers=8 \
+    --num_runs=3 \
+    --weights_format=h5
+```
+"""
+
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+from absl import app
+from absl import flags
+
+import keras
+from keras.src.saving import saving_lib
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_list(
+    "sizes_mb", ["16", "64", "256"], "Approximate sizes of the archives."
+)
+flags.DEFINE_integer("num_layers", 8, "Number of Dense layers of the MLPs.")
+flags.DEFINE_integer("num_runs", 3, "Number of loads to average over.")
+flags.DEFINE_enum(
+    "weights_format", "h5", ["h5", "npz", "raw"], "Format of the weights."
+)
+
+
+def build_model(size_mb, num_layers):
+    # Each Dense layer has `units * units` float32 weights.
+    units = int(np.sqrt(size_mb * 2**20 / 4 / num_layers))
+    model = keras.Sequential(
+        [keras.Input((units,))]
+        + [keras.layers.Dense(units) for _ in range(num_layers)]
+    )
+    return model
+
+
+def benchmark_load(filepath):
+    # Load once to warm up the imports and the file system cache.
+    keras.saving.load_model(filepath)
+    elapsed = 0.0
+    for _ in range(FLAGS.num_runs):
+        start_time = time.time()
+        keras.saving.load_model(filepath)
+        elapsed += time.time() - start_time
+    tracemalloc.start()
+    keras.saving.load_model(filepath)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed / FLAGS.num_runs, peak_memory
+
+
+def main(_):
+    keras.config.disable_interactive_logging()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size_mb in FLAGS.sizes_mb:
+            model = build_model(int(size_mb), FLAGS.num_layers)
+            filepath = os.path.join(temp_dir, f"model_{size_mb}.keras")
+            saving_lib.save_model(
+                model, filepath, weights_format=FLAGS.weights_format
+            )
+            weights_size = sum(w.nbytes for w in model.get_weights()) / 2**20
+            del model
+            archive_size = os.path.getsize(filepath) / 2**20
+            load_time, peak_memory = benchmark_load(filepath)
+            print(
+                f"archive size: {archive_size:.1f} MB, "
+                f"weights size: {weights_size:.1f} MB, "
+                f"load time: {load_time:.3f} s, "
+                f"throughput: {archive_size / load_time:.1f} MB/s, "
+                f"peak traced memory: {peak_memory / 2**20:.1f} MB"
+            )
+            os.remove(filepath)
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -27,10 +27,12 @@ from keras.src.trainers.data_adapters.data_adapter_utils import (
 from keras.src.trainers.data_adapters.data_adapter_utils import (
     unpack_x_y_sample_weight,
 )
+from keras.src.trainers.data_adapters.memmap_dataset import MemmapDataset
 from keras.src.trainers.data_adapters.py_dataset_adapter import PyDataset
 from keras.src.trainers.data_adapters.py_dataset_adapter import (
     PyDataset as Sequence,
 )
+from keras.src.trainers.data_adapters.shape_bucketing import ShapeBucketing
 from keras.src.utils.audio_dataset_utils import audio_dataset_from_directory
 from keras.src.utils.config import Config
 from keras.src.utils.dataset_utils import split_dataset
@@ -8,9 +8,13 @@ from keras.src.distribution.distribution_lib import DataParallel
 from keras.src.distribution.distribution_lib import DeviceMesh
 from keras.src.distribution.distribution_lib import LayoutMap
 from keras.src.distribution.distribution_lib import ModelParallel
+from keras.src.distribution.distribution_lib import PipelineParallel
 from keras.src.distribution.distribution_lib import TensorLayout
 from keras.src.distribution.distribution_lib import distribute_tensor
 from keras.src.distribution.distribution_lib import distribution
 from keras.src.distribution.distribution_lib import initialize
 from keras.src.distribution.distribution_lib import list_devices
 from keras.src.distribution.distribution_lib import set_distribution
+from keras.src.distribution.layout_planner import estimate_layout_costs
+from keras.src.distribution.layout_planner import infer_layout_map
+from keras.src.distribution.pipeline_planner import partition_stages
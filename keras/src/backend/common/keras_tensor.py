@@ -1,3 +1,5 @@
+import itertools
+
 from keras.src import tree
 from keras.src.api_export import keras_export
 from keras.src.utils.naming import auto_name
@@ -343,9 +345,21 @@ class KerasTensor:
         return ops.Round(decimals=decimals).symbolic_call(self)
 
 
+_NON_NESTED_TYPES = (bool, int, float, str, type(None))
+
+
 def any_symbolic_tensors(args=None, kwargs=None):
     args = args or ()
     kwargs = kwargs or {}
+    # Fast path for the common case of non-nested arguments, e.g. tensors and
+    # Python scalars, which avoids the cost of `tree.flatten()`.
+    for x in itertools.chain(args, kwargs.values()):
+        if isinstance(x, KerasTensor):
+            return True
+        if type(x) not in _NON_NESTED_TYPES and tree.is_nested(x):
+            break
+    else:
+        return False
     for x in tree.flatten((args, kwargs)):
         if isinstance(x, KerasTensor):
             return True
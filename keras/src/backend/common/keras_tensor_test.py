@@ -87,6 +87,18 @@ class KerasTensorTest(testing.TestCase):
         y = np.array([1, 2, 3])
         self.assertTrue(keras_tensor.any_symbolic_tensors(args=[x, y]))
         self.assertFalse(keras_tensor.any_symbolic_tensors(args=[y]))
+        self.assertFalse(
+            keras_tensor.any_symbolic_tensors(args=[y, 1.0], kwargs={"a": None})
+        )
+
+        # Nested arguments.
+        self.assertTrue(keras_tensor.any_symbolic_tensors(args=[y, [y, x]]))
+        self.assertTrue(
+            keras_tensor.any_symbolic_tensors(kwargs={"a": 1, "b": {"c": x}})
+        )
+        self.assertFalse(
+            keras_tensor.any_symbolic_tensors(args=[(y, y)], kwargs={"a": [1]})
+        )
 
     def test_is_keras_tensor(self):
         x = keras_tensor.KerasTensor(shape=(3, 4), dtype="float32")
@@ -15,6 +15,9 @@ _IMAGE_DATA_FORMAT = "channels_last"
 # Default backend: TensorFlow.
 _BACKEND = "tensorflow"
 
+# Number of batches prefetched on device by the training loops.
+_DATA_PREFETCH_SIZE = 2
+
 
 @keras_export(["keras.config.floatx", "keras.backend.floatx"])
 def floatx():
@@ -226,6 +229,58 @@ def is_flash_attention_enabled():
     return global_state.get_global_attribute("flash_attention", default=None)
 
 
+@keras_export("keras.config.data_prefetch_size")
+def data_prefetch_size():
+    """Return the number of batches prefetched on device during training.
+
+    Returns:
+        An integer.
+
+    Example:
+
+    >>> keras.config.data_prefetch_size()
+    2
+
+    """
+    return _DATA_PREFETCH_SIZE
+
+
+@keras_export("keras.config.set_data_prefetch_size")
+def set_data_prefetch_size(value):
+    """Set the number of batches prefetched on device during training.
+
+    With the JAX and PyTorch backends, `fit()`, `evaluate()` and `predict()`
+    read the batches of data and transfer them to the devices in a background
+    thread. Up to `value` batches, including the one used by the current
+    step, are read ahead of time. This overlaps the input pipeline and the
+    host to device copies with the computation. Setting the value to `0`
+    reads and transfers every batch on the training thread, right before the
+    step that uses it.
+
+    Args:
+        value: int. Number of batches to prefetch.
+
+    Examples:
+    >>> keras.config.data_prefetch_size()
+    2
+
+    >>> keras.config.set_data_prefetch_size(4)
+    >>> keras.config.data_prefetch_size()
+    4
+
+    >>> # Set it back to the default value.
+    >>> keras.config.set_data_prefetch_size(2)
+
+    """
+    global _DATA_PREFETCH_SIZE
+    if not isinstance(value, int) or value < 0:
+        raise ValueError(
+            "The `data_prefetch_size` must be a non-negative integer. "
+            f"Received: value={value}"
+        )
+    _DATA_PREFETCH_SIZE = value
+
+
 def standardize_data_format(data_format):
     if data_format is None:
         return image_data_format()
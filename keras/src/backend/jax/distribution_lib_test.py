@@ -228,6 +228,61 @@ class JaxDistributionLibTest(testing.TestCase):
             model.compile(loss="mse")
             model.fit(inputs, labels)
 
+    def test_e2e_data_parallel_model_with_sharded_variables(self):
+        distribution = distribution_lib.DataParallel(
+            devices=backend_dlib.list_devices(),
+            shard_optimizer_variables=True,
+        )
+
+        with distribution.scope():
+            inputs = layers.Input(shape=[16])
+            y = layers.Dense(units=16, activation="relu")(inputs)
+            y = layers.Dense(units=3)(y)
+            model = models.Model(inputs=inputs, outputs=y)
+            model.compile(loss="mse", optimizer="adam")
+            model.optimizer.build(model.trainable_variables)
+
+        # Only the optimizer variables are sharded, on their first dimension
+        # which is divisible by the number of devices.
+        num_devices = len(backend_dlib.list_devices())
+        for weight in model.weights:
+            self.assertTrue(weight._value.sharding.is_fully_replicated)
+        for variable in model.optimizer.variables:
+            expected_spec = [None] * len(variable.shape)
+            for i, dim in enumerate(variable.shape):
+                if dim % num_devices == 0:
+                    expected_spec[i] = "batch"
+                    break
+            self.assertEqual(
+                variable._value.sharding.spec,
+                tuple(expected_spec),
+                msg=variable.path,
+            )
+
+        inputs = np.random.normal(size=(32, 16))
+        labels = np.random.normal(size=(32, 3))
+        with distribution.scope():
+            model.fit(inputs, labels, verbose=0)
+        for variable in model.optimizer.variables:
+            # E.g. `PartitionSpec("batch")` is the same sharding as
+            # `PartitionSpec("batch", None)`.
+            self.assertTrue(
+                variable._value.sharding.is_equivalent_to(
+                    variable._layout, variable.ndim
+                ),
+                msg=variable.path,
+            )
+
+        # The model variables can be sharded too.
+        distribution = distribution_lib.DataParallel(
+            devices=backend_dlib.list_devices(),
+            shard_model_variables=True,
+        )
+        with distribution.scope():
+            layer = layers.Dense(units=4)
+            layer.build((16,))
+        self.assertEqual(layer.kernel._value.sharding.spec, ("batch", None))
+
     def test_e2e_model_parallel_model(self):
         shape = (4, 2)
         axis_names = ["batch", "model"]
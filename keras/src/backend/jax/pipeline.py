@@ -0,0 +1,781 @@
+"""Pipeline parallel train, test and predict steps for the JAX backend.
+
+!!!DO NOT USE!!! Currently under development and APIs are not final.
+"""
+
+import functools
+import time
+
+import jax
+from jax import numpy as jnp
+
+from keras.src import backend
+from keras.src import tree
+from keras.src.backend.jax import distribution_lib as jax_distribution_lib
+from keras.src.distribution import pipeline_planner
+from keras.src.models.functional import unpack_singleton
+from keras.src.optimizers.loss_scale_optimizer import LossScaleOptimizer
+from keras.src.trainers.data_adapters import data_adapter_utils
+
+
+class PipelineExecutor:
+    """Runs the steps of a model split into stages placed on separate devices.
+
+    Every stage is compiled on its own devices, and the steps are driven from
+    Python: the computations of the stages are dispatched asynchronously, in
+    the order of the schedule of the `PipelineParallel` distribution, so that
+    the stages work on different microbatches at the same time. The outputs
+    of a stage are copied to the devices of the next stage, and their
+    gradients back to the devices of the stage.
+
+    The steps take and return the same states as the steps of `JAXTrainer`,
+    with the variables of each stage placed on the devices of the stage. The
+    variables of the model are moved there when the executor is created.
+
+    Args:
+        model: The `Sequential` or `Functional` model.
+        distribution: The `PipelineParallel` distribution.
+        jit_compile: Whether to compile the computations of the stages.
+        optimizer: Optional optimizer of the model, needed by `train_step()`.
+    """
+
+    def __init__(self, model, distribution, jit_compile=True, optimizer=None):
+        self.model = model
+        self.distribution = distribution
+        self.jit_compile = jit_compile
+        self.optimizer = optimizer
+        self.stages = pipeline_planner.build_pipeline_stages(
+            model,
+            distribution.stages
+            or pipeline_planner.partition_stages(
+                model, distribution.num_stages
+            ),
+        )
+        self._functional = pipeline_planner.get_functional(model)
+        self._last = len(self.stages) - 1
+        self._meshes = [
+            jax_distribution_lib._to_jax_mesh(
+                distribution.get_stage_device_mesh(stage.index)
+            )
+            for stage in self.stages
+        ]
+        self._batch_dim_name = distribution._batch_dim_name
+        # Whether the gradients of the inputs of the stages are computed.
+        self._differentiable = [
+            [
+                stage.index > 0 and pipeline_planner.is_differentiable(x)
+                for x in stage.inputs
+            ]
+            for stage in self.stages
+        ]
+
+        self._trainable_refs = [
+            stage.trainable_variables for stage in self.stages
+        ]
+        self._non_trainable_refs = [
+            stage.non_trainable_variables for stage in self.stages
+        ]
+        self._trainable_indices = _get_stage_indices(
+            model.trainable_variables, self._trainable_refs
+        )
+        self._non_trainable_indices = _get_stage_indices(
+            model.non_trainable_variables, self._non_trainable_refs
+        )
+        for stage in self.stages:
+            self._place_variables(
+                self._trainable_refs[stage.index]
+                + self._non_trainable_refs[stage.index],
+                stage.index,
+            )
+        self._place_variables(model.metrics_variables, self._last)
+        if optimizer is not None:
+            self._partition_optimizer_variables(optimizer)
+
+        self._split = self._jit(_split_batch, static_argnums=1)
+        self._concatenate = self._jit(_concatenate)
+        self._zeros_like = self._jit(
+            lambda variables: [jnp.zeros_like(v) for v in variables]
+        )
+        self._train_forwards = []
+        self._inference_forwards = []
+        self._backwards = []
+        self._updates = []
+        for stage in self.stages:
+            self._train_forwards.append(
+                self._jit(functools.partial(self._forward, stage, True))
+            )
+            self._inference_forwards.append(
+                self._jit(functools.partial(self._forward, stage, False))
+            )
+            self._backwards.append(
+                self._jit(
+                    functools.partial(self._backward, stage),
+                    donate_argnums=5,
+                )
+            )
+            self._updates.append(
+                self._jit(
+                    functools.partial(self._update, stage),
+                    donate_argnums=(0, 1),
+                )
+            )
+        self._last_stage_train_step = self._jit(
+            self._last_stage_train_step, donate_argnums=6
+        )
+        self._last_stage_test_step = self._jit(self._last_stage_test_step)
+        self._schedules = {}
+
+    def _jit(self, fn, **kwargs):
+        if self.jit_compile:
+            return jax.jit(fn, **kwargs)
+        return fn
+
+    def _partition_optimizer_variables(self, optimizer):
+        if (
+            isinstance(optimizer, LossScaleOptimizer)
+            or optimizer.global_clipnorm
+            or optimizer.use_ema
+            or optimizer.gradient_accumulation_steps
+        ):
+            raise ValueError(
+                "`PipelineParallel` doesn't support optimizers using "
+                "`global_clipnorm`, `use_ema`, `gradient_accumulation_steps` "
+                "or dynamic loss scaling, which need all the variables of the "
+                f"model at once. Received: optimizer={optimizer}"
+            )
+        # The variables of the optimizer created for a model variable are
+        # named after its path, see `add_variable_from_reference()`.
+        prefixes = {}
+        for stage in self.stages:
+            for v in self._trainable_refs[stage.index]:
+                prefixes[v.path.replace("/", "_") + "_"] = stage.index
+        self._optimizer_indices = [[] for _ in self.stages]
+        self._shared_optimizer_indices = []
+        for i, v in enumerate(optimizer.variables):
+            stage = None
+            for position, character in enumerate(v.name):
+                if character == "_" and v.name[: position + 1] in prefixes:
+                    stage = prefixes[v.name[: position + 1]]
+            if stage is not None:
+                self._optimizer_indices[stage].append(i)
+            elif len(v.shape) == 0:
+                # E.g. the iterations and the learning rate.
+                self._shared_optimizer_indices.append(i)
+            else:
+                raise ValueError(
+                    "Could not find the stage of the optimizer variable "
+                    f"'{v.path}'."
+                )
+            if v is optimizer._iterations:
+                self._iterations_index = i
+        self._optimizer_refs = [
+            _gather(optimizer.variables, indices)
+            for indices in self._optimizer_indices
+        ]
+        self._shared_optimizer_refs = _gather(
+            optimizer.variables, self._shared_optimizer_indices
+        )
+        for stage in self.stages:
+            self._place_variables(
+                self._optimizer_refs[stage.index], stage.index
+            )
+
+    def _replicated_sharding(self, stage):
+        return jax.sharding.NamedSharding(
+            self._meshes[stage], jax.sharding.PartitionSpec()
+        )
+
+    def _data_sharding(self, stage, x):
+        mesh = self._meshes[stage]
+        if x.ndim and x.shape[0] % mesh.shape[self._batch_dim_name] == 0:
+            return jax.sharding.NamedSharding(
+                mesh, jax.sharding.PartitionSpec(self._batch_dim_name)
+            )
+        return self._replicated_sharding(stage)
+
+    def _place_variables(self, variables, stage):
+        sharding = self._replicated_sharding(stage)
+        for v in variables:
+            v._layout = sharding
+            if v._value is not None:
+                v._direct_assign(v._value)
+
+    def _to_stage(self, values, stage):
+        return tree.map_structure(
+            lambda x: (
+                None
+                if x is None
+                else jax.device_put(x, self._data_sharding(stage, x))
+            ),
+            values,
+        )
+
+    def _replicate(self, values, stage):
+        return jax.device_put(values, self._replicated_sharding(stage))
+
+    def _run(self, stage, kind, fn, *args):
+        if not self.distribution._record_stage_timings:
+            return fn(*args)
+        start = time.perf_counter()
+        outputs = jax.block_until_ready(fn(*args))
+        self.distribution._stage_timings[stage][kind] += (
+            time.perf_counter() - start
+        )
+        return outputs
+
+    def _get_schedule(self, num_microbatches):
+        if num_microbatches not in self._schedules:
+            self._schedules[num_microbatches] = (
+                pipeline_planner.pipeline_schedule(
+                    self.distribution.schedule,
+                    len(self.stages),
+                    num_microbatches,
+                )
+            )
+        return self._schedules[num_microbatches]
+
+    def _split_microbatches(self, x, y=None, sample_weight=None):
+        """Splits a batch into the inputs of the first and last stages."""
+        batch_size = tree.flatten(x)[0].shape[0]
+        num_microbatches = min(self.distribution.num_microbatches, batch_size)
+        size, remainder = divmod(batch_size, num_microbatches)
+        sizes = tuple(
+            size + 1 if i < remainder else size for i in range(num_microbatches)
+        )
+        first_inputs = self._run(0, "transfer", self._split, x, sizes)
+        last_data = self._run(
+            self._last,
+            "transfer",
+            lambda data: self._split(self._to_stage(data, self._last), sizes),
+            (x, y, sample_weight),
+        )
+        return sizes, first_inputs, last_data
+
+    def train_step(self, state, data):
+        (
+            trainable_variables,
+            non_trainable_variables,
+            optimizer_variables,
+            metrics_variables,
+        ) = (list(variables) for variables in state)
+        x, y, sample_weight = data_adapter_utils.unpack_x_y_sample_weight(data)
+        sizes, first_inputs, last_data = self._split_microbatches(
+            x, y, sample_weight
+        )
+        trainable = [
+            _gather(trainable_variables, indices)
+            for indices in self._trainable_indices
+        ]
+        non_trainable = [
+            _gather(non_trainable_variables, indices)
+            for indices in self._non_trainable_indices
+        ]
+        grads = [self._zeros_like(variables) for variables in trainable]
+        # The gradients of the losses of the microbatches are weighted so that
+        # they add up to the gradient of the loss of the batch.
+        loss_scale = (self.optimizer.loss_scale_factor or 1.0) / sum(sizes)
+
+        inputs = {}
+        stashed = {}
+        output_grads = {}
+        logs = None
+        for kind, s, m in self._get_schedule(len(sizes)):
+            loss_grad = loss_scale * sizes[m]
+            if kind == "forward" and s == self._last:
+                # The backward pass directly follows the forward pass.
+                (
+                    non_trainable[s],
+                    metrics_variables,
+                    logs,
+                    grads[s],
+                    input_grads,
+                ) = self._run(
+                    s,
+                    "backward",
+                    self._last_stage_train_step,
+                    trainable[s],
+                    non_trainable[s],
+                    metrics_variables,
+                    first_inputs[m] if s == 0 else inputs.pop((s, m)),
+                    last_data[m],
+                    loss_grad,
+                    grads[s],
+                )
+            elif kind == "forward":
+                stage_inputs = first_inputs[m] if s == 0 else inputs.pop((s, m))
+                # Only the inputs are kept, the activations are recomputed.
+                stashed[(s, m)] = (non_trainable[s], stage_inputs)
+                outputs, non_trainable[s] = self._run(
+                    s,
+                    "forward",
+                    self._train_forwards[s],
+                    trainable[s],
+                    non_trainable[s],
+                    stage_inputs,
+                )
+                inputs[(s + 1, m)] = self._run(
+                    s + 1, "transfer", self._to_stage, outputs, s + 1
+                )
+                continue
+            else:
+                stage_non_trainable, stage_inputs = stashed.pop((s, m))
+                grads[s], input_grads = self._run(
+                    s,
+                    "backward",
+                    self._backwards[s],
+                    trainable[s],
+                    stage_non_trainable,
+                    stage_inputs,
+                    output_grads.pop((s, m)),
+                    loss_grad,
+                    grads[s],
+                )
+            if s > 0:
+                output_grads[(s - 1, m)] = self._run(
+                    s - 1, "transfer", self._to_stage, input_grads, s - 1
+                )
+
+        shared_optimizer_variables = _gather(
+            optimizer_variables, self._shared_optimizer_indices
+        )
+        for stage in self.stages:
+            s = stage.index
+            if not trainable[s]:
+                continue
+            stage_shared_variables = self._run(
+                s, "transfer", self._replicate, shared_optimizer_variables, s
+            )
+            trainable[s], stage_optimizer_variables = self._run(
+                s,
+                "update",
+                self._updates[s],
+                trainable[s],
+                _gather(optimizer_variables, self._optimizer_indices[s]),
+                stage_shared_variables,
+                grads[s],
+            )
+            _scatter(
+                optimizer_variables,
+                self._optimizer_indices[s],
+                stage_optimizer_variables,
+            )
+        # The stages don't return the shared variables, which are only
+        # updated by incrementing the iterations.
+        optimizer_variables[self._iterations_index] = (
+            optimizer_variables[self._iterations_index] + 1
+        )
+
+        for stage in self.stages:
+            s = stage.index
+            _scatter(
+                trainable_variables, self._trainable_indices[s], trainable[s]
+            )
+            _scatter(
+                non_trainable_variables,
+                self._non_trainable_indices[s],
+                non_trainable[s],
+            )
+        state = (
+            trainable_variables,
+            non_trainable_variables,
+            optimizer_variables,
+            metrics_variables,
+        )
+        return logs, state
+
+    def test_step(self, state, data):
+        (
+            trainable_variables,
+            non_trainable_variables,
+            metrics_variables,
+        ) = (list(variables) for variables in state)
+        x, y, sample_weight = data_adapter_utils.unpack_x_y_sample_weight(data)
+        sizes, first_inputs, last_data = self._split_microbatches(
+            x, y, sample_weight
+        )
+        trainable = [
+            _gather(trainable_variables, indices)
+            for indices in self._trainable_indices
+        ]
+        non_trainable = [
+            _gather(non_trainable_variables, indices)
+            for indices in self._non_trainable_indices
+        ]
+
+        logs = None
+        for m in range(len(sizes)):
+            stage_inputs = first_inputs[m]
+            for stage in self.stages:
+                s = stage.index
+                if s == self._last:
+                    non_trainable[s], metrics_variables, logs = self._run(
+                        s,
+                        "forward",
+                        self._last_stage_test_step,
+                        trainable[s],
+                        non_trainable[s],
+                        metrics_variables,
+                        stage_inputs,
+                        last_data[m],
+                    )
+                    continue
+                outputs, non_trainable[s] = self._run(
+                    s,
+                    "forward",
+                    self._inference_forwards[s],
+                    trainable[s],
+                    non_trainable[s],
+                    stage_inputs,
+                )
+                stage_inputs = self._run(
+                    s + 1, "transfer", self._to_stage, outputs, s + 1
+                )
+
+        for stage in self.stages:
+            _scatter(
+                non_trainable_variables,
+                self._non_trainable_indices[stage.index],
+                non_trainable[stage.index],
+            )
+        state = (
+            trainable_variables,
+            non_trainable_variables,
+            metrics_variables,
+        )
+        return logs, state
+
+    def predict_step(self, state, data):
+        trainable_variables, non_trainable_variables = (
+            list(variables) for variables in state
+        )
+        x, _, _ = data_adapter_utils.unpack_x_y_sample_weight(data)
+        sizes, first_inputs, _ = self._split_microbatches(x)
+        trainable = [
+            _gather(trainable_variables, indices)
+            for indices in self._trainable_indices
+        ]
+        non_trainable = [
+            _gather(non_trainable_variables, indices)
+            for indices in self._non_trainable_indices
+        ]
+
+        microbatch_outputs = []
+        for m in range(len(sizes)):
+            outputs = first_inputs[m]
+            for stage in self.stages:
+                s = stage.index
+                if s > 0:
+                    outputs = self._run(
+                        s, "transfer", self._to_stage, outputs, s
+                    )
+                outputs, non_trainable[s] = self._run(
+                    s,
+                    "forward",
+                    self._inference_forwards[s],
+                    trainable[s],
+                    non_trainable[s],
+                    outputs,
+                )
+            microbatch_outputs.append(outputs)
+        outputs = microbatch_outputs[0]
+        if len(microbatch_outputs) > 1:
+            outputs = self._run(
+                self._last,
+                "forward",
+                self._concatenate,
+                microbatch_outputs,
+            )
+
+        for stage in self.stages:
+            _scatter(
+                non_trainable_variables,
+                self._non_trainable_indices[stage.index],
+                non_trainable[stage.index],
+            )
+        return self._pack_outputs(outputs), non_trainable_variables
+
+    def _pack_outputs(self, outputs):
+        outputs_struct = self._functional._outputs_struct
+        if isinstance(outputs_struct, backend.KerasTensor):
+            return outputs[0]
+        return unpack_singleton(tree.pack_sequence_as(outputs_struct, outputs))
+
+    def _differentiable_inputs(self, stage, inputs):
+        if stage.index == 0:
+            # The inputs of the model.
+            return []
+        return [
+            x
+            for x, differentiable in zip(
+                inputs, self._differentiable[stage.index]
+            )
+            if differentiable
+        ]
+
+    def _merge_inputs(self, stage, inputs, differentiable_inputs):
+        if stage.index == 0:
+            return inputs
+        differentiable_inputs = iter(differentiable_inputs)
+        return [
+            next(differentiable_inputs) if differentiable else x
+            for x, differentiable in zip(
+                inputs, self._differentiable[stage.index]
+            )
+        ]
+
+    def _call_stage(self, stage, trainable, non_trainable, inputs, training):
+        """Stateless call of a stage.
+
+        Returns the flat list of outputs of the stage, the losses added by
+        its layers and the new values of its non-trainable variables.
+        """
+        mapping = list(zip(self._trainable_refs[stage.index], trainable))
+        mapping.extend(
+            zip(self._non_trainable_refs[stage.index], non_trainable)
+        )
+        with backend.StatelessScope(
+            state_mapping=mapping, collect_losses=True
+        ) as scope:
+            if stage.index == 0:
+                inputs = self._functional._standardize_inputs(inputs)
+            outputs = stage.call(inputs, training=training)
+            losses = [loss for layer in stage.layers for loss in layer.losses]
+        non_trainable = [
+            scope.get_current_value(v)
+            for v in self._non_trainable_refs[stage.index]
+        ]
+        return outputs, losses, non_trainable
+
+    def _forward(self, stage, training, trainable, non_trainable, inputs):
+        outputs, _, non_trainable = self._call_stage(
+            stage, trainable, non_trainable, inputs, training
+        )
+        return outputs, non_trainable
+
+    def _backward(
+        self,
+        stage,
+        trainable,
+        non_trainable,
+        inputs,
+        output_grads,
+        loss_grad,
+        grads,
+    ):
+        differentiable_outputs = self._differentiable[stage.index + 1]
+
+        def objective(trainable, differentiable_inputs):
+            outputs, losses, _ = self._call_stage(
+                stage,
+                trainable,
+                non_trainable,
+                self._merge_inputs(stage, inputs, differentiable_inputs),
+                training=True,
+            )
+            outputs = [
+                x
+                for x, differentiable in zip(outputs, differentiable_outputs)
+                if differentiable
+            ]
+            return outputs, _sum_losses(losses)
+
+        (_, loss), pullback = jax.vjp(
+            objective, trainable, self._differentiable_inputs(stage, inputs)
+        )
+        trainable_grads, input_grads = pullback(
+            (output_grads, jnp.asarray(loss_grad, dtype=loss.dtype))
+        )
+        grads = [g + g_m for g, g_m in zip(grads, trainable_grads)]
+        return grads, input_grads
+
+    def _compute_loss(
+        self,
+        trainable,
+        non_trainable,
+        metrics_variables,
+        inputs,
+        data,
+        training,
+    ):
+        """Stateless computation of the loss of the model in the last stage.
+
+        Returns the loss, and a tuple of the outputs of the model and of the
+        new values of the non-trainable and metrics variables.
+        """
+        stage = self.stages[-1]
+        x, y, sample_weight = data
+        outputs, losses, non_trainable = self._call_stage(
+            stage, trainable, non_trainable, inputs, training
+        )
+        y_pred = self._pack_outputs(outputs)
+
+        mapping = list(zip(self._trainable_refs[-1], trainable))
+        mapping.extend(zip(self._non_trainable_refs[-1], non_trainable))
+        mapping.extend(zip(self.model.metrics_variables, metrics_variables))
+        # The losses of the layers of the other stages are added to the
+        # objectives of their stages.
+        self.model._losses_override.clear()
+        self.model._losses_override = losses or [
+            jnp.zeros((), dtype=backend.floatx())
+        ]
+        with backend.StatelessScope(state_mapping=mapping) as scope:
+            loss = self.model._compute_loss(
+                x, y, y_pred, sample_weight=sample_weight, training=training
+            )
+        self.model._losses_override.clear()
+
+        non_trainable = [
+            scope.get_current_value(v) for v in self._non_trainable_refs[-1]
+        ]
+        metrics_variables = [
+            scope.get_current_value(v) for v in self.model.metrics_variables
+        ]
+        return loss, (y_pred, non_trainable, metrics_variables)
+
+    def _update_metrics(self, metrics_variables, data, y_pred, loss):
+        x, y, sample_weight = data
+        with backend.StatelessScope(
+            state_mapping=list(
+                zip(self.model.metrics_variables, metrics_variables)
+            )
+        ) as scope:
+            self.model._loss_tracker.update_state(
+                loss, sample_weight=tree.flatten(x)[0].shape[0]
+            )
+            logs = self.model.compute_metrics(x, y, y_pred, sample_weight)
+        metrics_variables = [
+            scope.get_current_value(v) for v in self.model.metrics_variables
+        ]
+        return logs, metrics_variables
+
+    def _last_stage_train_step(
+        self,
+        trainable,
+        non_trainable,
+        metrics_variables,
+        inputs,
+        data,
+        loss_grad,
+        grads,
+    ):
+        stage = self.stages[-1]
+
+        def objective(trainable, differentiable_inputs):
+            return self._compute_loss(
+                trainable,
+                non_trainable,
+                metrics_variables,
+                self._merge_inputs(stage, inputs, differentiable_inputs),
+                data,
+                training=True,
+            )
+
+        loss, pullback, aux = jax.vjp(
+            objective,
+            trainable,
+            self._differentiable_inputs(stage, inputs),
+            has_aux=True,
+        )
+        y_pred, new_non_trainable, new_metrics_variables = aux
+        trainable_grads, input_grads = pullback(
+            jnp.asarray(loss_grad, dtype=loss.dtype)
+        )
+        grads = [g + g_m for g, g_m in zip(grads, trainable_grads)]
+        logs, new_metrics_variables = self._update_metrics(
+            new_metrics_variables, data, y_pred, loss
+        )
+        return (
+            new_non_trainable,
+            new_metrics_variables,
+            logs,
+            grads,
+            input_grads,
+        )
+
+    def _last_stage_test_step(
+        self, trainable, non_trainable, metrics_variables, inputs, data
+    ):
+        loss, aux = self._compute_loss(
+            trainable,
+            non_trainable,
+            metrics_variables,
+            inputs,
+            data,
+            training=False,
+        )
+        y_pred, non_trainable, metrics_variables = aux
+        logs, metrics_variables = self._update_metrics(
+            metrics_variables, data, y_pred, loss
+        )
+        return non_trainable, metrics_variables, logs
+
+    def _update(
+        self, stage, trainable, optimizer_variables, shared_variables, grads
+    ):
+        trainable_refs = self._trainable_refs[stage.index]
+        optimizer_refs = self._optimizer_refs[stage.index]
+        mapping = list(zip(trainable_refs, trainable))
+        mapping.extend(zip(optimizer_refs, optimizer_variables))
+        mapping.extend(zip(self._shared_optimizer_refs, shared_variables))
+        with backend.StatelessScope(state_mapping=mapping) as scope:
+            self.optimizer.apply(grads, trainable_refs)
+        trainable = [scope.get_current_value(v) for v in trainable_refs]
+        optimizer_variables = [
+            scope.get_current_value(v) for v in optimizer_refs
+        ]
+        return trainable, optimizer_variables
+
+
+def _get_stage_indices(variables, stage_variables):
+    """Returns the indices in `variables` of the variables of each stage."""
+    indices = {id(v): i for i, v in enumerate(variables)}
+    stage_indices = []
+    for variables_of_stage in stage_variables:
+        stage_indices.append([])
+        for v in variables_of_stage:
+            if id(v) not in indices:
+                raise ValueError(
+                    f"Variable '{v.path}' is used by several stages, or "
+                    "isn't a variable of the model. Variables can't be shared "
+                    "between stages."
+                )
+            stage_indices[-1].append(indices.pop(id(v)))
+    if indices:
+        paths = [variables[i].path for i in sorted(indices.values())]
+        raise ValueError(
+            f"Variables {paths} don't belong to the layers of any stage."
+        )
+    return stage_indices
+
+
+def _gather(values, indices):
+    return [values[i] for i in indices]
+
+
+def _scatter(values, indices, new_values):
+    for i, value in zip(indices, new_values):
+        values[i] = value
+
+
+def _sum_losses(losses):
+    total = jnp.zeros((), dtype=backend.floatx())
+    for loss in losses:
+        total = total + jnp.sum(jnp.asarray(loss, dtype=backend.floatx()))
+    return total
+
+
+def _split_batch(data, sizes):
+    microbatches = []
+    start = 0
+    for size in sizes:
+        microbatches.append(
+            tree.map_structure(
+                lambda x: None if x is None else x[start : start + size], data
+            )
+        )
+        start += size
+    return microbatches
+
+
+def _concatenate(microbatch_outputs):
+    return [jnp.concatenate(outputs) for outputs in zip(*microbatch_outputs)]
@@ -1,6 +1,3 @@
-import collections
-import itertools
-
 import jax
 import numpy as np
 
@@ -274,58 +271,108 @@ class JAXTrainer(base_trainer.Trainer):
 
         return iterator_step
 
+    def _get_pipeline_executor(self, kind):
+        """Returns the pipeline executor of the current distribution, if any.
+
+        With `PipelineParallel`, the steps are run stage by stage by a
+        `PipelineExecutor` instead of the steps of the model.
+        """
+        distribution = distribution_lib.distribution()
+        if not isinstance(distribution, distribution_lib.PipelineParallel):
+            return None
+        step_name = f"{kind}_step"
+        if getattr(type(self), step_name) is not getattr(JAXTrainer, step_name):
+            raise ValueError(
+                f"`PipelineParallel` doesn't support models overriding "
+                f"`{step_name}()`. Received: model={self}"
+            )
+        # Avoid circular imports.
+        from keras.src.backend.jax import pipeline
+
+        return pipeline.PipelineExecutor(
+            self,
+            distribution,
+            jit_compile=not self.run_eagerly and self.jit_compile,
+            optimizer=self.optimizer if kind == "train" else None,
+        )
+
     def make_train_function(self, force=False):
-        if self.train_function is not None and not force:
-            return
-        if not self.run_eagerly and self.jit_compile:
-            # Note that we mark the state to be donated to jax,
-            # so that jax will reuse the memory buffer for outputs.
-            # This will reduce the memory usage of the training function by
-            # half.
-            train_step = jax.jit(self.train_step, donate_argnums=0)
-        else:
-            train_step = self.train_step
+        def make_function():
+            pipeline = self._get_pipeline_executor("train")
+            if pipeline is not None:
+                return self._make_function(pipeline.train_step)
+            if not self.run_eagerly and self.jit_compile:
+                # Note that we mark the state to be donated to jax,
+                # so that jax will reuse the memory buffer for outputs.
+                # This will reduce the memory usage of the training function by
+                # half.
+                train_step = jax.jit(
+                    self._count_traces("train", self.train_step),
+                    donate_argnums=0,
+                )
+            else:
+                train_step = self.train_step
 
-        step_function = self._make_function(train_step)
+            return self._make_function(train_step)
 
-        self.train_function = step_function
+        self.train_function = self._get_step_function(
+            "train", make_function, force=force
+        )
 
     def make_test_function(self, force=False):
-        if self.test_function is not None and not force:
-            return
-        if not self.run_eagerly and self.jit_compile:
-            # Note that we mark the state to be donated to jax,
-            # so that jax will reuse the memory buffer for outputs.
-            # This will reduce the memory usage of the training function by
-            # half.
-            test_step = jax.jit(self.test_step, donate_argnums=0)
-        else:
-            test_step = self.test_step
+        def make_function():
+            pipeline = self._get_pipeline_executor("test")
+            if pipeline is not None:
+                return self._make_function(pipeline.test_step)
+            if not self.run_eagerly and self.jit_compile:
+                # Note that we mark the state to be donated to jax,
+                # so that jax will reuse the memory buffer for outputs.
+                # This will reduce the memory usage of the training function by
+                # half.
+                test_step = jax.jit(
+                    self._count_traces("test", self.test_step),
+                    donate_argnums=0,
+                )
+            else:
+                test_step = self.test_step
 
-        step_function = self._make_function(test_step)
+            return self._make_function(test_step)
 
-        self.test_function = step_function
+        self.test_function = self._get_step_function(
+            "test", make_function, force=force
+        )
 
     def make_predict_function(self, force=False):
-        if self.predict_function is not None and not force:
-            return self.predict_function
+        def make_function():
+            pipeline = self._get_pipeline_executor("predict")
+            if pipeline is None:
+                step = self.predict_step
+            else:
+                step = pipeline.predict_step
 
-        def predict_step(state, data):
-            outputs, non_trainable_variables = self.predict_step(state, data)
-            return outputs, (state[0], non_trainable_variables)
+            def predict_step(state, data):
+                outputs, non_trainable_variables = step(state, data)
+                return outputs, (state[0], non_trainable_variables)
 
-        if not self.run_eagerly and self.jit_compile:
-            predict_step = jax.jit(predict_step)
+            if pipeline is None and not self.run_eagerly and self.jit_compile:
+                predict_step = jax.jit(
+                    self._count_traces("predict", predict_step)
+                )
 
-        _step_function = self._make_function(
-            predict_step, concatenate_outputs=True
-        )
+            _step_function = self._make_function(
+                predict_step, concatenate_outputs=True
+            )
+
+            def step_function(state, iterator):
+                outputs, state = _step_function(state, iterator)
+                return outputs, state[1]
 
-        def step_function(state, iterator):
-            outputs, state = _step_function(state, iterator)
-            return outputs, state[1]
+            return step_function
 
-        self.predict_function = step_function
+        self.predict_function = self._get_step_function(
+            "predict", make_function, force=force
+        )
+        return self.predict_function
 
     @traceback_utils.filter_traceback
     def fit(
@@ -1008,46 +1055,33 @@ class JAXEpochIterator(EpochIterator):
     def _get_iterator(self):
         distribution = distribution_lib.distribution()
         if distribution is not None:
-            return self._get_distributed_iterator(distribution)
-
-        return self._prefetch_numpy_iterator(
-            self.data_adapter.get_jax_iterator()
-        )
+            iterator = self._get_distributed_iterator(distribution)
+            # The distribution is a thread local setting.
+            scope = distribution.scope
+        else:
+            iterator = map(
+                _distribute_data, self.data_adapter.get_jax_iterator()
+            )
+            scope = None
+        # Shard and prefetch batches on device in a background thread.
+        return self._timed_iterator(self._prefetch_iterator(iterator, scope))
 
     def _get_distributed_iterator(self, distribution):
         """Lazily compute layouts to reduce host to device transfer latency."""
-        layouts = None
-        for data in self.data_adapter.get_jax_iterator():
-            if layouts is None:
-                layouts = tree.map_structure(
-                    lambda d: jax_distribution_lib._to_jax_layout(
-                        distribution.get_data_layout(d.shape)
-                    ),
-                    data,
-                )
-            yield _distribute_data(data, layouts)
-
-    def _prefetch_numpy_iterator(self, numpy_iterator):
-        """Shard and prefetch batches on device.
-
-        Most of the implementation has been borrowed from
-        `flax.jax_utils.prefetch_to_device`
+        # Not a generator method, as the prefetching thread must not hold a
+        # reference to `self`.
+        numpy_iterator = self.data_adapter.get_jax_iterator()
+
+        def distributed_iterator():
+            layouts = None
+            for data in numpy_iterator:
+                if layouts is None:
+                    layouts = tree.map_structure(
+                        lambda d: jax_distribution_lib._to_jax_layout(
+                            distribution.get_data_layout(d.shape)
+                        ),
+                        data,
+                    )
+                yield _distribute_data(data, layouts)
 
-        This utility takes an iterator and returns a new iterator which fills an
-        on device prefetch buffer. Eager prefetching can improve the performance
-        of training loops significantly by overlapping compute and data
-        transfer.
-        """
-        queue = collections.deque()
-
-        # If you're training on GPUs, 2 is generally the best choice because
-        # this guarantees that you can overlap a training step on GPU with a
-        # data prefetch step on CPU.
-        def enqueue(n=2):
-            for data in itertools.islice(numpy_iterator, n):
-                queue.append(_distribute_data(data))
-
-        enqueue(n=2)  # TODO: should we make `n` configurable?
-        while queue:
-            yield queue.popleft()
-            enqueue(1)
+        return distributed_iterator()
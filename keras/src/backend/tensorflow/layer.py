@@ -61,6 +61,7 @@ class TFLayer(KerasAutoTrackable):
             self.train_function = train_function
             self.test_function = test_function
             self.predict_function = predict_function
+            children.pop("_step_functions", None)
 
             for tracked_attr in self._tracked:
                 tracked_item = getattr(self, tracked_attr)
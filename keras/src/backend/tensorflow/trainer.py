@@ -227,23 +227,38 @@ class TensorFlowTrainer(base_trainer.Trainer):
         return function
 
     def make_train_function(self, force=False):
-        if self.train_function is not None and not force:
-            return self.train_function
-        self.train_function = self._make_function(self.train_step)
+        self.train_function = self._get_step_function(
+            "train",
+            lambda: self._make_function(self._step_function("train")),
+            force=force,
+        )
 
     def make_test_function(self, force=False):
-        if self.test_function is not None and not force:
-            return self.test_function
-        self.test_function = self._make_function(self.test_step)
+        self.test_function = self._get_step_function(
+            "test",
+            lambda: self._make_function(self._step_function("test")),
+            force=force,
+        )
+
+    def _step_function(self, kind):
+        step_function = getattr(self, f"{kind}_step")
+        if not self.run_eagerly:
+            step_function = self._count_traces(kind, step_function)
+        return step_function
 
     def make_predict_function(self, force=False):
-        if self.predict_function is not None and not force:
-            return self.predict_function
+        self.predict_function = self._get_step_function(
+            "predict", self._make_predict_function, force=force
+        )
+        return self.predict_function
+
+    def _make_predict_function(self):
+        predict_step = self._step_function("predict")
 
         @tf.autograph.experimental.do_not_convert
         def one_step_on_data(data):
             """Runs a predict test step on a batch of data."""
-            return self.predict_step(data)
+            return predict_step(data)
 
         if not self.run_eagerly and self.jit_compile:
             one_step_on_data = tf.function(
@@ -283,7 +298,7 @@ class TensorFlowTrainer(base_trainer.Trainer):
                 predict_function, reduce_retracing=True
             )
 
-        self.predict_function = predict_function
+        return predict_function
 
     @traceback_utils.filter_traceback
     def fit(
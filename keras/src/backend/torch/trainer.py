@@ -1,3 +1,4 @@
+import functools
 import warnings
 
 import numpy as np
@@ -8,6 +9,8 @@ from keras.src import backend
 from keras.src import callbacks as callbacks_module
 from keras.src import optimizers as optimizers_module
 from keras.src import tree
+from keras.src.backend.torch.core import device_scope
+from keras.src.backend.torch.core import get_device
 from keras.src.trainers import trainer as base_trainer
 from keras.src.trainers.data_adapters import array_slicing
 from keras.src.trainers.data_adapters import data_adapter_utils
@@ -101,67 +104,73 @@ class TorchTrainer(base_trainer.Trainer):
             y_pred = self(x)
         return y_pred
 
-    def make_train_function(self, force=False):
-        if self.train_function is not None and not force:
-            return self.train_function
+    def _make_function(self, step_function, concatenate_outputs=False):
+        if self._should_torch_compile():
+            step_function = torch.compile(step_function)
 
         if self.steps_per_execution > 1:
-            raise ValueError(
-                "`steps_per_execution` must be 1 with the PyTorch backend. "
-                f"Received: steps_per_execution={self.steps_per_execution}"
-            )
+            # Runs the steps of one execution back to back, the callbacks
+            # and the logs are only handled once per execution.
+            if concatenate_outputs:
+
+                def multi_step_on_data(data):
+                    outputs = step_function(data[0])
+                    for single_step_data in data[1:]:
+                        step_outputs = step_function(single_step_data)
+                        outputs = tree.map_structure(
+                            lambda t1, t2: torch.cat([t1, t2]),
+                            outputs,
+                            step_outputs,
+                        )
+                    return outputs
+
+            else:
+
+                def multi_step_on_data(data):
+                    for single_step_data in data:
+                        outputs = step_function(single_step_data)
+                    return outputs
+
+            return multi_step_on_data
+
+        def one_step_on_data(data):
+            return step_function(data[0])
 
+        return one_step_on_data
+
+    def make_train_function(self, force=False):
         def one_step_on_data(data):
             """Runs a single training step on a batch of data."""
-            data = data[0]
             return self.train_step(data)
 
-        if self._should_torch_compile():
-            self.train_function = torch.compile(one_step_on_data)
-        else:
-            self.train_function = one_step_on_data
+        self.train_function = self._get_step_function(
+            "train", lambda: self._make_function(one_step_on_data), force=force
+        )
 
     def make_test_function(self, force=False):
-        if self.test_function is not None and not force:
-            return self.test_function
-
-        if self.steps_per_execution > 1:
-            raise ValueError(
-                "`steps_per_execution` must be 1 with the PyTorch backend. "
-                f"Received: steps_per_execution={self.steps_per_execution}"
-            )
-
         def one_step_on_data(data):
             """Runs a single test step on a batch of data."""
-            data = data[0]
             with torch.no_grad():
                 return self.test_step(data)
 
-        if self._should_torch_compile():
-            self.test_function = torch.compile(one_step_on_data)
-        else:
-            self.test_function = one_step_on_data
+        self.test_function = self._get_step_function(
+            "test", lambda: self._make_function(one_step_on_data), force=force
+        )
 
     def make_predict_function(self, force=False):
-        if self.predict_function is not None and not force:
-            return self.predict_function
-
-        if self.steps_per_execution > 1:
-            raise ValueError(
-                "`steps_per_execution` must be 1 with the PyTorch backend. "
-                f"Received: steps_per_execution={self.steps_per_execution}"
-            )
-
         def one_step_on_data(data):
             """Runs a predict test step on a batch of data."""
-            data = data[0]
             with torch.no_grad():
                 return self.predict_step(data)
 
-        if self._should_torch_compile():
-            self.predict_function = torch.compile(one_step_on_data)
-        else:
-            self.predict_function = one_step_on_data
+        self.predict_function = self._get_step_function(
+            "predict",
+            lambda: self._make_function(
+                one_step_on_data, concatenate_outputs=True
+            ),
+            force=force,
+        )
+        return self.predict_function
 
     @traceback_utils.filter_traceback
     def fit(
@@ -504,5 +513,43 @@ class TorchTrainer(base_trainer.Trainer):
 
 
 class TorchEpochIterator(EpochIterator):
+    def __init__(self, *args, pin_memory=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if pin_memory is None:
+            pin_memory = torch.cuda.is_available()
+        self.pin_memory = pin_memory
+
     def _get_iterator(self):
-        return self.data_adapter.get_torch_dataloader()
+        # The device is a thread local setting.
+        device = get_device()
+        iterator = map(
+            functools.partial(
+                _stage_batch, device=device, pin_memory=self.pin_memory
+            ),
+            self.data_adapter.get_torch_dataloader(),
+        )
+        # Convert and stage batches on device in a background thread.
+        return self._timed_iterator(
+            self._prefetch_iterator(
+                iterator, scope=functools.partial(device_scope, device)
+            )
+        )
+
+
+def _stage_batch(batch, device, pin_memory=False):
+    """Copies the CPU tensors of `batch` to `device`.
+
+    With `pin_memory=True`, the tensors are first copied to page-locked
+    memory, from which the copies to the device are asynchronous.
+    """
+    if torch.device(device).type == "cpu":
+        return batch
+
+    def stage(x):
+        if not isinstance(x, torch.Tensor) or x.device.type != "cpu":
+            return x
+        if pin_memory:
+            return x.pin_memory().to(device, non_blocking=True)
+        return x.to(device)
+
+    return tree.map_structure(stage, batch)
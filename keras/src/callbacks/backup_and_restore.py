@@ -1,9 +1,16 @@
+import hashlib
 import json
 
+import numpy as np
+
 from keras.src.api_export import keras_export
 from keras.src.callbacks.callback import Callback
+from keras.src.saving import saving_lib
 from keras.src.utils import file_utils
 
+# Size in bytes of the chunks of the variables compared by delta checkpoints.
+_DELTA_CHUNK_SIZE = 2**16
+
 
 @keras_export("keras.callbacks.BackupAndRestore")
 class BackupAndRestore(Callback):
@@ -74,6 +81,19 @@ class BackupAndRestore(Callback):
           If `delete_checkpoint=True`, the checkpoint will be deleted after
           training is finished. Use `False` if you'd like to keep the checkpoint
           for future usage. Defaults to `True`.
+        max_delta_chain: Integer. When positive, backups after a full backup
+          of the weights only write the chunks of the variables that changed
+          since the previous backup, which saves I/O when few values change
+          between backups, e.g. for large embedding tables. The variables
+          are compared by hashing chunks of their bytes. At most
+          `max_delta_chain` such delta backups are chained after a full
+          backup: the next backup is a full one, which compacts the chain.
+          On restore, the deltas are replayed on top of the full backup.
+          The full backups alternate between two files, so that the previous
+          one and its deltas stay valid until the new one is complete.
+          The first backup of every `fit()` call is a full one. Not
+          supported with `double_checkpoint=True`. Defaults to `0`, which
+          always writes full backups.
     """
 
     def __init__(
@@ -82,11 +102,16 @@ class BackupAndRestore(Callback):
         save_freq="epoch",
         double_checkpoint=False,
         delete_checkpoint=True,
+        max_delta_chain=0,
     ):
         super().__init__()
         self.save_freq = save_freq
         self.double_checkpoint = double_checkpoint
         self.delete_checkpoint = delete_checkpoint
+        self.max_delta_chain = max_delta_chain
+        self._chunk_hashes = None
+        self._deltas = []
+        self._full_backup = None
         self._batches_seen_since_last_saving = 0
         self._last_batch_seen = 0
         self._current_epoch = 0
@@ -95,6 +120,8 @@ class BackupAndRestore(Callback):
             raise ValueError("Empty `backup_dir` argument passed")
         self.backup_dir = backup_dir
         self._weights_path = file_utils.join(backup_dir, "latest.weights.h5")
+        # Files of the full backups of the weights with delta backups.
+        self._full_backups = ("latest.weights.h5", "latest.alt.weights.h5")
         self._training_metadata_path = file_utils.join(
             backup_dir, "training_metadata.json"
         )
@@ -108,8 +135,24 @@ class BackupAndRestore(Callback):
                 f"Received: save_freq={save_freq}. "
                 "Expected either 'epoch' or an integer value."
             )
+        if not isinstance(max_delta_chain, int) or max_delta_chain < 0:
+            raise ValueError(
+                "Invalid value for argument `max_delta_chain`. Expected a "
+                "non-negative integer. "
+                f"Received: max_delta_chain={max_delta_chain}"
+            )
+        if max_delta_chain and double_checkpoint:
+            raise ValueError(
+                "Arguments `max_delta_chain` and `double_checkpoint` cannot "
+                "be used together. Received: "
+                f"max_delta_chain={max_delta_chain}, "
+                f"double_checkpoint={double_checkpoint}"
+            )
 
     def on_train_begin(self, logs=None):
+        self._chunk_hashes = None
+        self._deltas = []
+        self._full_backup = None
         try:
             self._load_model()
         except OSError as e:
@@ -135,21 +178,59 @@ class BackupAndRestore(Callback):
                 f"Model {self.model} is unbuilt. You can build it "
                 "beforehand by calling it on a batch of data."
             )
-        if file_utils.exists(self._weights_path):
+        training_metadata = None
+        if file_utils.exists(self._training_metadata_path):
+            with file_utils.File(self._training_metadata_path, "r") as f:
+                training_metadata = json.loads(f.read())
+
+        weights_path = self._weights_path
+        if training_metadata and training_metadata.get("weights"):
+            weights_path = file_utils.join(
+                self.backup_dir, training_metadata["weights"]
+            )
+        if file_utils.exists(weights_path):
             if (
                 self.model.optimizer is not None
                 and not self.model.optimizer.built
             ):
                 # Make sure optimizer weights exist before loading.
                 self.model.optimizer.build(self.model.trainable_variables)
-            self.model.load_weights(self._weights_path)
+            self.model.load_weights(weights_path)
+            if training_metadata and training_metadata.get("deltas"):
+                self._apply_deltas(training_metadata["deltas"])
 
-        if file_utils.exists(self._training_metadata_path):
-            with file_utils.File(self._training_metadata_path, "r") as f:
-                training_metadata = json.loads(f.read())
+        if training_metadata is not None:
+            # The restored backups are deleted by the next full backup.
+            self._deltas = training_metadata.get("deltas", [])
+            self._full_backup = training_metadata.get("weights")
             epoch = training_metadata["epoch"]
             self.model._initial_epoch = epoch
 
+    def _apply_deltas(self, deltas):
+        """Replays the delta backups on top of the loaded weights."""
+        snapshot = saving_lib.ModelSnapshot(self.model, weights_only=True)
+        values = snapshot.get_values()
+        for filename in deltas:
+            with file_utils.File(
+                file_utils.join(self.backup_dir, filename), "rb"
+            ) as f:
+                delta = dict(np.load(f))
+            for path, value in values.items():
+                if f"{path}:indices" not in delta:
+                    continue
+                value_bytes = value.reshape(-1).view(np.uint8)
+                chunks = delta[f"{path}:values"]
+                start = 0
+                for index in delta[f"{path}:indices"]:
+                    chunk = value_bytes[
+                        index * _DELTA_CHUNK_SIZE : (index + 1)
+                        * _DELTA_CHUNK_SIZE
+                    ]
+                    chunk[:] = chunks[start : start + chunk.size]
+                    start += chunk.size
+        snapshot.restore(self.model)
+        snapshot.close()
+
     def on_epoch_end(self, epoch, logs=None):
         self._current_epoch = epoch + 1
         self._last_batch_seen = 0
@@ -180,13 +261,93 @@ class BackupAndRestore(Callback):
             file_utils.copy(
                 self._training_metadata_path, self._prev_training_metadata_path
             )
-        self.model.save_weights(filepath=self._weights_path, overwrite=True)
+        stale_files = []
+        if self.max_delta_chain:
+            stale_files = self._save_weights_or_delta()
+        else:
+            self.model.save_weights(filepath=self._weights_path, overwrite=True)
         with file_utils.File(self._training_metadata_path, "w") as f:
             training_metadata = {
                 "epoch": self._current_epoch,
                 "batch": self._last_batch_seen,
             }
+            if self.max_delta_chain:
+                training_metadata["weights"] = self._full_backup
+                training_metadata["deltas"] = self._deltas
             f.write(json.dumps(training_metadata))
+        # Only delete the backups once the metadata no longer refers to them.
+        for filename in stale_files:
+            path = file_utils.join(self.backup_dir, filename)
+            if file_utils.exists(path):
+                file_utils.remove(path)
+
+    def _save_weights_or_delta(self):
+        """Saves the weights, or the chunks that changed since the last save.
+
+        A full backup is written to the file that the metadata doesn't refer
+        to, so that an interrupted backup leaves the previous full backup and
+        its deltas untouched.
+
+        Returns:
+            The filenames of the backups made obsolete by a full backup.
+        """
+        snapshot = saving_lib.ModelSnapshot(self.model, weights_only=True)
+        values = {
+            path: value.reshape(-1).view(np.uint8)
+            for path, value in snapshot.get_values().items()
+        }
+        chunk_hashes = {
+            path: _hash_chunks(value) for path, value in values.items()
+        }
+        stale_files = []
+        if (
+            self._chunk_hashes is None
+            or len(self._deltas) >= self.max_delta_chain
+            or any(
+                len(chunk_hashes[path]) != len(self._chunk_hashes.get(path, ()))
+                for path in chunk_hashes
+            )
+        ):
+            if self._full_backup == self._full_backups[0]:
+                full_backup = self._full_backups[1]
+            else:
+                full_backup = self._full_backups[0]
+            self.model.save_weights(
+                filepath=file_utils.join(self.backup_dir, full_backup),
+                overwrite=True,
+            )
+            stale_files = list(self._deltas)
+            if self._full_backup is not None:
+                stale_files.append(self._full_backup)
+            self._full_backup, self._deltas = full_backup, []
+        else:
+            delta = {}
+            for path, value in values.items():
+                indices = [
+                    i
+                    for i, chunk_hash in enumerate(chunk_hashes[path])
+                    if chunk_hash != self._chunk_hashes[path][i]
+                ]
+                if not indices:
+                    continue
+                delta[f"{path}:indices"] = np.array(indices, dtype="int64")
+                delta[f"{path}:values"] = np.concatenate(
+                    [
+                        value[
+                            i * _DELTA_CHUNK_SIZE : (i + 1) * _DELTA_CHUNK_SIZE
+                        ]
+                        for i in indices
+                    ]
+                )
+            filename = f"delta_{len(self._deltas):05d}.npz"
+            with file_utils.File(
+                file_utils.join(self.backup_dir, filename), "wb"
+            ) as f:
+                np.savez(f, **delta)
+            self._deltas = self._deltas + [filename]
+        self._chunk_hashes = chunk_hashes
+        snapshot.close()
+        return stale_files
 
     def _should_save_on_batch(self, batch):
         """Handles batch-level saving logic, supports steps_per_execution."""
@@ -207,3 +368,13 @@ class BackupAndRestore(Callback):
     def on_train_end(self, logs=None):
         if self.delete_checkpoint and file_utils.exists(self.backup_dir):
             file_utils.rmtree(self.backup_dir)
+
+
+def _hash_chunks(value_bytes):
+    """Returns the digests of the chunks of a flat `uint8` array."""
+    return [
+        hashlib.blake2b(
+            value_bytes[i : i + _DELTA_CHUNK_SIZE], digest_size=16
+        ).digest()
+        for i in range(0, value_bytes.size, _DELTA_CHUNK_SIZE)
+    ]
@@ -1,8 +1,11 @@
+from unittest import mock
+
 import numpy as np
 import pytest
 
 from keras.src import callbacks
 from keras.src import layers
+from keras.src import ops
 from keras.src import testing
 from keras.src.models import Sequential
 from keras.src.utils import file_utils
@@ -229,3 +232,100 @@ class BackupAndRestoreCallbackTest(testing.TestCase):
             ValueError, expected_regex="Empty `backup_dir` argument passed"
         ):
             callbacks.BackupAndRestore(backup_dir=None, save_freq="epoch")
+
+    def test_delta_checkpoints(self):
+        temp_dir = self.get_temp_dir()
+        backup_dir = file_utils.join(temp_dir, "subdir")
+
+        def make_model():
+            model = Sequential(
+                [
+                    layers.Input((1,)),
+                    layers.Embedding(1024, 64),
+                    layers.Dense(1),
+                ]
+            )
+            model.compile(loss="mse", optimizer="sgd")
+            return model
+
+        model = make_model()
+        embeddings = model.layers[0].embeddings
+        cbk = callbacks.BackupAndRestore(
+            backup_dir=backup_dir, max_delta_chain=2, delete_checkpoint=False
+        )
+        cbk.set_model(model)
+        cbk.on_train_begin()
+        cbk.on_epoch_end(0)
+        self.assertEqual(cbk._deltas, [])
+
+        # Only the chunk holding the first rows is written.
+        values = ops.convert_to_numpy(embeddings)
+        values[0] = 1.0
+        embeddings.assign(values)
+        cbk.on_epoch_end(1)
+        self.assertEqual(cbk._deltas, ["delta_00000.npz"])
+        with np.load(file_utils.join(backup_dir, "delta_00000.npz")) as delta:
+            self.assertEqual(
+                set(delta.keys()),
+                {
+                    "layers/embedding/vars/0:indices",
+                    "layers/embedding/vars/0:values",
+                },
+            )
+            self.assertEqual(
+                delta["layers/embedding/vars/0:values"].size, 2**16
+            )
+        values = ops.convert_to_numpy(embeddings)
+        values[1023] = 1.0
+        embeddings.assign(values)
+        cbk.on_epoch_end(2)
+        self.assertEqual(cbk._deltas, ["delta_00000.npz", "delta_00001.npz"])
+        ref_weights = model.get_weights()
+
+        # An interrupted full backup leaves the previous one and its deltas.
+        values = ops.convert_to_numpy(embeddings)
+        values[2] = 1.0
+        embeddings.assign(values)
+        save_weights = model.save_weights
+
+        def interrupted_save_weights(*args, **kwargs):
+            save_weights(*args, **kwargs)
+            raise RuntimeError("Interrupted")
+
+        with mock.patch.object(model, "save_weights", interrupted_save_weights):
+            with self.assertRaisesRegex(RuntimeError, "Interrupted"):
+                cbk.on_epoch_end(2)
+
+        # The deltas are replayed on top of the full backup.
+        new_model = make_model()
+        new_cbk = callbacks.BackupAndRestore(
+            backup_dir=backup_dir, max_delta_chain=2, delete_checkpoint=False
+        )
+        new_cbk.set_model(new_model)
+        new_cbk.on_train_begin()
+        self.assertEqual(new_model._initial_epoch, 3)
+        for ref_w, w in zip(ref_weights, new_model.get_weights()):
+            self.assertAllClose(ref_w, w)
+
+        # The chain is compacted into a full backup once at its maximum size.
+        cbk.on_epoch_end(3)
+        self.assertEqual(cbk._deltas, [])
+        self.assertTrue(
+            file_utils.exists(
+                file_utils.join(backup_dir, "latest.alt.weights.h5")
+            )
+        )
+        self.assertFalse(
+            file_utils.exists(file_utils.join(backup_dir, "latest.weights.h5"))
+        )
+        self.assertFalse(
+            file_utils.exists(file_utils.join(backup_dir, "delta_00000.npz"))
+        )
+        self.assertFalse(
+            file_utils.exists(file_utils.join(backup_dir, "delta_00001.npz"))
+        )
+
+        with self.assertRaisesRegex(ValueError, "max_delta_chain"):
+            callbacks.BackupAndRestore(
+                backup_dir=backup_dir, max_delta_chain=2, double_checkpoint=True
+            )
@@ -44,8 +44,12 @@ class CallbackList(Callback):
         self._async_test = False
         self._async_predict = False
         self._futures = []
+        # Number of times the batch logs were converted to Python-native
+        # types, which waits for the step that produced them, this epoch.
+        self.num_log_syncs = 0
         self._configure_async_dispatch(callbacks)
         self._add_default_callbacks(add_history, add_progbar)
+        self._configure_lazy_logs()
         self.set_model(model)
         self.set_params(params)
 
@@ -104,6 +108,34 @@ class CallbackList(Callback):
             self._progbar = ProgbarLogger()
             self.callbacks.append(self._progbar)
 
+    def _configure_lazy_logs(self):
+        # Determine whether the batch logs can be converted lazily, i.e. only
+        # when a callback reads them.
+        lazy_train = True
+        lazy_test = True
+        for cbk in self.callbacks:
+            if getattr(cbk, "lazy_logs_safe", False):
+                # Callbacks that expose self.lazy_logs_safe == True
+                # only read the batch logs when they need them.
+                continue
+            if not utils.is_default(cbk.on_batch_end):
+                lazy_train = False
+            if not utils.is_default(cbk.on_train_batch_end):
+                lazy_train = False
+            if not utils.is_default(cbk.on_test_batch_end):
+                lazy_test = False
+        self._lazy_train_logs = lazy_train
+        self._lazy_test_logs = lazy_test
+
+    def _count_log_sync(self):
+        self.num_log_syncs += 1
+
+    def _batch_logs(self, logs, lazy):
+        if lazy:
+            return python_utils.LazyLogs(logs, on_sync=self._count_log_sync)
+        self._count_log_sync()
+        return python_utils.pythonify_logs(logs)
+
     def set_model(self, model):
         if not model:
             return
@@ -132,6 +164,7 @@ class CallbackList(Callback):
             callback.on_batch_begin(batch, logs=logs)
 
     def on_epoch_begin(self, epoch, logs=None):
+        self.num_log_syncs = 0
         logs = python_utils.pythonify_logs(logs)
         for callback in self.callbacks:
             callback.on_epoch_begin(epoch, logs)
@@ -184,17 +217,17 @@ class CallbackList(Callback):
             self._on_predict_batch_end(batch, logs)
 
     def _on_batch_end(self, batch, logs=None):
-        logs = python_utils.pythonify_logs(logs)
+        logs = self._batch_logs(logs, self._lazy_train_logs)
         for callback in self.callbacks:
             callback.on_batch_end(batch, logs=logs)
 
     def _on_train_batch_end(self, batch, logs=None):
-        logs = python_utils.pythonify_logs(logs)
+        logs = self._batch_logs(logs, self._lazy_train_logs)
         for callback in self.callbacks:
             callback.on_train_batch_end(batch, logs=logs)
 
     def _on_test_batch_end(self, batch, logs=None):
-        logs = python_utils.pythonify_logs(logs)
+        logs = self._batch_logs(logs, self._lazy_test_logs)
         for callback in self.callbacks:
             callback.on_test_batch_end(batch, logs=logs)
 
@@ -4,6 +4,9 @@ import pytest
 from keras.src import models
 from keras.src import testing
 from keras.src.callbacks.callback import Callback
+from keras.src.callbacks.callback_list import CallbackList
+from keras.src.callbacks.progbar_logger import ProgbarLogger
+from keras.src.utils import python_utils
 
 
 class CallbackTest(testing.TestCase):
@@ -29,3 +32,40 @@ class CallbackTest(testing.TestCase):
         x = np.random.random((8, 1))
         y = np.random.random((8, 1))
         model.fit(x, y, callbacks=[CBK()], batch_size=2)
+
+    def test_lazy_batch_logs(self):
+        class Value:
+            num_reads = 0
+
+            def __float__(self):
+                Value.num_reads += 1
+                return 1.0
+
+        num_steps = 50
+        callbacks = CallbackList(
+            [ProgbarLogger()], verbose=1, epochs=1, steps=num_steps
+        )
+        callbacks.on_train_begin()
+        callbacks.on_epoch_begin(0)
+        # Only the progbar reads the batch logs, when it is refreshed.
+        callbacks._progbar.progbar.interval = 60
+        for step in range(num_steps):
+            callbacks.on_train_batch_end(step, {"loss": Value()})
+        callbacks.on_epoch_end(0, {"loss": 1.0})
+        self.assertEqual(callbacks.num_log_syncs, 1)
+        self.assertEqual(Value.num_reads, 1)
+
+        class ReadingCallback(Callback):
+            def on_train_batch_end(self, batch, logs=None):
+                assert not isinstance(logs, python_utils.LazyLogs)
+                assert logs["loss"] == 1.0
+
+        callbacks = CallbackList(
+            [ReadingCallback()], verbose=0, epochs=1, steps=num_steps
+        )
+        callbacks.on_train_begin()
+        callbacks.on_epoch_begin(0)
+        for step in range(num_steps):
+            callbacks.on_train_batch_end(step, {"loss": Value()})
+        callbacks.on_epoch_end(0, {"loss": 1.0})
+        self.assertEqual(callbacks.num_log_syncs, num_steps)
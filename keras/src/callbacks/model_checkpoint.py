@@ -1,5 +1,8 @@
+import concurrent.futures
 import os
 import re
+import shutil
+import time
 import warnings
 
 import numpy as np
@@ -7,6 +10,7 @@ import numpy as np
 from keras.src import backend
 from keras.src.api_export import keras_export
 from keras.src.callbacks.callback import Callback
+from keras.src.saving import saving_lib
 from keras.src.utils import file_utils
 from keras.src.utils import io_utils
 
@@ -123,6 +127,23 @@ class ModelCheckpoint(Callback):
             metric to be monitored. Only applies if `save_best_value=True`. Only
             overwrites the model weights already saved if the performance of
             current model is better than this value.
+        save_async: Whether to write the checkpoints on a background thread.
+            When `True`, saving only blocks training while the values of
+            the variables are copied to host memory, and the files are
+            written while training continues. At most one checkpoint is
+            written at a time: saving again waits for the previous write
+            to complete. Each checkpoint is written to a temporary file
+            that is renamed to `filepath` once complete, so `filepath`
+            never holds a partially written checkpoint. Only supports the
+            `.keras` and `.weights.h5` formats. Defaults to `False`.
+
+    Attributes:
+        last_stall_time: Time in seconds for which the last save blocked
+            training.
+        last_save_latency: Time in seconds from the start of the last
+            completed save until its checkpoint was fully written.
+        total_stall_time: Total time in seconds for which saving blocked
+            training.
     """
 
     def __init__(
@@ -135,6 +156,7 @@ class ModelCheckpoint(Callback):
         mode="auto",
         save_freq="epoch",
         initial_value_threshold=None,
+        save_async=False,
     ):
         super().__init__()
         self.monitor = monitor
@@ -146,6 +168,12 @@ class ModelCheckpoint(Callback):
         self._batches_seen_since_last_saving = 0
         self._last_batch_seen = 0
         self.best = initial_value_threshold
+        self.save_async = save_async
+        self.last_stall_time = None
+        self.last_save_latency = None
+        self.total_stall_time = 0.0
+        self._executor = None
+        self._pending_save = None
 
         if mode not in ["auto", "min", "max"]:
             warnings.warn(
@@ -196,6 +224,12 @@ class ModelCheckpoint(Callback):
                     "(Keras model format). Received: "
                     f"filepath={self.filepath}"
                 )
+            if save_async and not self.filepath.endswith(".keras"):
+                raise ValueError(
+                    "When using `save_async=True` in `ModelCheckpoint`, the "
+                    "filepath provided must end in `.keras` or "
+                    f"`.weights.h5`. Received: filepath={self.filepath}"
+                )
 
     def on_train_batch_end(self, batch, logs=None):
         if self._should_save_on_batch(batch):
@@ -208,6 +242,20 @@ class ModelCheckpoint(Callback):
         if self.save_freq == "epoch":
             self._save_model(epoch=epoch, batch=None, logs=logs)
 
+    def on_train_end(self, logs=None):
+        if self._executor is None:
+            return
+        try:
+            self._wait_for_pending_save()
+        finally:
+            self._executor.shutdown()
+            self._executor = None
+        if self.verbose > 0:
+            io_utils.print_msg(
+                "Asynchronous checkpointing blocked training for "
+                f"{self.total_stall_time:.3f}s in total."
+            )
+
     def _should_save_on_batch(self, batch):
         """Handles batch-level saving logic, supports steps_per_execution."""
         if self.save_freq == "epoch":
@@ -259,7 +307,7 @@ class ModelCheckpoint(Callback):
                         f"a scalar value. Received: {current}. "
                         "Falling back to `save_best_only=False`."
                     )
-                    self.model.save(filepath, overwrite=True)
+                    self._save(filepath, weights_only=False)
                 else:
                     if self.monitor_op(current, self.best):
                         if self.verbose > 0:
@@ -270,10 +318,7 @@ class ModelCheckpoint(Callback):
                                 f"saving model to {filepath}"
                             )
                         self.best = current
-                        if self.save_weights_only:
-                            self.model.save_weights(filepath, overwrite=True)
-                        else:
-                            self.model.save(filepath, overwrite=True)
+                        self._save(filepath, self.save_weights_only)
                     else:
                         if self.verbose > 0:
                             io_utils.print_msg(
@@ -286,10 +331,7 @@ class ModelCheckpoint(Callback):
                     io_utils.print_msg(
                         f"\nEpoch {epoch + 1}: saving model to {filepath}"
                     )
-                if self.save_weights_only:
-                    self.model.save_weights(filepath, overwrite=True)
-                else:
-                    self.model.save(filepath, overwrite=True)
+                self._save(filepath, self.save_weights_only)
         except IsADirectoryError:  # h5py 3.x
             raise IOError(
                 "Please specify a non-directory filepath for "
@@ -308,6 +350,60 @@ class ModelCheckpoint(Callback):
             # Re-throw the error for any other causes.
             raise e
 
+    def _save(self, filepath, weights_only):
+        """Saves the model or its weights to `filepath`."""
+        if not self.save_async:
+            if weights_only:
+                self.model.save_weights(filepath, overwrite=True)
+            else:
+                self.model.save(filepath, overwrite=True)
+            return
+        start_time = time.time()
+        self._wait_for_pending_save()
+        snapshot = saving_lib.ModelSnapshot(
+            self.model, weights_only=weights_only
+        )
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                1, thread_name_prefix="keras_model_checkpoint"
+            )
+        self._pending_save = self._executor.submit(
+            self._write_snapshot, snapshot, filepath, start_time
+        )
+        self.last_stall_time = time.time() - start_time
+        self.total_stall_time += self.last_stall_time
+
+    def _wait_for_pending_save(self):
+        """Waits for the checkpoint in flight, raising its errors."""
+        if self._pending_save is not None:
+            pending_save, self._pending_save = self._pending_save, None
+            pending_save.result()
+
+    def _write_snapshot(self, snapshot, filepath, start_time):
+        """Writes `snapshot` to a temporary file renamed to `filepath`."""
+        try:
+            if file_utils.is_remote_path(filepath):
+                tmp_dir = saving_lib.get_temp_dir()
+                try:
+                    local_filepath = os.path.join(
+                        tmp_dir, os.path.basename(filepath)
+                    )
+                    snapshot.save(local_filepath)
+                    file_utils.copy(local_filepath, filepath)
+                finally:
+                    shutil.rmtree(tmp_dir)
+            else:
+                tmp_filepath = f"{filepath}.tmp"
+                try:
+                    snapshot.save(tmp_filepath)
+                    os.replace(tmp_filepath, filepath)
+                finally:
+                    if os.path.exists(tmp_filepath):
+                        os.remove(tmp_filepath)
+        finally:
+            snapshot.close()
+        self.last_save_latency = time.time() - start_time
+
     def _get_file_path(self, epoch, batch, logs):
         """Returns the file path for checkpoint."""
 
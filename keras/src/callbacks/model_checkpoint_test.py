@@ -550,3 +550,72 @@ class ModelCheckpointTest(testing.TestCase):
         self.assertEqual(len(ref_weights), len(new_weights))
         for ref_w, w in zip(ref_weights, new_weights):
             self.assertAllClose(ref_w, w)
+
+    @pytest.mark.skipif(
+        h5py is None,
+        reason="`h5py` is a required dependency for `ModelCheckpoint` tests.",
+    )
+    @pytest.mark.requires_trainable_backend
+    def test_model_checkpoint_save_async(self):
+        def get_model():
+            inputs = layers.Input(shape=(INPUT_DIM,), batch_size=5)
+            x = layers.Dense(NUM_HIDDEN, activation="relu")(inputs)
+            outputs = layers.Dense(NUM_CLASSES, activation="softmax")(x)
+            functional_model = models.Model(inputs, outputs)
+            functional_model.compile(
+                loss="categorical_crossentropy",
+                optimizer="sgd",
+                metrics=[metrics.Accuracy("acc")],
+            )
+            return functional_model
+
+        (x_train, y_train), _ = test_utils.get_test_data(
+            random_seed=42,
+            train_samples=TRAIN_SAMPLES,
+            test_samples=TEST_SAMPLES,
+            input_shape=(INPUT_DIM,),
+            num_classes=NUM_CLASSES,
+        )
+        y_train = numerical_utils.to_categorical(
+            y_train, num_classes=NUM_CLASSES
+        )
+
+        for filename, save_weights_only in [
+            ("checkpoint.{epoch:02d}.keras", False),
+            ("checkpoint.{epoch:02d}.weights.h5", True),
+        ]:
+            model = get_model()
+            temp_dir = self.get_temp_dir()
+            filepath = os.path.join(temp_dir, filename)
+            cbk = callbacks.ModelCheckpoint(
+                filepath,
+                save_weights_only=save_weights_only,
+                save_async=True,
+            )
+            model.fit(
+                x_train,
+                y_train,
+                batch_size=BATCH_SIZE,
+                callbacks=[cbk],
+                epochs=2,
+                verbose=0,
+            )
+            # The last checkpoint is written by the end of `fit()`, and the
+            # temporary files have been renamed.
+            self.assertEqual(
+                sorted(os.listdir(temp_dir)),
+                [filepath.format(epoch=e).split(os.sep)[-1] for e in (1, 2)],
+            )
+            self.assertGreaterEqual(cbk.last_stall_time, 0.0)
+            self.assertGreaterEqual(cbk.last_save_latency, 0.0)
+            self.assertGreaterEqual(cbk.total_stall_time, cbk.last_stall_time)
+            if save_weights_only:
+                new_model = get_model()
+                new_model.load_weights(filepath.format(epoch=2))
+            else:
+                new_model = saving.load_model(filepath.format(epoch=2))
+            for ref_w, w in zip(model.get_weights(), new_model.get_weights()):
+                self.assertAllClose(ref_w, w)
+
+        with self.assertRaisesRegex(ValueError, "save_async"):
+            callbacks.ModelCheckpoint("checkpoint.h5", save_async=True)
@@ -1,6 +1,9 @@
+import time
+
 from keras.src.api_export import keras_export
 from keras.src.callbacks.callback import Callback
 from keras.src.utils import io_utils
+from keras.src.utils import python_utils
 from keras.src.utils.progbar import Progbar
 
 
@@ -24,8 +27,11 @@ class ProgbarLogger(Callback):
         self.target = None
         self.verbose = 1
         self.epochs = 1
+        # Lazy batch logs are only read when the progbar is refreshed.
+        self.lazy_logs_safe = True
 
         self._called_in_fit = False
+        self._last_logs_read = 0
 
     def set_params(self, params):
         verbose = params["verbose"]
@@ -78,6 +84,7 @@ class ProgbarLogger(Callback):
     def _reset_progbar(self):
         self.seen = 0
         self.progbar = None
+        self._last_logs_read = 0
 
     def _maybe_init_progbar(self):
         if self.progbar is None:
@@ -92,6 +99,13 @@ class ProgbarLogger(Callback):
         self.seen = batch + 1  # One-indexed.
 
         if self.verbose == 1:
+            if isinstance(logs, python_utils.LazyLogs) and not logs.synced:
+                # Reading the logs waits for the step that produced them, only
+                # do it when the progbar is refreshed.
+                now = time.time()
+                if now - self._last_logs_read < self.progbar.interval:
+                    return
+                self._last_logs_read = now
             self.progbar.update(self.seen, list(logs.items()), finalize=False)
 
     def _finalize_progbar(self, logs):
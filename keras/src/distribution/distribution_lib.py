@@ -20,6 +20,7 @@ from keras.src.backend import distribution_lib
 from keras.src.backend.common import global_state
 
 DEFAULT_BATCH_DIM_NAME = "batch"
+DEFAULT_PIPELINE_DIM_NAME = "pipeline"
 GLOBAL_ATTRIBUTE_NAME = "distribution"
 
 
@@ -382,14 +383,42 @@ class DataParallel(Distribution):
     will be used to detect any available devices and create a 1D mesh from
     them.
 
+    To reduce the memory used by each device, the variables can be sharded
+    along the data parallel dimension too, as in ZeRO/FSDP, instead of being
+    replicated. With `shard_optimizer_variables=True`, the variables created
+    by the optimizer (e.g. the momentums and velocities of `Adam`) are
+    sharded. With `shard_model_variables=True`, the other variables are
+    sharded as well. A variable is sharded on its first dimension which can
+    be divided evenly across the devices, and is replicated if there is none.
+    Sharded variables are all-gathered by the compiler where their full value
+    is needed, e.g. when the optimizer updates a replicated variable. The
+    variable layouts are only used by the JAX backend for now.
+
     Args:
         device_mesh: Optional `DeviceMesh` instance.
         devices: Optional list of devices.
         auto_shard_dataset: Automatically shard the dataset amongst processes.
+            Besides `tf.data.Dataset` instances, NumPy arrays and tensors are
+            sharded by loading a slice of each batch in every process, and
+            `keras.utils.PyDataset` instances by loading different batches
+            in every process. Their shuffling is then seeded by the global
+            NumPy random generator, which must be seeded the same way in
+            every process, e.g. with `keras.utils.set_random_seed()`.
             Defaults to true.
+        shard_optimizer_variables: Whether to shard the variables of the
+            optimizer across the devices. Defaults to `False`.
+        shard_model_variables: Whether to shard the other variables across
+            the devices. Defaults to `False`.
     """
 
-    def __init__(self, device_mesh=None, devices=None, auto_shard_dataset=True):
+    def __init__(
+        self,
+        device_mesh=None,
+        devices=None,
+        auto_shard_dataset=True,
+        shard_optimizer_variables=False,
+        shard_model_variables=False,
+    ):
         if device_mesh:
             self._initialize_with_device_mesh(device_mesh)
         elif devices:
@@ -403,6 +432,8 @@ class DataParallel(Distribution):
         self._process_id = distribution_lib.process_id()
         self._is_multi_process = self._num_process > 1
         self._auto_shard_dataset = auto_shard_dataset
+        self._shard_optimizer_variables = shard_optimizer_variables
+        self._shard_model_variables = shard_model_variables
 
     def _initialize_with_device_mesh(self, device_mesh):
         if not isinstance(device_mesh, DeviceMesh):
@@ -442,8 +473,31 @@ class DataParallel(Distribution):
         data_shard_spec[0] = self._batch_dim_name  # Shard on the first dim
         return TensorLayout(data_shard_spec, self.device_mesh)
 
+    def _get_process_shard(self):
+        """Returns how the data loaded by this process is sharded.
+
+        Used to shard the inputs other than `tf.data.Dataset` instances.
+
+        Returns:
+            A tuple `(shard_index, num_shards)`, or `None` if every process
+            loads all the data.
+        """
+        if not self._is_multi_process or not self._auto_shard_dataset:
+            return None
+        return self._process_id, self._num_process
+
     def get_variable_layout(self, variable):
         variable_shard_spec = [None] * len(variable.shape)
+        if _is_creating_optimizer_variables():
+            shard = self._shard_optimizer_variables
+        else:
+            shard = self._shard_model_variables
+        if shard:
+            num_shards = self.device_mesh.shape[0]
+            for i, dim in enumerate(variable.shape):
+                if dim is not None and dim % num_shards == 0:
+                    variable_shard_spec[i] = self._batch_dim_name
+                    break
         return TensorLayout(variable_shard_spec, self.device_mesh)
 
     def get_tensor_layout(self, path):
@@ -595,6 +649,32 @@ class ModelParallel(Distribution):
         data_shard_spec[0] = self._batch_dim_name  # Shard on the first dim
         return TensorLayout(data_shard_spec, self.device_mesh)
 
+    def _get_process_shard(self):
+        """Returns how the data loaded by this process is sharded.
+
+        Used to shard the inputs other than `tf.data.Dataset` instances, the
+        same way as `distribute_dataset()`.
+
+        Returns:
+            A tuple `(shard_index, num_shards)`, or `None` if every process
+            loads all the data.
+        """
+        if not self._is_multi_process:
+            return None
+        mesh_batch_dim_index = self.device_mesh.axis_names.index(
+            self._batch_dim_name
+        )
+        num_model_replicas = self.device_mesh.shape[mesh_batch_dim_index]
+        if num_model_replicas == 1:
+            return None
+        if num_model_replicas >= self._num_process:
+            return self._process_id, self._num_process
+        # The processes of a model replica load the same data, the processes
+        # `[i * processes_per_replica, (i + 1) * processes_per_replica)`
+        # holding the `i`-th model replica.
+        processes_per_replica = self._num_process // num_model_replicas
+        return self._process_id // processes_per_replica, num_model_replicas
+
     def get_variable_layout(self, variable):
         variable_layout = self._layout_map[variable.path]
         if variable_layout is not None:
@@ -680,6 +760,303 @@ class ModelParallel(Distribution):
             return distributed_dataset.prefetch(tf.data.AUTOTUNE)
 
 
+@keras_export("keras.distribution.PipelineParallel")
+class PipelineParallel(Distribution):
+    """Distribution for pipeline parallelism.
+
+    The layers of a `Sequential` or `Functional` model are split into
+    consecutive stages, each of which has its variables on its own devices:
+    the devices at one index of the `pipeline_axis_name` axis of the device
+    mesh. The other axes of the mesh are used for data parallelism within
+    the stages, and the variables are replicated across them.
+
+    A batch is split into `num_microbatches` microbatches, which flow through
+    the stages one after the other, so that the stages work on different
+    microbatches at the same time. The order of the forward and backward
+    passes of the stages is given by `schedule`:
+
+    - `"gpipe"`: every stage runs the forward passes of all the microbatches,
+        then their backward passes.
+    - `"1f1b"`: after a warmup, every stage alternates between the forward
+        pass of a microbatch and the backward pass of another one, which
+        keeps fewer microbatches in flight than `"gpipe"`, and uses less
+        memory.
+
+    Only the inputs of the stages are kept for the backward passes, the
+    activations within the stages are recomputed. The gradients of the
+    microbatches are accumulated, and the variables of each stage are updated
+    by the optimizer once per batch, which gives the same results as
+    training on the whole batch for losses averaged over the samples (the
+    default `"sum_over_batch_size"` reduction).
+
+    The stages are given as lists of layer names, e.g. as proposed by
+    `keras.distribution.partition_stages()`, and the model must then be
+    created in the scope of the distribution so that its variables are
+    directly created on the devices of their stage. Without `stages`, the
+    model is split into stages with balanced numbers of parameters when it
+    is first trained, evaluated or used for predictions, and its variables
+    are moved to the devices of their stages then.
+
+    Pipeline parallelism is only implemented by the JAX backend, in a single
+    process. The optimizer can't use `global_clipnorm`, gradient
+    accumulation, EMA or dynamic loss scaling, and the models can't override
+    `train_step()`, `test_step()` or `predict_step()`.
+
+    Example:
+
+    ```python
+    devices = list_devices()    # Assume there are 8 devices.
+
+    # 4 stages, with 2 data parallel devices each.
+    device_mesh = DeviceMesh(
+        shape=(4, 2), axis_names=("pipeline", "batch"), devices=devices
+    )
+    stages = partition_stages(create_model(), num_stages=4)
+    distribution = PipelineParallel(
+        device_mesh,
+        stages=stages,
+        num_microbatches=8,
+        schedule="1f1b",
+    )
+    with distribution.scope():
+        model = create_model()
+        model.compile(loss="mse", optimizer="adam")
+        model.fit(data)
+    ```
+
+    With `record_stage_timings=True`, the time spent by each stage is
+    recorded and returned by `get_stage_timings()`. This waits for each
+    stage to finish its work before running the next one, which disables the
+    overlap of the stages, so it should only be used to find out which
+    stages to rebalance.
+
+    Args:
+        device_mesh: Optional `DeviceMesh` instance. Defaults to a 1D mesh
+            of all the devices, with one device per stage.
+        stages: Optional list of lists of layer names, one list per stage.
+            The layers which are not listed, e.g. layers without variables,
+            are placed in the last stage of their inputs. There must be as
+            many stages as devices along the pipeline axis of the mesh.
+        num_microbatches: Optional integer, the number of microbatches of a
+            batch. More microbatches keep the stages busier. Defaults to
+            four times the number of stages.
+        schedule: One of `"1f1b"` and `"gpipe"`. Defaults to `"1f1b"`.
+        pipeline_axis_name: Optional string, the axis name in the device
+            mesh along which the stages are placed. Defaults to the first
+            axis of the device mesh.
+        batch_dim_name: Optional string, the axis name in the device mesh
+            used to distribute the data within the stages. Defaults to the
+            first of the other axes of the device mesh.
+        record_stage_timings: Whether to record the time spent by each
+            stage. Defaults to `False`.
+    """
+
+    def __init__(
+        self,
+        device_mesh=None,
+        stages=None,
+        num_microbatches=None,
+        schedule="1f1b",
+        pipeline_axis_name=None,
+        batch_dim_name=None,
+        record_stage_timings=False,
+    ):
+        if device_mesh is None:
+            devices = np.array(list_devices())
+            device_mesh = DeviceMesh(
+                shape=devices.shape,
+                axis_names=[DEFAULT_PIPELINE_DIM_NAME],
+                devices=devices,
+            )
+        elif not isinstance(device_mesh, DeviceMesh):
+            raise ValueError(
+                "Expect `device_mesh` to be an instance of `DeviceMesh`. "
+                f"Received: device_mesh={device_mesh} "
+                f"(of type {type(device_mesh)})"
+            )
+        super().__init__(device_mesh)
+
+        axis_names = list(device_mesh.axis_names)
+        self._pipeline_axis_name = pipeline_axis_name or axis_names[0]
+        if self._pipeline_axis_name not in axis_names:
+            raise ValueError(
+                f"Pipeline axis '{self._pipeline_axis_name}' is not in the "
+                f"device mesh. Available axis names: {axis_names}"
+            )
+        other_axis_names = [
+            name for name in axis_names if name != self._pipeline_axis_name
+        ]
+        if (
+            batch_dim_name is not None
+            and batch_dim_name not in other_axis_names
+        ):
+            raise ValueError(
+                f"Batch axis '{batch_dim_name}' must be an axis of the device "
+                "mesh other than the pipeline axis. Available axis names: "
+                f"{other_axis_names}"
+            )
+        self._batch_dim_name = batch_dim_name or (
+            other_axis_names[0] if other_axis_names else DEFAULT_BATCH_DIM_NAME
+        )
+        self._num_stages = device_mesh.shape[
+            axis_names.index(self._pipeline_axis_name)
+        ]
+
+        if stages is not None:
+            stages = [list(stage) for stage in stages]
+            if len(stages) != self._num_stages:
+                raise ValueError(
+                    f"Expected {self._num_stages} stages, one per device "
+                    f"along the '{self._pipeline_axis_name}' axis of the "
+                    f"device mesh. Received {len(stages)} stages: {stages}"
+                )
+            if not all(stages):
+                raise ValueError(
+                    "Every stage must contain at least one layer. "
+                    f"Received: stages={stages}"
+                )
+        self._stages = stages
+        self._stage_of_layer = {
+            name: index
+            for index, stage in enumerate(stages or [])
+            for name in stage
+        }
+        if num_microbatches is None:
+            num_microbatches = 4 * self._num_stages
+        if num_microbatches < 1:
+            raise ValueError(
+                "`num_microbatches` must be at least 1. "
+                f"Received: num_microbatches={num_microbatches}"
+            )
+        self._num_microbatches = num_microbatches
+        if schedule not in ("gpipe", "1f1b"):
+            raise ValueError(
+                "Argument `schedule` must be one of 'gpipe' or '1f1b'. "
+                f"Received: schedule={schedule}"
+            )
+        self._schedule = schedule
+        self._stage_device_meshes = [
+            self._create_stage_device_mesh(index)
+            for index in range(self._num_stages)
+        ]
+        self._record_stage_timings = record_stage_timings
+        self.reset_stage_timings()
+
+        if distribution_lib.num_processes() > 1:
+            raise ValueError(
+                "`PipelineParallel` only supports a single process for now."
+            )
+
+    @property
+    def num_stages(self):
+        return self._num_stages
+
+    @property
+    def stages(self):
+        return self._stages
+
+    @property
+    def num_microbatches(self):
+        return self._num_microbatches
+
+    @property
+    def schedule(self):
+        return self._schedule
+
+    def _create_stage_device_mesh(self, stage):
+        axis_names = list(self.device_mesh.axis_names)
+        devices = np.asarray(
+            np.take(
+                self.device_mesh.devices,
+                stage,
+                axis=axis_names.index(self._pipeline_axis_name),
+            )
+        )
+        axis_names.remove(self._pipeline_axis_name)
+        if not axis_names:
+            devices = devices.reshape((1,))
+            axis_names = [self._batch_dim_name]
+        return DeviceMesh(
+            shape=devices.shape, axis_names=axis_names, devices=devices
+        )
+
+    def get_stage_device_mesh(self, stage):
+        """Returns the `DeviceMesh` of the devices of a stage.
+
+        Args:
+            stage: Integer, the index of the stage.
+
+        Returns:
+            The `DeviceMesh` along the axes other than the pipeline axis.
+        """
+        return self._stage_device_meshes[stage]
+
+    def get_data_layout(self, data_shape):
+        # The data is consumed by the first stage.
+        data_shard_spec = [None] * len(data_shape)
+        data_shard_spec[0] = self._batch_dim_name  # Shard on the first dim
+        return TensorLayout(data_shard_spec, self._stage_device_meshes[0])
+
+    def get_variable_layout(self, variable):
+        stage = self._get_variable_stage(variable.path)
+        if stage is None:
+            device_mesh = self.device_mesh
+        else:
+            device_mesh = self._stage_device_meshes[stage]
+        variable_shard_spec = [None] * len(variable.shape)
+        return TensorLayout(variable_shard_spec, device_mesh)
+
+    def get_tensor_layout(self, path):
+        return None
+
+    def distribute_dataset(self, dataset):
+        # A single process reads all the data.
+        return dataset
+
+    def _get_variable_stage(self, path):
+        if not self._stage_of_layer:
+            return None
+        components = path.split("/")
+        for component in components:
+            if component in self._stage_of_layer:
+                return self._stage_of_layer[component]
+        if not _is_creating_optimizer_variables():
+            return None
+        # The variables of the optimizer are named after the path of the
+        # model variable they are created for, e.g. "adam/dense_kernel_m".
+        stage = None
+        longest = 0
+        for name, index in self._stage_of_layer.items():
+            if components[-1].startswith(name + "_") and len(name) > longest:
+                stage = index
+                longest = len(name)
+        return stage
+
+    def get_stage_timings(self):
+        """Returns the time spent by each stage since the last reset.
+
+        The timings are only recorded with `record_stage_timings=True`, and
+        include the compilation of the stages during their first step.
+
+        Returns:
+            A list with one dict per stage, mapping `"forward"`,
+            `"backward"`, `"update"` and `"transfer"` to the total time in
+            seconds spent in the forward passes, the backward passes (which
+            include the forward passes recomputed for them, and the whole
+            training step of the microbatches for the last stage), the
+            updates of the variables, and the transfers of the inputs of the
+            stage from the previous or next stage.
+        """
+        return [dict(timings) for timings in self._stage_timings]
+
+    def reset_stage_timings(self):
+        """Resets the timings returned by `get_stage_timings()`."""
+        self._stage_timings = [
+            {"forward": 0.0, "backward": 0.0, "update": 0.0, "transfer": 0.0}
+            for _ in range(self._num_stages)
+        ]
+
+
 @keras_export("keras.distribution.LayoutMap")
 class LayoutMap(collections.abc.MutableMapping):
     """A dict-like object that maps string to `TensorLayout` instances.
@@ -723,6 +1100,13 @@ class LayoutMap(collections.abc.MutableMapping):
     def __init__(self, device_mesh):
         self._layout_map = collections.OrderedDict()
         self._device_mesh = device_mesh
+        # The keys compiled as regexes, see `_compile_keys()`. They are reset
+        # whenever the map is modified, as well as the memoized matches.
+        self._compiled_keys = None
+        self._literal_keys = None
+        self._max_literal_key_length = 0
+        self._combined_pattern = None
+        self._matching_keys_cache = {}
 
     def __getitem__(self, key):
         """Retrieves the corresponding layout by the string key.
@@ -741,14 +1125,14 @@ class LayoutMap(collections.abc.MutableMapping):
         if key in self._layout_map:
             return self._layout_map[key]
 
-        matching_keys = []
-        for k in self._layout_map:
-            if re.search(k, key):
-                matching_keys.append(k)
+        matching_keys = self._matching_keys_cache.get(key, None)
+        if matching_keys is None:
+            matching_keys = self._find_matching_keys(key)
+            self._matching_keys_cache[key] = matching_keys
         if len(matching_keys) > 1:
             raise ValueError(
                 f"Path '{key}' matches multiple layout "
-                f"specification keys: {matching_keys}. Please make "
+                f"specification keys: {list(matching_keys)}. Please make "
                 "sure each tensor/variable path only matches at most "
                 "one layout specification key in the LayoutMap."
             )
@@ -779,10 +1163,13 @@ class LayoutMap(collections.abc.MutableMapping):
             )
         self._maybe_populate_device_mesh(layout)
         self._layout_map[key] = layout
+        self._reset_compiled_keys()
 
     def __delitem__(self, key):
         # let the dict to handle the key missing error
-        return self._layout_map.pop(key)
+        layout = self._layout_map.pop(key)
+        self._reset_compiled_keys()
+        return layout
 
     def __len__(self):
         return len(self._layout_map)
@@ -798,10 +1185,88 @@ class LayoutMap(collections.abc.MutableMapping):
         if layout.device_mesh is None and self.device_mesh is not None:
             layout.device_mesh = self.device_mesh
 
+    def _reset_compiled_keys(self):
+        self._compiled_keys = None
+        self._literal_keys = None
+        self._max_literal_key_length = 0
+        self._combined_pattern = None
+        self._matching_keys_cache = {}
+
+    def _compile_keys(self):
+        # Keys without special characters, e.g. variable paths, match the
+        # paths which contain them. They are looked up by substring in a
+        # dict, which stays fast with thousands of keys, unlike regexes.
+        self._literal_keys = {}
+        self._compiled_keys = []
+        for index, k in enumerate(self._layout_map):
+            if k and re.escape(k) == k:
+                self._literal_keys[k] = index
+            else:
+                self._compiled_keys.append((index, k, re.compile(k)))
+        self._max_literal_key_length = max(
+            map(len, self._literal_keys), default=0
+        )
+        # A single alternation of the other keys finds the paths which match
+        # none of them in one pass. It can't tell which keys match, and the
+        # group numbers of the keys would change, so it is only used as a
+        # filter when no key has groups.
+        self._combined_pattern = None
+        if self._compiled_keys and all(
+            pattern.groups == 0 for _, _, pattern in self._compiled_keys
+        ):
+            try:
+                self._combined_pattern = re.compile(
+                    "|".join(f"(?:{k})" for _, k, _ in self._compiled_keys)
+                )
+            except re.error:
+                # E.g. a key with global flags, which are only allowed at
+                # the start of the pattern.
+                pass
+
+    def _find_matching_keys(self, key):
+        if self._compiled_keys is None:
+            self._compile_keys()
+        # Maps the index of the matching keys to the keys, to return them in
+        # insertion order.
+        matching_keys = {}
+        if self._literal_keys:
+            max_length = self._max_literal_key_length
+            for start in range(len(key)):
+                for end in range(
+                    start + 1, min(start + max_length, len(key)) + 1
+                ):
+                    index = self._literal_keys.get(key[start:end], None)
+                    if index is not None:
+                        matching_keys[index] = key[start:end]
+        if self._compiled_keys and (
+            self._combined_pattern is None
+            or self._combined_pattern.search(key) is not None
+        ):
+            for index, k, pattern in self._compiled_keys:
+                if pattern.search(key):
+                    matching_keys[index] = k
+        return tuple(matching_keys[index] for index in sorted(matching_keys))
+
 
 LayoutMap.get.__doc__ = LayoutMap.__getitem__.__doc__
 
 
+def _is_creating_optimizer_variables():
+    """Whether the variables being created belong to an optimizer.
+
+    Optimizers create their variables in a name scope they are the caller of.
+    """
+    # Avoid circular imports.
+    from keras.src.optimizers.base_optimizer import BaseOptimizer
+
+    name_scope_stack = global_state.get_global_attribute("name_scope_stack")
+    if not name_scope_stack:
+        return False
+    return any(
+        isinstance(scope.caller, BaseOptimizer) for scope in name_scope_stack
+    )
+
+
 @keras_export("keras.distribution.distribute_tensor")
 def distribute_tensor(tensor, layout):
     """Change the layout of a Tensor value in the jit function execution.
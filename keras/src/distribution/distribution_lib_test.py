@@ -8,6 +8,7 @@ import pytest
 import tensorflow as tf
 
 from keras.src import backend
+from keras.src import optimizers
 from keras.src import testing
 from keras.src.backend import distribution_lib as backend_dlib
 from keras.src.distribution import distribution_lib
@@ -234,6 +235,49 @@ class DataParallelDistributionTest(testing.TestCase):
         self.assertIs(variable_layout.device_mesh, self.device_mesh)
         self.assertEqual(variable_layout.axes, (None,))
 
+    @pytest.mark.skipif(testing.jax_uses_gpu(), reason="CI segfault")
+    def test_get_variable_layout_sharded(self):
+        distribution = distribution_lib.DataParallel(
+            device_mesh=self.device_mesh, shard_optimizer_variables=True
+        )
+        variable = backend.Variable(initializer=np.ones((3, 16)))
+        variable_layout = distribution.get_variable_layout(variable)
+        self.assertEqual(variable_layout.axes, (None, None))
+
+        optimizer = optimizers.SGD()
+        with backend.name_scope(optimizer.name, caller=optimizer):
+            variable_layout = distribution.get_variable_layout(variable)
+        self.assertEqual(variable_layout.axes, (None, "data"))
+
+        distribution = distribution_lib.DataParallel(
+            device_mesh=self.device_mesh, shard_model_variables=True
+        )
+        variable_layout = distribution.get_variable_layout(variable)
+        self.assertEqual(variable_layout.axes, (None, "data"))
+        variable = backend.Variable(initializer=np.ones((3,)))
+        variable_layout = distribution.get_variable_layout(variable)
+        self.assertEqual(variable_layout.axes, (None,))
+
+    def test_get_process_shard(self):
+        distribution = distribution_lib.DataParallel(
+            device_mesh=self.device_mesh
+        )
+        self.assertIsNone(distribution._get_process_shard())
+
+        with (
+            mock.patch.object(backend_dlib, "num_processes", return_value=2),
+            mock.patch.object(backend_dlib, "process_id", return_value=1),
+        ):
+            distribution = distribution_lib.DataParallel(
+                device_mesh=self.device_mesh
+            )
+            self.assertEqual(distribution._get_process_shard(), (1, 2))
+
+            distribution = distribution_lib.DataParallel(
+                device_mesh=self.device_mesh, auto_shard_dataset=False
+            )
+            self.assertIsNone(distribution._get_process_shard())
+
     def test_get_tensor_layout(self):
         distribution = distribution_lib.DataParallel(
             device_mesh=self.device_mesh
@@ -268,6 +312,23 @@ class ModelParallelDistributionTest(testing.TestCase):
             shape, axis_names, self.devices
         )
 
+    def test_get_process_shard(self):
+        layout_map = distribution_lib.LayoutMap(self.device_mesh)
+        for process_id, shard in [(0, (0, 2)), (3, (0, 2)), (5, (1, 2))]:
+            with (
+                mock.patch.object(
+                    backend_dlib, "num_processes", return_value=8
+                ),
+                mock.patch.object(
+                    backend_dlib, "process_id", return_value=process_id
+                ),
+            ):
+                # The processes of a model replica load the same data.
+                distribution = distribution_lib.ModelParallel(
+                    layout_map=layout_map, batch_dim_name="data"
+                )
+                self.assertEqual(distribution._get_process_shard(), shard)
+
     @pytest.mark.skipif(testing.jax_uses_gpu(), reason="CI segfault")
     def test_distribute_weights(self):
         layout_map = distribution_lib.LayoutMap(self.device_mesh)
@@ -331,6 +392,137 @@ class ModelParallelDistributionTest(testing.TestCase):
         self.assertIs(dataset, distributed_dataset)
 
 
+@pytest.mark.skipif(
+    backend.backend() != "jax",
+    reason="Only JAX has the proper backend distribution lib",
+)
+class PipelineParallelDistributionTest(testing.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.devices = [f"cpu:{i}" for i in range(8)]
+        self.device_mesh = distribution_lib.DeviceMesh(
+            (4, 2), ["pipeline", "data"], self.devices
+        )
+        self.stages = [["d1"], ["d2"], ["d3", "d4"], ["d5"]]
+
+    def test_create_with_device_mesh(self):
+        distribution = distribution_lib.PipelineParallel(
+            self.device_mesh, stages=self.stages
+        )
+        self.assertEqual(distribution.num_stages, 4)
+        self.assertEqual(distribution.stages, self.stages)
+        self.assertEqual(distribution.num_microbatches, 16)
+        self.assertEqual(distribution.schedule, "1f1b")
+        self.assertEqual(distribution._batch_dim_name, "data")
+
+        stage_mesh = distribution.get_stage_device_mesh(1)
+        self.assertEqual(stage_mesh.shape, (2,))
+        self.assertEqual(stage_mesh.axis_names, ["data"])
+        self.assertEqual(list(stage_mesh.devices), ["cpu:2", "cpu:3"])
+
+    def test_create_with_pipeline_axis_name(self):
+        distribution = distribution_lib.PipelineParallel(
+            self.device_mesh, pipeline_axis_name="data", schedule="gpipe"
+        )
+        self.assertEqual(distribution.num_stages, 2)
+        self.assertIsNone(distribution.stages)
+        self.assertEqual(distribution._batch_dim_name, "pipeline")
+        stage_mesh = distribution.get_stage_device_mesh(1)
+        self.assertEqual(stage_mesh.axis_names, ["pipeline"])
+        self.assertEqual(
+            list(stage_mesh.devices), ["cpu:1", "cpu:3", "cpu:5", "cpu:7"]
+        )
+
+    def test_create_with_list_devices(self):
+        distribution = distribution_lib.PipelineParallel()
+        num_devices = len(distribution_lib.list_devices())
+        self.assertEqual(distribution.num_stages, num_devices)
+        stage_mesh = distribution.get_stage_device_mesh(0)
+        self.assertEqual(stage_mesh.shape, (1,))
+        self.assertEqual(stage_mesh.axis_names, ["batch"])
+
+    def test_validation(self):
+        with self.assertRaisesRegex(ValueError, "is not in the device mesh"):
+            distribution_lib.PipelineParallel(
+                self.device_mesh, pipeline_axis_name="model"
+            )
+        with self.assertRaisesRegex(ValueError, "other than the pipeline"):
+            distribution_lib.PipelineParallel(
+                self.device_mesh, batch_dim_name="pipeline"
+            )
+        with self.assertRaisesRegex(ValueError, "Expected 4 stages"):
+            distribution_lib.PipelineParallel(
+                self.device_mesh, stages=self.stages[:3]
+            )
+        with self.assertRaisesRegex(ValueError, "at least one layer"):
+            distribution_lib.PipelineParallel(
+                self.device_mesh, stages=[["d1"], [], ["d2"], ["d3"]]
+            )
+        with self.assertRaisesRegex(ValueError, "`num_microbatches`"):
+            distribution_lib.PipelineParallel(
+                self.device_mesh, num_microbatches=0
+            )
+        with self.assertRaisesRegex(ValueError, "`schedule`"):
+            distribution_lib.PipelineParallel(
+                self.device_mesh, schedule="interleaved"
+            )
+
+    def test_get_data_layout(self):
+        distribution = distribution_lib.PipelineParallel(self.device_mesh)
+        data_layout = distribution.get_data_layout((16, 3))
+        self.assertIs(
+            data_layout.device_mesh, distribution.get_stage_device_mesh(0)
+        )
+        self.assertEqual(data_layout.axes, ("data", None))
+
+    @pytest.mark.skipif(testing.jax_uses_gpu(), reason="CI segfault")
+    def test_get_variable_layout(self):
+        distribution = distribution_lib.PipelineParallel(
+            self.device_mesh, stages=self.stages
+        )
+        with backend.name_scope("d4"):
+            variable = backend.Variable(
+                initializer=np.ones((3, 4)), name="kernel"
+            )
+        variable_layout = distribution.get_variable_layout(variable)
+        self.assertIs(
+            variable_layout.device_mesh, distribution.get_stage_device_mesh(2)
+        )
+        self.assertEqual(variable_layout.axes, (None, None))
+
+        # Unknown layers are replicated on all the devices.
+        variable = backend.Variable(initializer=np.ones((3,)), name="seed")
+        variable_layout = distribution.get_variable_layout(variable)
+        self.assertIs(variable_layout.device_mesh, self.device_mesh)
+
+        optimizer = optimizers.Adam()
+        with backend.name_scope(optimizer.name, caller=optimizer):
+            self.assertEqual(
+                distribution._get_variable_stage("adam/d2_kernel_momentum"),
+                1,
+            )
+            self.assertIsNone(
+                distribution._get_variable_stage("adam/iteration")
+            )
+        self.assertIsNone(distribution._get_variable_stage("d2_kernel"))
+
+    def test_stage_timings(self):
+        distribution = distribution_lib.PipelineParallel(
+            self.device_mesh, record_stage_timings=True
+        )
+        timings = distribution.get_stage_timings()
+        self.assertLen(timings, 4)
+        self.assertEqual(
+            timings[0],
+            {"forward": 0.0, "backward": 0.0, "update": 0.0, "transfer": 0.0},
+        )
+
+    def test_distribute_dataset(self):
+        dataset = tf.data.Dataset.range(8)
+        distribution = distribution_lib.PipelineParallel(self.device_mesh)
+        self.assertIs(distribution.distribute_dataset(dataset), dataset)
+
+
 class LayoutMapTest(testing.TestCase):
     def setUp(self):
         super().setUp()
@@ -400,6 +592,44 @@ class LayoutMapTest(testing.TestCase):
         self.assertIsNone(layout_map["conv2d/kernel"])
         self.assertEqual(layout_map["conv2d/bias"], self.sharded_1d)
 
+    def test_get_after_update(self):
+        layout_map = distribution_lib.LayoutMap(self.device_mesh)
+        layout_map["dense.*kernel"] = self.sharded_2d
+        self.assertEqual(layout_map["dense_2/kernel"], self.sharded_2d)
+        self.assertIsNone(layout_map["dense_2/bias"])
+
+        # Matches are looked up again when the map is modified.
+        layout_map["dense.*bias"] = self.sharded_1d
+        layout_map["kernel"] = self.replicated_2d
+        self.assertEqual(layout_map["dense_2/bias"], self.sharded_1d)
+        with self.assertRaisesRegex(
+            ValueError, "Path 'dense_2/kernel' matches multiple layout"
+        ):
+            layout_map["dense_2/kernel"]
+        del layout_map["kernel"]
+        self.assertEqual(layout_map["dense_2/kernel"], self.sharded_2d)
+
+    def test_get_literal_keys(self):
+        layout_map = distribution_lib.LayoutMap(self.device_mesh)
+        layout_map["dense/kernel"] = self.sharded_2d
+        layout_map["dense.*bias"] = self.sharded_1d
+        layout_map["dense/bias"] = self.replicated_1d
+        # Keys without special characters match the paths containing them.
+        self.assertEqual(layout_map["block/dense/kernel"], self.sharded_2d)
+        self.assertIsNone(layout_map["block/dense/gamma"])
+        with self.assertRaisesRegex(
+            ValueError, r"\['dense\.\*bias', 'dense/bias'\]"
+        ):
+            layout_map["block/dense/bias"]
+
+    def test_get_with_groups_and_flags(self):
+        layout_map = distribution_lib.LayoutMap(self.device_mesh)
+        layout_map[r"(dense|conv)_\d+/kernel"] = self.sharded_2d
+        layout_map["(?i)BIAS"] = self.sharded_1d
+        self.assertEqual(layout_map["conv_1/kernel"], self.sharded_2d)
+        self.assertEqual(layout_map["conv_1/bias"], self.sharded_1d)
+        self.assertIsNone(layout_map["conv_1/gamma"])
+
     def test_delete(self):
         layout_map = distribution_lib.LayoutMap(self.device_mesh)
 
@@ -0,0 +1,449 @@
+"""Inference of `LayoutMap`s for `ModelParallel` from the layers of a model.
+
+!!!DO NOT USE!!! Currently under development and APIs are not final.
+"""
+
+import math
+import re
+import warnings
+
+from keras.src.api_export import keras_export
+from keras.src.distribution.distribution_lib import LayoutMap
+from keras.src.distribution.distribution_lib import TensorLayout
+from keras.src.layers.attention.multi_head_attention import MultiHeadAttention
+from keras.src.layers.convolutional.base_conv import BaseConv
+from keras.src.layers.core.dense import Dense
+from keras.src.layers.core.einsum_dense import EinsumDense
+from keras.src.layers.core.embedding import Embedding
+from keras.src.utils import dtype_utils
+from keras.src.utils import naming
+
+
+@keras_export("keras.distribution.infer_layout_map")
+def infer_layout_map(model, device_mesh, model_axis_name=None):
+    """Proposes a `LayoutMap` for the variables of a model.
+
+    The kernels of the `Dense`, `EinsumDense`, `Embedding`,
+    `MultiHeadAttention` and convolution layers of the model are sharded
+    along the `model_axis_name` axis of the device mesh, following the
+    Megatron-LM scheme:
+
+    - A kernel layer is column parallel: its kernel (and bias) is sharded on
+        an output dimension, so that each device computes a slice of the
+        output features.
+    - A kernel layer which comes right after a column parallel layer is row
+        parallel: its kernel is sharded on an input dimension, so that each
+        device consumes the slice of features it computed, and the partial
+        outputs are summed across devices. The layer after it is column
+        parallel again.
+    - The query, key and value projections of a `MultiHeadAttention` layer
+        are column parallel and its output projection is row parallel, so
+        that the attention heads are split across devices.
+    - The embeddings of an `Embedding` layer are sharded on the vocabulary.
+
+    Dimensions which can't be divided evenly across devices are replicated,
+    as well as the variables of the other layers and of quantized layers.
+    The layers are visited in the order they were added to the model, which
+    is the order of the computations for most models. Layouts only change the
+    placement of the computations, not their results, so the proposed map
+    can be reviewed and edited freely, e.g. with the estimates of
+    `keras.distribution.estimate_layout_costs()`.
+
+    The keys of the map are the paths of the variables relative to the
+    model, so that they also match the variables of the model when it is
+    created again, e.g. in the scope of the distribution. The layers must
+    then have the same names: give explicit names to the layers whose names
+    would otherwise be generated (e.g. `dense`, then `dense_1`, ...).
+
+    Example:
+
+    ```python
+    def create_model():
+        return keras.Sequential(
+            [
+                keras.Input(input_shape),
+                keras.layers.Dense(1024, activation="relu", name="up"),
+                keras.layers.Dense(256, name="down"),
+            ]
+        )
+
+    model = create_model()
+    device_mesh = DeviceMesh((2, 4), ("batch", "model"), list_devices())
+    layout_map = infer_layout_map(model, device_mesh)
+    for path, layout in layout_map.items():
+        print(path, layout.axes)
+
+    distribution = ModelParallel(layout_map=layout_map, batch_dim_name="batch")
+    with distribution.scope():
+        model = create_model()
+    ```
+
+    Args:
+        model: A built `keras.Model` (or `keras.layers.Layer`).
+        device_mesh: `keras.distribution.DeviceMesh` instance.
+        model_axis_name: Optional string, the axis name in the device mesh
+            used to shard the variables. Defaults to the last axis of the
+            device mesh.
+
+    Returns:
+        A `keras.distribution.LayoutMap` with regexes matching the variable
+        paths as keys.
+    """
+    model_axis_name = _get_model_axis_name(device_mesh, model_axis_name)
+    num_shards = device_mesh.shape[
+        list(device_mesh.axis_names).index(model_axis_name)
+    ]
+    specs = _get_kernel_specs(model)
+
+    layout_map = LayoutMap(device_mesh)
+    modes = {}
+    for spec in specs:
+        if spec.mode is not None:
+            mode = spec.mode
+        elif any(
+            modes.get(id(producer)) == "column" for producer in spec.producers
+        ):
+            mode = "row"
+        else:
+            mode = "column"
+        axis = spec.column_axis if mode == "column" else spec.row_axis
+        if axis is None or spec.kernel.shape[axis] % num_shards != 0:
+            mode = None
+        modes[id(spec)] = mode
+
+        kernel_axes = [None] * len(spec.kernel.shape)
+        if mode is not None:
+            kernel_axes[axis] = model_axis_name
+        _add_layout(layout_map, model, spec.kernel, kernel_axes)
+        if spec.bias is not None:
+            bias_axes = [None] * len(spec.bias.shape)
+            if (
+                mode == "column"
+                and spec.bias_column_axis is not None
+                and spec.bias.shape[spec.bias_column_axis] % num_shards == 0
+            ):
+                bias_axes[spec.bias_column_axis] = model_axis_name
+            _add_layout(layout_map, model, spec.bias, bias_axes)
+
+    # The keys are regexes, so the paths of the other variables could match
+    # the key of a variable of the map. Those get an explicit replicated
+    # layout.
+    for variable in model.weights:
+        if _get_layout_key(model, variable) in layout_map._layout_map:
+            continue
+        if layout_map._find_matching_keys(variable.path):
+            _add_layout(
+                layout_map, model, variable, [None] * len(variable.shape)
+            )
+
+    auto_named_layers = [
+        layer.name
+        for layer in _iter_layers(model, set())
+        if _has_auto_name(layer)
+        and any(
+            _get_layout_key(model, variable) in layout_map._layout_map
+            for variable in layer.weights
+        )
+    ]
+    if auto_named_layers:
+        warnings.warn(
+            "The layouts are looked up by the paths of the variables, which "
+            "contain the names of the layers, but the names of the layers "
+            f"{auto_named_layers} were generated and change when the model "
+            "is created again. Give them explicit names, otherwise the "
+            "variables of the new model will be replicated.",
+            stacklevel=2,
+        )
+    return layout_map
+
+
+@keras_export("keras.distribution.estimate_layout_costs")
+def estimate_layout_costs(model, layout_map, model_axis_name=None):
+    """Estimates the memory and communication costs of a `LayoutMap`.
+
+    The communication volume is estimated for the forward pass of the kernel
+    layers supported by `keras.distribution.infer_layout_map()`, per device
+    and per token (i.e. per position along the sequence or spatial
+    dimensions of an example), assuming ring collectives:
+
+    - The outputs of row parallel layers and sharded embeddings are partial
+        sums, which are all-reduced.
+    - The outputs of column parallel layers are all-gathered, unless they
+        are consumed by a row parallel layer.
+
+    Args:
+        model: A built `keras.Model` (or `keras.layers.Layer`).
+        layout_map: `keras.distribution.LayoutMap` for the variables of the
+            model.
+        model_axis_name: Optional string, the axis name in the device mesh
+            used to shard the variables. Defaults to the last axis of the
+            device mesh.
+
+    Returns:
+        A dict with the following entries:
+        - `"variable_bytes"`: the total size of the variables of the model.
+        - `"variable_bytes_per_device"`: the size of the variables stored on
+            each device.
+        - `"communication_bytes_per_token"`: the volume sent by each device
+            for each token in the forward pass.
+    """
+    device_mesh = layout_map.device_mesh
+    model_axis_name = _get_model_axis_name(device_mesh, model_axis_name)
+    axis_sizes = dict(zip(device_mesh.axis_names, device_mesh.shape))
+    num_shards = axis_sizes[model_axis_name]
+
+    variable_bytes = 0
+    variable_bytes_per_device = 0
+    for variable in model.weights:
+        size = math.prod(variable.shape) * _dtype_bytes(variable.dtype)
+        layout = layout_map[variable.path]
+        shards = 1
+        if layout is not None:
+            shards = math.prod(
+                axis_sizes[axis] for axis in layout.axes if axis is not None
+            )
+        variable_bytes += size
+        variable_bytes_per_device += math.ceil(size / shards)
+
+    specs = _get_kernel_specs(model)
+    modes = {}
+    for spec in specs:
+        layout = layout_map[spec.kernel.path]
+        mode = None
+        if layout is not None and model_axis_name in layout.axes:
+            axis = list(layout.axes).index(model_axis_name)
+            if axis == spec.column_axis:
+                mode = "column"
+            elif axis == spec.row_axis:
+                mode = "row"
+        modes[id(spec)] = mode
+
+    communication_bytes = 0
+    for spec in specs:
+        output_bytes = spec.output_features * _dtype_bytes(
+            spec.layer.compute_dtype
+        )
+        mode = modes[id(spec)]
+        if mode == "row":
+            # All-reduce.
+            communication_bytes += (
+                2 * (num_shards - 1) / num_shards * output_bytes
+            )
+        elif mode == "column" and not (
+            spec.consumers
+            and all(modes[id(consumer)] == "row" for consumer in spec.consumers)
+        ):
+            # All-gather.
+            communication_bytes += (num_shards - 1) / num_shards * output_bytes
+    return {
+        "variable_bytes": variable_bytes,
+        "variable_bytes_per_device": variable_bytes_per_device,
+        "communication_bytes_per_token": int(communication_bytes),
+    }
+
+
+class _KernelSpec:
+    """How the kernel of a layer can be sharded.
+
+    Args:
+        layer: The layer owning the kernel.
+        kernel: The kernel variable.
+        bias: The bias variable, or `None`.
+        column_axis: Axis of the kernel to shard for column parallelism, i.e.
+            an output dimension, or `None`.
+        row_axis: Axis of the kernel to shard for row parallelism, i.e. a
+            contracted input dimension, or `None`.
+        bias_column_axis: Axis of the bias matching `column_axis`, or `None`.
+        output_features: Number of output features per token.
+        mode: `"column"` or `"row"` to force the parallelism of the layer, or
+            `None` to infer it from the layers producing its inputs.
+    """
+
+    def __init__(
+        self,
+        layer,
+        kernel,
+        bias,
+        column_axis,
+        row_axis,
+        bias_column_axis,
+        output_features,
+        mode=None,
+    ):
+        self.layer = layer
+        self.kernel = kernel
+        self.bias = bias
+        self.column_axis = column_axis
+        self.row_axis = row_axis
+        self.bias_column_axis = bias_column_axis
+        self.output_features = output_features
+        self.mode = mode
+        self.producers = []
+        self.consumers = []
+
+
+def _get_model_axis_name(device_mesh, model_axis_name):
+    if model_axis_name is None:
+        return device_mesh.axis_names[-1]
+    if model_axis_name not in device_mesh.axis_names:
+        raise ValueError(
+            f"Axis name '{model_axis_name}' is not in the device mesh. "
+            f"Received: model_axis_name={model_axis_name}, device mesh axis "
+            f"names: {device_mesh.axis_names}"
+        )
+    return model_axis_name
+
+
+def _get_layout_key(model, variable):
+    # The paths of the variables of a `Sequential` model or of a subclassed
+    # model are prefixed by the name of the model, which is generated again
+    # when the model is recreated.
+    path = variable.path
+    if path.startswith(f"{model.name}/"):
+        return f"^[^/]+/{re.escape(path[len(model.name) + 1 :])}$"
+    return f"^{re.escape(path)}$"
+
+
+def _add_layout(layout_map, model, variable, axes):
+    layout_map[_get_layout_key(model, variable)] = TensorLayout(axes)
+
+
+def _has_auto_name(layer):
+    prefix = naming.to_snake_case(layer.__class__.__name__)
+    return (
+        re.fullmatch(f"{re.escape(prefix)}(_[0-9]+)?", layer.name) is not None
+    )
+
+
+def _dtype_bytes(dtype):
+    return max(dtype_utils.dtype_size(dtype) // 8, 1)
+
+
+def _iter_layers(layer, seen):
+    # Unlike `Layer._flatten_layers()`, this keeps the order of the
+    # sublayers, which is the order of the computations for most models.
+    for sublayer in layer._layers:
+        if id(sublayer) in seen:
+            continue
+        seen.add(id(sublayer))
+        yield sublayer
+        if not isinstance(sublayer, MultiHeadAttention):
+            yield from _iter_layers(sublayer, seen)
+
+
+def _get_kernel_specs(model):
+    """Returns the `_KernelSpec`s of the kernel layers of `model`, in order.
+
+    Each spec is linked to the specs of the layers producing its inputs and
+    consuming its outputs: the previous and next specs, except for the
+    projections of `MultiHeadAttention` layers.
+    """
+    if not model.built:
+        raise ValueError(
+            "The model must be built to infer the layouts of its variables. "
+            f"Received an unbuilt model: {model}"
+        )
+    specs = []
+    previous = []
+
+    def link(spec_group, producers):
+        for spec in spec_group:
+            spec.producers.extend(producers)
+        for producer in producers:
+            producer.consumers.extend(spec_group)
+
+    for layer in _iter_layers(model, set()):
+        if not layer.built or layer.quantization_mode is not None:
+            continue
+        if isinstance(layer, MultiHeadAttention):
+            projections = [
+                _get_einsum_dense_spec(sublayer, mode="column")
+                for sublayer in (
+                    layer._query_dense,
+                    layer._key_dense,
+                    layer._value_dense,
+                )
+            ]
+            output = _get_einsum_dense_spec(layer._output_dense, mode="row")
+            link(projections, previous)
+            link([output], projections)
+            specs.extend(projections + [output])
+            previous = [output]
+            continue
+
+        spec = None
+        if isinstance(layer, Dense):
+            spec = _KernelSpec(
+                layer,
+                layer._kernel,
+                layer.bias,
+                column_axis=1,
+                row_axis=0,
+                bias_column_axis=0,
+                output_features=layer.units,
+            )
+        elif isinstance(layer, EinsumDense):
+            spec = _get_einsum_dense_spec(layer)
+        elif isinstance(layer, BaseConv):
+            rank = len(layer._kernel.shape)
+            spec = _KernelSpec(
+                layer,
+                layer._kernel,
+                layer.bias,
+                column_axis=rank - 1,
+                # The input channels are split in groups otherwise.
+                row_axis=rank - 2 if layer.groups == 1 else None,
+                bias_column_axis=0,
+                output_features=layer.filters,
+            )
+        elif isinstance(layer, Embedding):
+            spec = _KernelSpec(
+                layer,
+                layer._embeddings,
+                None,
+                column_axis=1,
+                row_axis=0,
+                bias_column_axis=None,
+                output_features=layer.output_dim,
+                mode="row",
+            )
+        if spec is not None:
+            link([spec], previous)
+            specs.append(spec)
+            previous = [spec]
+    return specs
+
+
+def _get_einsum_dense_spec(layer, mode=None):
+    equation = layer.equation.replace("...", "")
+    weight_spec = equation.split("->")[0].split(",")[1]
+    output_spec = equation.split("->")[1]
+    column_axis = None
+    row_axis = None
+    output_features = 1
+    for axis, char in enumerate(weight_spec):
+        if char in output_spec:
+            output_features *= layer._kernel.shape[axis]
+            if column_axis is None:
+                column_axis = axis
+        elif row_axis is None:
+            row_axis = axis
+
+    bias_column_axis = None
+    if layer.bias is not None and column_axis is not None:
+        char = weight_spec[column_axis]
+        if char in layer.bias_axes:
+            first_bias_location = min(
+                output_spec.find(c) for c in layer.bias_axes
+            )
+            bias_column_axis = output_spec[first_bias_location:].index(char)
+    return _KernelSpec(
+        layer,
+        layer._kernel,
+        layer.bias,
+        column_axis=column_axis,
+        row_axis=row_axis,
+        bias_column_axis=bias_column_axis,
+        output_features=output_features,
+        mode=mode,
+    )
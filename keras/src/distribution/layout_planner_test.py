@@ -0,0 +1,236 @@
+"""Test for layout_planner.py."""
+
+import os
+
+import numpy as np
+import pytest
+
+from keras.src import backend
+from keras.src import layers
+from keras.src import models
+from keras.src import testing
+from keras.src.distribution import distribution_lib
+from keras.src.distribution import layout_planner
+
+if backend.backend() == "jax":
+    # Due to https://github.com/google/jax/issues/17188, we can't
+    # override the XLA flag after the JAX back init. We have to
+    # run this at top level to let JAX pick the flag value.
+    xla_flags = os.getenv("XLA_FLAGS") or ""
+    # Don't override user-specified device count, or other XLA flags.
+    if "xla_force_host_platform_device_count" not in xla_flags:
+        os.environ["XLA_FLAGS"] = (
+            xla_flags + " --xla_force_host_platform_device_count=8"
+        )
+
+
+class InferLayoutMapTest(testing.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.device_mesh = distribution_lib.DeviceMesh(
+            (2, 4), ["batch", "model"], [f"cpu:{i}" for i in range(8)]
+        )
+
+    def get_axes(self, layout_map, model):
+        axes = {}
+        for weight in model.weights:
+            layout = layout_map[weight.path]
+            if layout is not None:
+                axes[weight.path] = layout.axes
+        return axes
+
+    def test_dense(self):
+        model = models.Sequential(
+            [
+                layers.Input((16,)),
+                layers.Dense(32, name="d1"),
+                layers.Dense(16, name="d2"),
+                # Can't be sharded evenly.
+                layers.Dense(6, name="d3"),
+                layers.Dense(8, name="d4", use_bias=False),
+            ]
+        )
+        layout_map = layout_planner.infer_layout_map(model, self.device_mesh)
+
+        def path(name, weight):
+            return getattr(model.get_layer(name), weight).path
+
+        self.assertEqual(
+            self.get_axes(layout_map, model),
+            {
+                # Column parallel.
+                path("d1", "kernel"): (None, "model"),
+                path("d1", "bias"): ("model",),
+                # Row parallel.
+                path("d2", "kernel"): ("model", None),
+                path("d2", "bias"): (None,),
+                # Replicated.
+                path("d3", "kernel"): (None, None),
+                path("d3", "bias"): (None,),
+                # Column parallel.
+                path("d4", "kernel"): (None, "model"),
+            },
+        )
+        self.assertIs(
+            layout_map[path("d1", "kernel")].device_mesh, self.device_mesh
+        )
+
+    def test_embedding_and_multi_head_attention(self):
+        inputs = layers.Input((5,), dtype="int32")
+        x = layers.Embedding(64, 16, name="embedding")(inputs)
+        x = layers.MultiHeadAttention(num_heads=4, key_dim=8, name="mha")(x, x)
+        x = layers.Dense(16, name="dense")(x)
+        x = layers.Conv1D(8, 3, name="conv")(x)
+        model = models.Model(inputs, x)
+
+        axes = self.get_axes(
+            layout_planner.infer_layout_map(model, self.device_mesh), model
+        )
+        self.assertEqual(axes["embedding/embeddings"], ("model", None))
+        for name in ("query", "key", "value"):
+            self.assertEqual(axes[f"mha/{name}/kernel"], (None, "model", None))
+            self.assertEqual(axes[f"mha/{name}/bias"], ("model", None))
+        self.assertEqual(
+            axes["mha/attention_output/kernel"], ("model", None, None)
+        )
+        self.assertEqual(axes["mha/attention_output/bias"], (None,))
+        self.assertEqual(axes["dense/kernel"], (None, "model"))
+        self.assertEqual(axes["conv/kernel"], (None, "model", None))
+        self.assertEqual(axes["conv/bias"], (None,))
+
+    def test_keys_match_whole_paths(self):
+        class KernelLayer(layers.Layer):
+            def build(self, input_shape):
+                self.kernel = self.add_weight(shape=(4,), name="kernel")
+
+            def call(self, x):
+                return x * self.kernel
+
+        # The paths of the variables of a functional model are not prefixed
+        # by the name of the model, "d/kernel" is a part of "xd/kernel".
+        inputs = layers.Input((4,))
+        outputs = KernelLayer(name="xd")(layers.Dense(4, name="d")(inputs))
+        model = models.Model(inputs, outputs)
+        layout_map = layout_planner.infer_layout_map(model, self.device_mesh)
+        d_kernel_path = model.get_layer("d").kernel.path
+        xd_kernel_path = model.get_layer("xd").kernel.path
+        self.assertEqual(layout_map[d_kernel_path].axes, (None, "model"))
+        self.assertIsNone(layout_map[xd_kernel_path])
+
+    def test_recreated_model(self):
+        def create_model():
+            return models.Sequential(
+                [
+                    layers.Input((16,)),
+                    layers.Dense(32, name="d1"),
+                    layers.Dense(16, name="d2"),
+                ]
+            )
+
+        model = create_model()
+        layout_map = layout_planner.infer_layout_map(model, self.device_mesh)
+        # The keys don't depend on the generated name of the model.
+        new_model = create_model()
+        self.assertNotEqual(new_model.name, model.name)
+        self.assertEqual(
+            list(self.get_axes(layout_map, new_model).values()),
+            list(self.get_axes(layout_map, model).values()),
+        )
+        self.assertLen(self.get_axes(layout_map, new_model), 4)
+        # The keys only match the layers of the model, not nested ones.
+        self.assertIsNone(layout_map[f"{model.name}/block/d1/kernel"])
+
+    def test_auto_named_layers(self):
+        model = models.Sequential(
+            [layers.Input((16,)), layers.Dense(32), layers.Dense(16)]
+        )
+        with self.assertWarnsRegex(UserWarning, "Give them explicit names"):
+            layout_planner.infer_layout_map(model, self.device_mesh)
+
+    def test_model_axis_name(self):
+        model = models.Sequential([layers.Input((8,)), layers.Dense(8)])
+        layout_map = layout_planner.infer_layout_map(
+            model, self.device_mesh, model_axis_name="batch"
+        )
+        kernel_path = model.layers[0].kernel.path
+        self.assertEqual(layout_map[kernel_path].axes, (None, "batch"))
+
+        with self.assertRaisesRegex(ValueError, "is not in the device mesh"):
+            layout_planner.infer_layout_map(
+                model, self.device_mesh, model_axis_name="foo"
+            )
+
+    def test_unbuilt_model(self):
+        model = models.Sequential([layers.Dense(8)])
+        with self.assertRaisesRegex(ValueError, "must be built"):
+            layout_planner.infer_layout_map(model, self.device_mesh)
+
+    def test_estimate_layout_costs(self):
+        model = models.Sequential(
+            [
+                layers.Input((16,)),
+                layers.Dense(32, name="d1"),
+                layers.Dense(16, name="d2"),
+            ]
+        )
+        layout_map = layout_planner.infer_layout_map(model, self.device_mesh)
+        costs = layout_planner.estimate_layout_costs(model, layout_map)
+        self.assertEqual(
+            costs,
+            {
+                "variable_bytes": (16 * 32 + 32 + 32 * 16 + 16) * 4,
+                # `d2/bias` is replicated.
+                "variable_bytes_per_device": (128 + 8 + 128 + 16) * 4,
+                # All-reduce of the outputs of `d2`.
+                "communication_bytes_per_token": 2 * 3 * 16 * 4 // 4,
+            },
+        )
+
+        # Without sharding, the outputs of the column parallel layer are
+        # all-gathered.
+        layout_map = distribution_lib.LayoutMap(self.device_mesh)
+        layout_map["d1/kernel"] = (None, "model")
+        costs = layout_planner.estimate_layout_costs(model, layout_map)
+        self.assertEqual(costs["communication_bytes_per_token"], 3 * 32)
+
+
+@pytest.mark.skipif(
+    backend.backend() != "jax",
+    reason="Only JAX has the proper backend distribution lib",
+)
+class InferLayoutMapModelParallelTest(testing.TestCase):
+    def test_e2e_model_parallel_model(self):
+        devices = distribution_lib.list_devices()
+        device_mesh = distribution_lib.DeviceMesh(
+            (1, len(devices)), ["batch", "model"], devices
+        )
+
+        def create_model():
+            inputs = layers.Input((8,), dtype="int32")
+            x = layers.Embedding(16, 8, name="embedding")(inputs)
+            x = layers.MultiHeadAttention(num_heads=8, key_dim=8, name="mha")(
+                x, x
+            )
+            x = layers.Dense(16, activation="relu", name="d1")(x)
+            x = layers.Dense(8, name="d2")(x)
+            return models.Model(inputs, x)
+
+        layout_map = layout_planner.infer_layout_map(
+            create_model(), device_mesh
+        )
+        distribution = distribution_lib.ModelParallel(
+            layout_map=layout_map, batch_dim_name="batch"
+        )
+        with distribution.scope():
+            model = create_model()
+
+        for weight in model.weights:
+            layout = layout_map[weight.path]
+            self.assertIsNotNone(layout)
+            self.assertEqual(weight._value.sharding.spec, layout.axes)
+
+        inputs = np.random.randint(0, 16, size=(8, 8))
+        labels = np.random.normal(size=(8, 8, 8))
+        with distribution.scope():
+            model.compile(loss="mse")
+            model.fit(inputs, labels, verbose=0)
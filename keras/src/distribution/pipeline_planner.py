@@ -0,0 +1,350 @@
+"""Partitioning of the layer graph of a model into pipeline stages.
+
+!!!DO NOT USE!!! Currently under development and APIs are not final.
+"""
+
+import math
+
+from keras.src import backend
+from keras.src.api_export import keras_export
+from keras.src.layers.core.input_layer import InputLayer
+from keras.src.layers.layer import Layer
+from keras.src.models.functional import Functional
+from keras.src.models.functional import operation_fn
+from keras.src.models.sequential import Sequential
+from keras.src.ops.function import ExecutionPlan
+
+
+@keras_export("keras.distribution.partition_stages")
+def partition_stages(model, num_stages):
+    """Splits the layers of a model into balanced pipeline stages.
+
+    The layers are taken in the order of the computations of the model and
+    cut into `num_stages` contiguous groups, so that the largest number of
+    parameters of a group is as small as possible. The parameters are a
+    proxy for both the memory used by a stage and its computations. Every
+    stage only consumes the outputs of the previous stages, as expected by
+    `keras.distribution.PipelineParallel`.
+
+    Example:
+
+    ```python
+    model = create_model()
+    stages = partition_stages(model, num_stages=4)
+
+    device_mesh = DeviceMesh((4, 2), ("pipeline", "batch"), list_devices())
+    distribution = PipelineParallel(device_mesh, stages=stages)
+    with distribution.scope():
+        model = create_model()
+    ```
+
+    Args:
+        model: A built `Sequential` or `Functional` model.
+        num_stages: Integer, the number of stages.
+
+    Returns:
+        A list of `num_stages` lists of layer names.
+    """
+    functional = get_functional(model)
+    if num_stages < 1:
+        raise ValueError(
+            "`num_stages` must be at least 1. "
+            f"Received: num_stages={num_stages}"
+        )
+    operations = [
+        operation
+        for operation in functional.operations
+        if not isinstance(operation, InputLayer)
+    ]
+    if len(operations) < num_stages:
+        raise ValueError(
+            f"Can't split a model with {len(operations)} layers into "
+            f"{num_stages} stages."
+        )
+    costs = [_count_params(operation) for operation in operations]
+    stages = [[]]
+    for operation, end in zip(operations, _split_costs(costs, num_stages)):
+        stages[-1].append(operation.name)
+        if end and len(stages) < num_stages:
+            stages.append([])
+    return stages
+
+
+class PipelineStage:
+    """A contiguous part of the graph of a model, run on its own devices.
+
+    The stage computes its `outputs` from its `inputs`, which are the outputs
+    of the previous stage (or the inputs of the model for the first stage).
+    Tensors used by later stages are passed through the stages in between.
+
+    Args:
+        index: Integer, the index of the stage.
+        nodes_by_depth: Dict mapping depths to the nodes of the stage.
+        inputs: Flat list of the input `KerasTensor` instances.
+        outputs: Flat list of the output `KerasTensor` instances.
+    """
+
+    def __init__(self, index, nodes_by_depth, inputs, outputs):
+        self.index = index
+        self.inputs = inputs
+        self.outputs = outputs
+        operations = {}
+        for depth in sorted(nodes_by_depth.keys(), reverse=True):
+            for node in nodes_by_depth[depth]:
+                operations.setdefault(id(node.operation), node.operation)
+        self.operations = list(operations.values())
+        self._execution_plan = ExecutionPlan(inputs, outputs, nodes_by_depth)
+
+    @property
+    def layers(self):
+        return [op for op in self.operations if isinstance(op, Layer)]
+
+    @property
+    def trainable_variables(self):
+        return _unique_variables(
+            v for layer in self.layers for v in layer.trainable_variables
+        )
+
+    @property
+    def non_trainable_variables(self):
+        return _unique_variables(
+            v for layer in self.layers for v in layer.non_trainable_variables
+        )
+
+    def call(self, inputs, training=None):
+        """Computes the flat list of outputs from the flat list of inputs."""
+        if training is None:
+            return self._execution_plan.run(inputs)
+        return self._execution_plan.run(
+            inputs, operation_fn=lambda op: operation_fn(op, training=training)
+        )
+
+
+def build_pipeline_stages(model, stages):
+    """Splits the graph of a model into `PipelineStage` instances.
+
+    Args:
+        model: A built `Sequential` or `Functional` model.
+        stages: List of lists of layer names, one list per stage. The
+            operations which are not listed, e.g. layers without variables,
+            are placed in the last stage of their inputs.
+
+    Returns:
+        A list of `PipelineStage` instances.
+    """
+    functional = get_functional(model)
+    num_stages = len(stages)
+    operations_by_name = {op.name: op for op in functional.operations}
+    stage_of_operation = {}
+    for index, names in enumerate(stages):
+        for name in names:
+            if name not in operations_by_name:
+                raise ValueError(
+                    f"Layer '{name}' of stage {index} is not in the model. "
+                    f"Available layers: {list(operations_by_name.keys())}"
+                )
+            operation = operations_by_name[name]
+            if id(operation) in stage_of_operation:
+                raise ValueError(
+                    f"Layer '{name}' is assigned to several stages."
+                )
+            stage_of_operation[id(operation)] = index
+
+    # Assign the nodes to the stages, and record the stage producing each
+    # tensor. The inputs of the model are produced "before" the first stage.
+    tensors = list(functional.inputs)
+    producers = {id(x): -1 for x in functional.inputs}
+    last_consumers = {}
+    nodes_by_depth = [{} for _ in range(num_stages)]
+    for depth in sorted(functional._nodes_by_depth.keys(), reverse=True):
+        for node in functional._nodes_by_depth[depth]:
+            if node.is_input:
+                continue
+            input_stage = max(
+                (producers[id(x)] for x in node.input_tensors), default=0
+            )
+            stage = stage_of_operation.get(id(node.operation))
+            if stage is None:
+                stage = max(input_stage, 0)
+            elif stage < input_stage:
+                raise ValueError(
+                    f"Layer '{node.operation.name}' is assigned to stage "
+                    f"{stage}, but it consumes outputs of stage "
+                    f"{input_stage}. The stages must follow the order of the "
+                    "layers in the graph of the model."
+                )
+            nodes_by_depth[stage].setdefault(depth, []).append(node)
+            for x in node.input_tensors:
+                last_consumers[id(x)] = max(
+                    last_consumers.get(id(x), -1), stage
+                )
+            for x in node.outputs:
+                producers[id(x)] = stage
+                tensors.append(x)
+    for x in functional.outputs:
+        last_consumers[id(x)] = num_stages
+
+    pipeline_stages = []
+    inputs = list(functional.inputs)
+    for index in range(num_stages):
+        if not nodes_by_depth[index]:
+            raise ValueError(
+                f"Stage {index} is empty. Every stage must contain at least "
+                "one layer."
+            )
+        if index == num_stages - 1:
+            outputs = list(functional.outputs)
+        else:
+            # Tensors produced so far which are still needed afterwards.
+            outputs = [
+                x
+                for x in tensors
+                if producers[id(x)] <= index < last_consumers.get(id(x), -1)
+            ]
+        pipeline_stages.append(
+            PipelineStage(index, nodes_by_depth[index], inputs, outputs)
+        )
+        inputs = outputs
+    return pipeline_stages
+
+
+def pipeline_schedule(schedule, num_stages, num_microbatches):
+    """Returns the order in which the tasks of a training step are run.
+
+    With `"gpipe"`, every stage runs the forward passes of all the
+    microbatches, then their backward passes. With `"1f1b"`, a stage runs
+    as many forward passes as there are stages after it, then alternates
+    between one forward and one backward pass, so that fewer microbatches
+    are in flight, and fewer activations are kept in memory.
+
+    The forward and backward passes of the last stage are fused: there is
+    no wait between them, so the last stage only has `"forward"` tasks.
+
+    Args:
+        schedule: One of `"gpipe"` and `"1f1b"`.
+        num_stages: Integer, the number of stages.
+        num_microbatches: Integer, the number of microbatches.
+
+    Returns:
+        A list of `(kind, stage, microbatch)` tuples, where `kind` is
+        `"forward"` or `"backward"`, in an order which respects the
+        dependencies between the stages.
+    """
+    stage_tasks = []
+    for stage in range(num_stages):
+        forwards = [("forward", m) for m in range(num_microbatches)]
+        backwards = [("backward", m) for m in range(num_microbatches)]
+        if stage == num_stages - 1:
+            tasks = forwards
+        elif schedule == "gpipe":
+            tasks = forwards + backwards
+        elif schedule == "1f1b":
+            num_warmup = min(num_stages - stage - 1, num_microbatches)
+            tasks = forwards[:num_warmup]
+            for m in range(num_microbatches):
+                if num_warmup + m < num_microbatches:
+                    tasks.append(forwards[num_warmup + m])
+                tasks.append(backwards[m])
+        else:
+            raise ValueError(
+                "Argument `schedule` must be one of 'gpipe' or '1f1b'. "
+                f"Received: schedule={schedule}"
+            )
+        stage_tasks.append(tasks)
+
+    # Interleave the tasks of the stages, each waiting for its inputs.
+    order = []
+    done = set()
+    positions = [0] * num_stages
+    num_tasks = sum(len(tasks) for tasks in stage_tasks)
+    while len(order) < num_tasks:
+        for stage, tasks in enumerate(stage_tasks):
+            if positions[stage] == len(tasks):
+                continue
+            kind, m = tasks[positions[stage]]
+            if kind == "forward":
+                dependency = ("forward", stage - 1, m) if stage else None
+            elif stage == num_stages - 2:
+                dependency = ("forward", stage + 1, m)
+            else:
+                dependency = ("backward", stage + 1, m)
+            if dependency is None or dependency in done:
+                order.append((kind, stage, m))
+                done.add((kind, stage, m))
+                positions[stage] += 1
+    return order
+
+
+def get_functional(model):
+    """Returns the `Functional` holding the graph of a model."""
+    if isinstance(model, Sequential):
+        functional = model._functional
+    elif isinstance(model, Functional):
+        functional = model
+    else:
+        raise ValueError(
+            "Only `Sequential` and `Functional` models can be split into "
+            f"pipeline stages. Received: model={model} of type {type(model)}"
+        )
+    if functional is None or not model.built:
+        raise ValueError(
+            "The model must be built with a known input shape to be split "
+            "into pipeline stages, e.g. by starting it with a `keras.Input`."
+        )
+    return functional
+
+
+def is_differentiable(x):
+    """Whether gradients are passed back through a tensor between stages."""
+    return backend.is_float_dtype(x.dtype)
+
+
+def _count_params(operation):
+    if not isinstance(operation, Layer):
+        return 0
+    return sum(math.prod(v.shape) for v in operation.weights)
+
+
+def _split_costs(costs, num_parts):
+    """Cuts `costs` into contiguous parts minimizing the largest total.
+
+    Returns a list of booleans, true for the last element of each part.
+    """
+
+    def count_parts(capacity):
+        count, total = 1, 0
+        for cost in costs:
+            if total + cost > capacity:
+                count, total = count + 1, 0
+            total += cost
+        return count
+
+    # Binary search of the smallest feasible capacity.
+    low, high = max(costs), sum(costs)
+    while low < high:
+        middle = (low + high) // 2
+        if count_parts(middle) <= num_parts:
+            high = middle
+        else:
+            low = middle + 1
+
+    ends = [False] * len(costs)
+    num_ends, total = 0, 0
+    for i, cost in enumerate(costs):
+        total += cost
+        if i == len(costs) - 1 or num_ends == num_parts - 1:
+            continue
+        # Leave at least one element for each of the remaining parts.
+        remaining_parts = num_parts - num_ends - 1
+        if total + costs[i + 1] > low or len(costs) - i - 1 == remaining_parts:
+            ends[i] = True
+            num_ends, total = num_ends + 1, 0
+    ends[-1] = True
+    return ends
+
+
+def _unique_variables(variables):
+    unique = {}
+    for v in variables:
+        unique.setdefault(id(v), v)
+    return list(unique.values())
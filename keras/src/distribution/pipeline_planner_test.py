@@ -0,0 +1,299 @@
+"""Test for pipeline_planner.py."""
+
+import os
+
+import numpy as np
+import pytest
+
+from keras.src import backend
+from keras.src import layers
+from keras.src import models
+from keras.src import testing
+from keras.src.distribution import distribution_lib
+from keras.src.distribution import pipeline_planner
+
+if backend.backend() == "jax":
+    # Due to https://github.com/google/jax/issues/17188, we can't
+    # override the XLA flag after the JAX back init. We have to
+    # run this at top level to let JAX pick the flag value.
+    xla_flags = os.getenv("XLA_FLAGS") or ""
+    # Don't override user-specified device count, or other XLA flags.
+    if "xla_force_host_platform_device_count" not in xla_flags:
+        os.environ["XLA_FLAGS"] = (
+            xla_flags + " --xla_force_host_platform_device_count=8"
+        )
+
+
+def create_residual_model():
+    inputs = layers.Input((4,))
+    x1 = layers.Dense(8, name="d1")(inputs)
+    x2 = layers.Dense(8, activation="relu", name="d2")(x1)
+    x = layers.Add(name="add")([x1, x2])
+    outputs = layers.Dense(2, name="d3")(x)
+    return models.Model(inputs, outputs)
+
+
+class PartitionStagesTest(testing.TestCase):
+    def test_balances_parameters(self):
+        model = models.Sequential(
+            [
+                layers.Input((8,)),
+                layers.Dense(64, name="d1"),
+                layers.Dense(64, name="d2"),
+                layers.Activation("relu", name="relu"),
+                layers.Dense(64, name="d3"),
+                layers.Dense(8, name="d4"),
+            ]
+        )
+        self.assertEqual(
+            pipeline_planner.partition_stages(model, 2),
+            [["d1", "d2", "relu"], ["d3", "d4"]],
+        )
+        self.assertEqual(
+            pipeline_planner.partition_stages(model, 5),
+            [["d1"], ["d2"], ["relu"], ["d3"], ["d4"]],
+        )
+        self.assertEqual(
+            pipeline_planner.partition_stages(model, 1),
+            [["d1", "d2", "relu", "d3", "d4"]],
+        )
+
+    def test_validation(self):
+        model = create_residual_model()
+        with self.assertRaisesRegex(ValueError, "at least 1"):
+            pipeline_planner.partition_stages(model, 0)
+        with self.assertRaisesRegex(ValueError, "into 5 stages"):
+            pipeline_planner.partition_stages(model, 5)
+        with self.assertRaisesRegex(ValueError, "must be built"):
+            pipeline_planner.partition_stages(
+                models.Sequential([layers.Dense(2)]), 1
+            )
+        with self.assertRaisesRegex(ValueError, "Only `Sequential`"):
+            pipeline_planner.partition_stages(layers.Dense(2), 1)
+
+
+class BuildPipelineStagesTest(testing.TestCase):
+    def test_boundaries(self):
+        model = create_residual_model()
+        x1 = model.get_layer("d1").output
+        x2 = model.get_layer("d2").output
+        x = model.get_layer("add").output
+
+        # "add" isn't listed and is placed in the stage of "d2".
+        stages = pipeline_planner.build_pipeline_stages(
+            model, [["d1"], ["d2"], ["d3"]]
+        )
+        self.assertEqual([stage.index for stage in stages], [0, 1, 2])
+        self.assertEqual(stages[0].inputs, model.inputs)
+        self.assertEqual(stages[0].outputs, [x1])
+        self.assertEqual(
+            [layer.name for layer in stages[1].layers], ["d2", "add"]
+        )
+        self.assertEqual(stages[1].inputs, [x1])
+        self.assertEqual(stages[1].outputs, [x])
+        self.assertEqual(stages[2].outputs, model.outputs)
+        self.assertEqual(
+            stages[1].trainable_variables,
+            model.get_layer("d2").trainable_variables,
+        )
+
+        # `x1` passes through the second stage.
+        stages = pipeline_planner.build_pipeline_stages(
+            model, [["d1"], ["d2"], ["add", "d3"]]
+        )
+        self.assertEqual(stages[1].outputs, [x1, x2])
+        self.assertEqual(stages[2].inputs, [x1, x2])
+
+        inputs = np.random.normal(size=(3, 4)).astype("float32")
+        outputs = [inputs]
+        for stage in stages:
+            outputs = stage.call(outputs)
+        self.assertAllClose(outputs[0], model(inputs))
+
+    def test_validation(self):
+        model = create_residual_model()
+        with self.assertRaisesRegex(ValueError, "is not in the model"):
+            pipeline_planner.build_pipeline_stages(model, [["d1"], ["d4"]])
+        with self.assertRaisesRegex(ValueError, "several stages"):
+            pipeline_planner.build_pipeline_stages(
+                model, [["d1", "d2"], ["d2"]]
+            )
+        with self.assertRaisesRegex(ValueError, "must follow the order"):
+            pipeline_planner.build_pipeline_stages(model, [["d2"], ["d1"]])
+        with self.assertRaisesRegex(ValueError, "Stage 1 is empty"):
+            pipeline_planner.build_pipeline_stages(
+                model, [["d1", "d2", "add", "d3"], []]
+            )
+
+
+class PipelineScheduleTest(testing.TestCase):
+    def test_gpipe(self):
+        self.assertEqual(
+            pipeline_planner.pipeline_schedule("gpipe", 2, 2),
+            [
+                ("forward", 0, 0),
+                ("forward", 1, 0),
+                ("forward", 0, 1),
+                ("forward", 1, 1),
+                ("backward", 0, 0),
+                ("backward", 0, 1),
+            ],
+        )
+
+    def test_1f1b(self):
+        self.assertEqual(
+            pipeline_planner.pipeline_schedule("1f1b", 3, 3),
+            [
+                ("forward", 0, 0),
+                ("forward", 1, 0),
+                ("forward", 2, 0),
+                ("forward", 0, 1),
+                ("forward", 1, 1),
+                ("forward", 2, 1),
+                ("forward", 0, 2),
+                ("backward", 1, 0),
+                ("backward", 0, 0),
+                ("forward", 1, 2),
+                ("forward", 2, 2),
+                ("backward", 1, 1),
+                ("backward", 0, 1),
+                ("backward", 1, 2),
+                ("backward", 0, 2),
+            ],
+        )
+
+    def test_invalid_schedule(self):
+        with self.assertRaisesRegex(ValueError, "`schedule`"):
+            pipeline_planner.pipeline_schedule("interleaved", 2, 2)
+
+
+@pytest.mark.skipif(
+    backend.backend() != "jax",
+    reason="Only JAX implements pipeline parallelism",
+)
+class PipelineParallelTest(testing.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.device_mesh = distribution_lib.DeviceMesh(
+            (4, 2), ["pipeline", "batch"], [f"cpu:{i}" for i in range(8)]
+        )
+
+    def test_e2e_matches_training_without_pipeline(self):
+        def create_model():
+            return models.Sequential(
+                [
+                    layers.Input((4,)),
+                    layers.Dense(8, activation="relu", name="d1"),
+                    layers.Dense(8, activation="relu", name="d2"),
+                    layers.Dense(8, activation="relu", name="d3"),
+                    layers.Dense(1, name="d4"),
+                ]
+            )
+
+        x = np.random.normal(size=(16, 4)).astype("float32")
+        y = np.random.normal(size=(16, 1)).astype("float32")
+        reference = create_model()
+        weights = reference.get_weights()
+        reference.compile(loss="mse", optimizer="adam")
+        reference_history = reference.fit(
+            x, y, batch_size=16, epochs=2, shuffle=False, verbose=0
+        )
+
+        stages = pipeline_planner.partition_stages(create_model(), 4)
+        self.assertEqual(stages, [["d1"], ["d2"], ["d3"], ["d4"]])
+        distribution = distribution_lib.PipelineParallel(
+            self.device_mesh,
+            stages=stages,
+            num_microbatches=4,
+            record_stage_timings=True,
+        )
+        with distribution.scope():
+            model = create_model()
+            model.set_weights(weights)
+            model.compile(loss="mse", optimizer="adam")
+            history = model.fit(
+                x, y, batch_size=16, epochs=2, shuffle=False, verbose=0
+            )
+
+        for stage, layer in enumerate(model.layers):
+            for weight in layer.weights:
+                devices = {d.id for d in weight.value.sharding.device_set}
+                self.assertEqual(devices, {2 * stage, 2 * stage + 1})
+        self.assertAllClose(
+            history.history["loss"], reference_history.history["loss"]
+        )
+        for weight, reference_weight in zip(
+            model.get_weights(), reference.get_weights()
+        ):
+            self.assertAllClose(weight, reference_weight, atol=1e-5)
+        with distribution.scope():
+            self.assertAllClose(
+                model.evaluate(x, y, batch_size=16, verbose=0),
+                reference.evaluate(x, y, batch_size=16, verbose=0),
+            )
+            self.assertAllClose(
+                model.predict(x, batch_size=16, verbose=0),
+                reference.predict(x, batch_size=16, verbose=0),
+                atol=1e-5,
+            )
+
+        timings = distribution.get_stage_timings()
+        self.assertLen(timings, 4)
+        for stage_timings in timings:
+            self.assertGreater(stage_timings["backward"], 0.0)
+            self.assertGreater(stage_timings["update"], 0.0)
+
+    def test_e2e_automatic_stages(self):
+        distribution = distribution_lib.PipelineParallel(
+            self.device_mesh, num_microbatches=2, schedule="gpipe"
+        )
+        x = np.random.normal(size=(8, 4)).astype("float32")
+        y = np.random.normal(size=(8, 2)).astype("float32")
+        with distribution.scope():
+            model = create_residual_model()
+            model.compile(loss="mse", optimizer="sgd")
+            model.fit(x, y, batch_size=4, verbose=0)
+            outputs = model.predict(x, batch_size=4, verbose=0)
+        self.assertEqual(outputs.shape, (8, 2))
+
+        devices = {
+            d.id for d in model.get_layer("d3").kernel.value.sharding.device_set
+        }
+        self.assertEqual(devices, {6, 7})
+
+    def test_step_functions_follow_distribution(self):
+        distribution = distribution_lib.PipelineParallel(
+            self.device_mesh, num_microbatches=2
+        )
+        x = np.random.normal(size=(8, 4)).astype("float32")
+        y = np.random.normal(size=(8, 2)).astype("float32")
+        with distribution.scope():
+            model = create_residual_model()
+            model.compile(loss="mse", optimizer="sgd")
+            model.fit(x, y, batch_size=4, verbose=0)
+        pipeline_function = model.train_function
+
+        # The step functions capture the pipeline of the distribution.
+        with distribution_lib.PipelineParallel(
+            self.device_mesh, num_microbatches=4
+        ).scope():
+            model.fit(x, y, batch_size=4, verbose=0)
+        self.assertIsNot(model.train_function, pipeline_function)
+        with distribution.scope():
+            model.fit(x, y, batch_size=4, verbose=0)
+        self.assertIs(model.train_function, pipeline_function)
+
+    def test_overridden_train_step(self):
+        class CustomModel(models.Sequential):
+            def train_step(self, state, data):
+                return super().train_step(state, data)
+
+        distribution = distribution_lib.PipelineParallel(self.device_mesh)
+        with distribution.scope():
+            model = CustomModel(
+                [layers.Input((4,))]
+                + [layers.Dense(2, name=f"d{i}") for i in range(4)]
+            )
+            model.compile(loss="mse")
+            with self.assertRaisesRegex(ValueError, "overriding"):
+                model.fit(np.ones((8, 4)), np.ones((8, 2)), verbose=0)
@@ -305,6 +305,8 @@ class Layer(BackendLayer, Operation, KerasSaveable):
         ]
         self._call_has_training_arg = "training" in call_signature_parameters
         self._call_has_mask_arg = "mask" in call_signature_parameters
+        # Dict mapping call patterns to `FastCallSpec`s, see `__call__()`.
+        self._fast_call_specs = None
 
         self._supports_masking = not utils.is_default(self.compute_mask)
         # Whether to automatically convert (+ auto-cast) inputs to `call()`.
@@ -777,7 +779,127 @@ class Layer(BackendLayer, Operation, KerasSaveable):
     @traceback_utils.filter_traceback
     def __call__(self, *args, **kwargs):
         self._check_super_called()
-        self._called = True
+        if not self._called:
+            # Avoid the cost of tracking the attribute on every call.
+            self._called = True
+
+        # Fast path for the most common call pattern of built layers: a single
+        # tensor which needs no conversion, and possibly `training`. What
+        # steps 1 to 6 would infer from such a call only depends on the call
+        # pattern, so it is cached by the first call with this pattern.
+        call_pattern = None
+        fast_call_spec = None
+        if (
+            self.built
+            and len(args) == 1
+            and (not kwargs or (len(kwargs) == 1 and "training" in kwargs))
+            and backend.is_tensor(args[0])
+            and (
+                not self._convert_input_args
+                or backend.standardize_dtype(args[0].dtype) == self.input_dtype
+            )
+        ):
+            call_pattern = tuple(kwargs)
+            if self._fast_call_specs is not None:
+                fast_call_spec = self._fast_call_specs.get(call_pattern)
+
+        if fast_call_spec is not None:
+            first_arg = args[0]
+            self._assert_input_compatibility(first_arg)
+            call_context = self._get_call_context()
+            training = kwargs.get("training", None)
+            if training is None:
+                training = call_context.training
+                if training is None:
+                    training = fast_call_spec.training_default
+            call_context.training = training
+            if self._call_has_training_arg and training is not None:
+                kwargs["training"] = training
+            previous_mask = backend.get_keras_mask(first_arg)
+            if fast_call_spec.populate_mask:
+                kwargs["mask"] = previous_mask
+        else:
+            args, kwargs, first_arg, previous_mask = self._prepare_call(
+                args, kwargs, call_pattern
+            )
+
+        ####################
+        # 7. Call the layer.
+        try:
+            with self._open_name_scope():
+                current_scope = backend.get_autocast_scope()
+                new_scope = None
+                if current_scope is not None:
+                    # Clear or update the current scope if necessary.
+                    if not self.autocast:
+                        new_scope = backend.AutocastScope(None)
+                    elif not backend.is_float_dtype(self.compute_dtype):
+                        # Some preprocessing layers might have a non-float
+                        # dtype, we should not autocast in this case.
+                        new_scope = backend.AutocastScope(None)
+                    elif current_scope.dtype != self.compute_dtype:
+                        new_scope = backend.AutocastScope(self.compute_dtype)
+                elif self.compute_dtype != self.variable_dtype:
+                    # Enter a new scope if our dtypes are "mixed".
+                    new_scope = backend.AutocastScope(self.compute_dtype)
+
+                if new_scope is not None:
+                    with new_scope:
+                        outputs = super().__call__(*args, **kwargs)
+                else:
+                    outputs = super().__call__(*args, **kwargs)
+                # Change the layout for the layer output if needed.
+                # This is useful for relayout intermediate tensor in the model
+                # to achieve the optimal performance.
+                distribution = distribution_lib.distribution()
+                if distribution is not None:
+                    current_layer_path = current_path()
+                    current_layer_path += "/output"
+                    layout = distribution.get_tensor_layout(current_layer_path)
+                    if layout:
+                        outputs = distribution_lib.distribute_tensor(
+                            outputs, layout
+                        )
+
+                if not self.built:
+                    self.built = True
+                # Record activity regularizer loss.
+                if self.activity_regularizer is not None:
+                    for output in tree.flatten(outputs):
+                        if backend.is_tensor(output):
+                            self.add_loss(self.activity_regularizer(output))
+
+            # Set `previous_mask` on outputs if available. It is provided only
+            # for the first positional input arg and its mask.
+            # TODO: consider extending this to all args and kwargs.
+            if self.supports_masking:
+                self._set_mask_metadata(first_arg, outputs, previous_mask)
+            elif any(m is not None for m in tree.flatten(previous_mask)):
+                warnings.warn(
+                    f"Layer '{self.name}' (of type {self.__class__.__name__}) "
+                    "was passed an input with a mask attached to it. "
+                    "However, this layer does not support masking and will "
+                    "therefore destroy the mask information. Downstream "
+                    "layers will not see the mask."
+                )
+        finally:
+            # Destroy call context if we created it
+            self._maybe_reset_call_context()
+        return outputs
+
+    def _prepare_call(self, args, kwargs, call_pattern=None):
+        """Standardizes the arguments of `__call__()` and builds the layer.
+
+        Args:
+            args: Positional arguments passed to `__call__()`.
+            kwargs: Keyword arguments passed to `__call__()`.
+            call_pattern: If not `None`, the key under which to cache a
+                `FastCallSpec` for the subsequent calls with the same pattern.
+
+        Returns:
+            A tuple `(args, kwargs, first_arg, previous_mask)`, with the
+            arguments to pass to `call()`, the first argument, and its mask.
+        """
 
         #####################################
         # 1. Convert any array arguments to tensors of correct dtype.
@@ -878,71 +1000,29 @@ class Layer(BackendLayer, Operation, KerasSaveable):
             backend.get_keras_mask, call_spec.first_arg
         )
 
-        ####################
-        # 7. Call the layer.
-        try:
-            with self._open_name_scope():
-                current_scope = backend.get_autocast_scope()
-                new_scope = None
-                if current_scope is not None:
-                    # Clear or update the current scope if necessary.
-                    if not self.autocast:
-                        new_scope = backend.AutocastScope(None)
-                    elif not backend.is_float_dtype(self.compute_dtype):
-                        # Some preprocessing layers might have a non-float
-                        # dtype, we should not autocast in this case.
-                        new_scope = backend.AutocastScope(None)
-                    elif current_scope.dtype != self.compute_dtype:
-                        new_scope = backend.AutocastScope(self.compute_dtype)
-                elif self.compute_dtype != self.variable_dtype:
-                    # Enter a new scope if our dtypes are "mixed".
-                    new_scope = backend.AutocastScope(self.compute_dtype)
-
-                if new_scope is not None:
-                    with new_scope:
-                        outputs = super().__call__(*args, **kwargs)
-                else:
-                    outputs = super().__call__(*args, **kwargs)
-                # Change the layout for the layer output if needed.
-                # This is useful for relayout intermediate tensor in the model
-                # to achieve the optimal performance.
-                distribution = distribution_lib.distribution()
-                if distribution is not None:
-                    current_layer_path = current_path()
-                    current_layer_path += "/output"
-                    layout = distribution.get_tensor_layout(current_layer_path)
-                    if layout:
-                        outputs = distribution_lib.distribute_tensor(
-                            outputs, layout
-                        )
-
-                if not self.built:
-                    self.built = True
-                # Record activity regularizer loss.
-                if self.activity_regularizer is not None:
-                    for output in tree.flatten(outputs):
-                        if backend.is_tensor(output):
-                            self.add_loss(self.activity_regularizer(output))
+        if call_pattern is not None:
+            self._cache_fast_call_spec(call_pattern, call_spec)
+        return args, kwargs, call_spec.first_arg, previous_mask
 
-            # Set `previous_mask` on outputs if available. It is provided only
-            # for the first positional input arg and its mask.
-            # TODO: consider extending this to all args and kwargs.
-            if self.supports_masking:
-                self._set_mask_metadata(
-                    call_spec.first_arg, outputs, previous_mask
-                )
-            elif any(m is not None for m in tree.flatten(previous_mask)):
-                warnings.warn(
-                    f"Layer '{self.name}' (of type {self.__class__.__name__}) "
-                    "was passed an input with a mask attached to it. "
-                    "However, this layer does not support masking and will "
-                    "therefore destroy the mask information. Downstream "
-                    "layers will not see the mask."
-                )
-        finally:
-            # Destroy call context if we created it
-            self._maybe_reset_call_context()
-        return outputs
+    @tracking.no_automatic_dependency_tracking
+    def _cache_fast_call_spec(self, call_pattern, call_spec):
+        if len(call_spec.tensor_arguments_dict) > 1:
+            # Masks would be populated for the tensor default values too.
+            return
+        # An explicit `training=None` is not replaced by the default value.
+        training_default = None
+        if "training" not in call_pattern:
+            training_default = call_spec.arguments_dict.get("training", None)
+        populate_mask = (
+            len(call_spec.tensor_arguments_dict) == 1
+            and "mask" in call_spec.argument_names
+            and call_spec.arguments_dict["mask"] is None
+        )
+        if self._fast_call_specs is None:
+            self._fast_call_specs = {}
+        self._fast_call_specs[call_pattern] = FastCallSpec(
+            training_default, populate_mask
+        )
 
     def call(self, *args, **kwargs):
         raise self._not_implemented_error(self.call)
@@ -1508,6 +1588,9 @@ class Layer(BackendLayer, Operation, KerasSaveable):
         return layers
 
     def _set_mask_metadata(self, inputs, outputs, previous_mask):
+        if previous_mask is None and utils.is_default(self.compute_mask):
+            # The default `compute_mask()` would return `None`.
+            return
         flat_outputs = tree.flatten(outputs)
 
         mask_already_computed = all(
@@ -1617,6 +1700,21 @@ class CallSpec:
             self.eager = False
 
 
+class FastCallSpec:
+    """What `Layer.__call__()` infers from the arguments of a call pattern.
+
+    Args:
+        training_default: Value of `training` when it is neither passed nor
+            set by an outer layer.
+        populate_mask: Whether the mask of the first argument is passed as
+            `mask`.
+    """
+
+    def __init__(self, training_default, populate_mask):
+        self.training_default = training_default
+        self.populate_mask = populate_mask
+
+
 def get_arguments_dict(fn, args, kwargs):
     """Return a dict mapping argument names to their values."""
     sig = inspect.signature(fn)
@@ -452,6 +452,79 @@ class LayerTest(testing.TestCase):
         y = layer(x)
         self.assertEqual(ops.min(y), 1)
 
+    def test_fast_call_path(self):
+        calls = []
+
+        class RecordingLayer(layers.Layer):
+            def call(self, x, training=True):
+                calls.append(training)
+                return x
+
+        class OuterLayer(layers.Layer):
+            def __init__(self, inner):
+                super().__init__()
+                self.inner = inner
+
+            def call(self, x, training=None):
+                return self.inner(x)
+
+        layer = RecordingLayer()
+        x = ops.ones((2, 3))
+        for _ in range(3):
+            self.assertIs(layer(x), x)
+        self.assertEqual(calls, [True] * 3)
+        self.assertEqual(list(layer._fast_call_specs), [()])
+
+        # Each call pattern gets its own spec.
+        calls.clear()
+        layer(x, training=False)
+        layer(x, training=False)
+        # An explicit `training=None` is passed through unchanged.
+        layer(x, training=None)
+        self.assertEqual(calls, [False, False, None])
+        self.assertEqual(set(layer._fast_call_specs), {(), ("training",)})
+
+        # The value of `training` set by an outer layer is still used.
+        outer = OuterLayer(layer)
+        calls.clear()
+        outer(x, training=False)
+        outer(x, training=False)
+        outer(x)
+        self.assertEqual(calls, [False, False, True])
+
+        # Other patterns, or inputs which need a conversion, are not cached.
+        layer(np.ones((2, 3)))
+        layer(ops.ones((2, 3), dtype="int32"))
+        self.assertEqual(set(layer._fast_call_specs), {(), ("training",)})
+
+    @pytest.mark.skipif(
+        backend.backend() == "numpy", reason="masking not supported with numpy"
+    )
+    def test_fast_call_path_masking(self):
+        masks = []
+
+        class MaskedLayer(layers.Layer):
+            def __init__(self):
+                super().__init__()
+                self.supports_masking = True
+
+            def call(self, x, mask=None):
+                masks.append(mask)
+                return x + 1
+
+        layer = MaskedLayer()
+        x = ops.ones((2, 3))
+        layer(x)
+        mask = ops.array([True, False])
+        for _ in range(2):
+            x = ops.ones((2, 3))
+            backend.set_keras_mask(x, mask)
+            y = layer(x)
+            self.assertIs(backend.get_keras_mask(y), mask)
+        self.assertIsNone(masks[0])
+        self.assertIs(masks[1], mask)
+        self.assertIs(masks[2], mask)
+
     @pytest.mark.skipif(
         backend.backend() == "torch",
         reason="Some torch ops not implemented for float16 on CPU.",
@@ -179,9 +179,14 @@ class Functional(Function, Model):
             for x, mask in zip(inputs, masks):
                 if mask is not None:
                     backend.set_keras_mask(x, mask)
-        outputs = self._run_through_graph(
-            inputs, operation_fn=lambda op: operation_fn(op, training=training)
-        )
+        if training is None:
+            # Operations are called as is, without a wrapper per node.
+            outputs = self._run_through_graph(inputs)
+        else:
+            outputs = self._run_through_graph(
+                inputs,
+                operation_fn=lambda op: operation_fn(op, training=training),
+            )
         return unpack_singleton(outputs)
 
     def compute_output_spec(self, inputs, training=None, mask=None):
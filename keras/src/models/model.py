@@ -311,17 +311,25 @@ class Model(Trainer, base_trainer.Trainer, Layer):
         )
 
     @traceback_utils.filter_traceback
-    def save_weights(self, filepath, overwrite=True):
+    def save_weights(self, filepath, overwrite=True, max_shard_size=None):
         """Saves all layer weights to a `.weights.h5` file.
 
         Args:
             filepath: `str` or `pathlib.Path` object.
-                Path where to save the model. Must end in `.weights.h5`.
+                Path where to save the model. Must end in `.weights.h5`,
+                or in `.weights.json` when `max_shard_size` is set.
             overwrite: Whether we should overwrite any existing model
                 at the target location, or instead ask the user
                 via an interactive prompt.
+            max_shard_size: Optional maximum size of the weights files, in
+                gigabytes. When set, the weights are split into
+                `.weights.h5` shards next to `filepath`, which indexes the
+                shard holding each variable. Defaults to `None`, which
+                saves all the weights to a single file.
         """
-        return saving_api.save_weights(self, filepath, overwrite=overwrite)
+        return saving_api.save_weights(
+            self, filepath, overwrite=overwrite, max_shard_size=max_shard_size
+        )
 
     @traceback_utils.filter_traceback
     def load_weights(self, filepath, skip_mismatch=False, **kwargs):
@@ -344,8 +352,8 @@ class Model(Trainer, base_trainer.Trainer, Layer):
 
         Args:
             filepath: String, path to the weights file to load.
-                It can either be a `.weights.h5` file
-                or a legacy `.h5` weights file.
+                It can either be a `.weights.h5` file, the `.weights.json`
+                index of sharded weights, or a legacy `.h5` weights file.
             skip_mismatch: Boolean, whether to skip loading of layers where
                 there is a mismatch in the number of weights, or a mismatch in
                 the shape of the weights.
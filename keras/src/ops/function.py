@@ -81,6 +81,7 @@ class Function(Operation):
         self._nodes_by_depth = nodes_by_depth
         self._operations = operations
         self._operations_by_depth = operations_by_depth
+        self._execution_plan = None
 
     @property
     def operations(self):
@@ -135,49 +136,24 @@ class Function(Operation):
     def call(self, inputs):
         """Computes output tensors for new inputs."""
         self._assert_input_compatibility(inputs)
-        return self._run_through_graph(inputs, operation_fn=lambda op: op)
+        return self._run_through_graph(inputs)
 
-    def _run_through_graph(self, inputs, operation_fn, call_fn=None):
+    def _run_through_graph(self, inputs, operation_fn=None, call_fn=None):
         """Execute the graph.
 
         At each node we compute outputs via
-        `operation_fn(node.operation)(*args, **kwargs)`.
+        `operation_fn(node.operation)(*args, **kwargs)`, or
+        `node.operation(*args, **kwargs)` if `operation_fn` is `None`.
         """
-        inputs = tree.flatten(inputs)
-
-        # Dictionary mapping reference tensors to computed tensors.
-        tensor_dict = {}
-        for x, y in zip(self.inputs, inputs):
-            tensor_dict[id(x)] = y
-
-        nodes_by_depth = self._nodes_by_depth
-        depth_keys = list(nodes_by_depth.keys())
-        depth_keys.sort(reverse=True)
-
-        for depth in depth_keys:
-            nodes = nodes_by_depth[depth]
-            for node in nodes:
-                if not node.operation or node.is_input:
-                    continue  # Input tensors already exist.
-
-                if any(id(x) not in tensor_dict for x in node.input_tensors):
-                    continue  # Node is not computable, try skipping.
-
-                args, kwargs = node.arguments.fill_in(tensor_dict)
-                op = operation_fn(node.operation)
-                if call_fn is not None:
-                    outputs = call_fn(op, *args, **kwargs)
-                else:
-                    outputs = op(*args, **kwargs)
-
-                # Update tensor_dict.
-                for x, y in zip(node.outputs, tree.flatten(outputs)):
-                    tensor_dict[id(x)] = y
-
-        output_tensors = []
-        for x in self.outputs:
-            output_tensors.append(tensor_dict[id(x)])
-
+        if self._execution_plan is None:
+            self._execution_plan = ExecutionPlan(
+                self.inputs, self.outputs, self._nodes_by_depth
+            )
+        output_tensors = self._execution_plan.run(
+            tree.flatten(inputs), operation_fn=operation_fn, call_fn=call_fn
+        )
+        if isinstance(self._outputs_struct, KerasTensor):
+            return output_tensors[0]
         return tree.pack_sequence_as(self._outputs_struct, output_tensors)
 
     def _assert_input_compatibility(self, inputs):
@@ -208,6 +184,149 @@ class Function(Operation):
                         )
 
 
+class ExecutionPlan:
+    """Graph of operations compiled into a flat list of instructions.
+
+    Walking the graph node by node, and mapping the `KerasTensor` instances
+    to their values through a dict, costs more than the operations
+    themselves for small inputs. Instead, every tensor of the graph is
+    assigned an index in a list of values (a "slot"), and every node becomes
+    an instruction that reads its arguments from the slots of its inputs and
+    writes its outputs to its own slots. Running the graph is then a single
+    loop over the instructions.
+
+    Args:
+        inputs: Flat list of the input `KerasTensor` instances.
+        outputs: Flat list of the output `KerasTensor` instances.
+        nodes_by_depth: Dict mapping depths to lists of `Node` instances, as
+            returned by `map_graph()`.
+    """
+
+    def __init__(self, inputs, outputs, nodes_by_depth):
+        slots = {}
+        for x in inputs:
+            slots.setdefault(id(x), len(slots))
+        self.input_slots = [slots[id(x)] for x in inputs]
+
+        self.instructions = []
+        for depth in sorted(nodes_by_depth.keys(), reverse=True):
+            for node in nodes_by_depth[depth]:
+                if not node.operation or node.is_input:
+                    continue  # Input tensors already exist.
+                if any(id(x) not in slots for x in node.input_tensors):
+                    continue  # Node is not computable, try skipping.
+                self.instructions.append(_make_instruction(node, slots))
+
+        self.num_slots = len(slots)
+        self.output_slots = [slots[id(x)] for x in outputs]
+
+    def run(self, inputs, operation_fn=None, call_fn=None):
+        """Runs the instructions on a flat list of `inputs`.
+
+        Returns:
+            The flat list of the values of the outputs.
+        """
+        values = [_MISSING] * self.num_slots
+        for slot, value in zip(self.input_slots, inputs):
+            values[slot] = value
+        # Slots can only be left missing when fewer inputs are passed than
+        # expected, or when an operation returns fewer outputs than it did
+        # when the graph was built.
+        incomplete = len(inputs) < len(self.input_slots)
+
+        for (
+            operation,
+            kind,
+            input_slots,
+            arguments_struct,
+            flat_arguments,
+            argument_positions,
+            output_slots,
+        ) in self.instructions:
+            if incomplete and any(
+                values[slot] is _MISSING for slot in input_slots
+            ):
+                continue  # Node is not computable, try skipping.
+
+            if kind is _SINGLE_TENSOR:
+                args, kwargs = (values[input_slots[0]],), {}
+            elif kind is _TENSOR_SEQUENCE:
+                # `arguments_struct` is the type of the sequence.
+                args = (arguments_struct([values[i] for i in input_slots]),)
+                kwargs = {}
+            else:
+                flat_arguments = flat_arguments[:]
+                for position, slot in argument_positions:
+                    flat_arguments[position] = values[slot]
+                args, kwargs = tree.pack_sequence_as(
+                    arguments_struct, flat_arguments
+                )
+
+            op = operation if operation_fn is None else operation_fn(operation)
+            if call_fn is not None:
+                outputs = call_fn(op, *args, **kwargs)
+            else:
+                outputs = op(*args, **kwargs)
+
+            if len(output_slots) == 1 and not isinstance(
+                outputs, (list, tuple, dict)
+            ):
+                values[output_slots[0]] = outputs
+            else:
+                outputs = tree.flatten(outputs)
+                for slot, value in zip(output_slots, outputs):
+                    values[slot] = value
+                if len(outputs) < len(output_slots):
+                    incomplete = True
+
+        return [values[slot] for slot in self.output_slots]
+
+
+# Value of the slots of the tensors which have not been computed.
+_MISSING = object()
+
+# Kinds of instructions, by how their arguments are built from the slots:
+# `op(x)`, `op([x1, x2, ...])`, or any other structure of arguments.
+_SINGLE_TENSOR = "single_tensor"
+_TENSOR_SEQUENCE = "tensor_sequence"
+_ANY_ARGUMENTS = "any_arguments"
+
+
+def _make_instruction(node, slots):
+    arguments = node.arguments
+    input_slots = [slots[id(x)] for x in node.input_tensors]
+    flat_arguments = list(arguments._flat_arguments)
+    argument_positions = [
+        (position, slots[id(x)])
+        for position, x in enumerate(flat_arguments)
+        if isinstance(x, KerasTensor)
+    ]
+    arguments_struct = (arguments.args, arguments.kwargs)
+    if arguments._single_positional_tensor is not None:
+        kind = _SINGLE_TENSOR
+    elif (
+        len(arguments.args) == 1
+        and not arguments.kwargs
+        and type(arguments.args[0]) in (list, tuple)
+        and arguments.args[0]
+        and all(isinstance(x, KerasTensor) for x in arguments.args[0])
+    ):
+        kind = _TENSOR_SEQUENCE
+        arguments_struct = type(arguments.args[0])
+    else:
+        kind = _ANY_ARGUMENTS
+    output_slots = [slots.setdefault(id(x), len(slots)) for x in node.outputs]
+    return (
+        node.operation,
+        kind,
+        input_slots,
+        arguments_struct,
+        flat_arguments,
+        argument_positions,
+        output_slots,
+    )
+
+
 def make_node_key(op, node_index):
     return str(id(op)) + "_ib-" + str(node_index)
 
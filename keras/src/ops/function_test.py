@@ -142,3 +142,36 @@ class FunctionTest(testing.TestCase):
             ValueError, "`inputs` argument cannot be empty"
         ):
             _ = function.Function(inputs=[], outputs=x)
+
+    def test_execution_plan(self):
+        x1 = keras_tensor.KerasTensor((None, 3))
+        x2 = keras_tensor.KerasTensor((None, 3))
+        x = knp.add(x1, x2)
+        y = knp.concatenate([x, x1], axis=-1)
+        z = knp.sum(y, axis=-1, keepdims=True)
+        fn = function.Function(inputs=[x1, x2], outputs={"y": y, "z": z})
+        self.assertIsNone(fn._execution_plan)
+
+        x1_val = np.ones((2, 3))
+        x2_val = np.full((2, 3), 2.0)
+        out = fn([x1_val, x2_val])
+        self.assertAllClose(out["y"], np.concatenate([x1_val * 3, x1_val], -1))
+        self.assertAllClose(out["z"], np.full((2, 1), 12.0))
+
+        # The plan is built once, with one instruction per node.
+        plan = fn._execution_plan
+        self.assertIsInstance(plan, function.ExecutionPlan)
+        self.assertLen(plan.instructions, 3)
+        self.assertEqual(plan.input_slots, [0, 1])
+        self.assertEqual(plan.num_slots, 5)
+        out = fn([x2_val, x1_val])
+        self.assertIs(fn._execution_plan, plan)
+        self.assertAllClose(out["z"], np.full((2, 1), 15.0))
+
+        # The plan is shared by symbolic calls.
+        out = fn.compute_output_spec(
+            [keras_tensor.KerasTensor((4, 3)), keras_tensor.KerasTensor((4, 3))]
+        )
+        self.assertEqual(out["y"].shape, (4, 6))
+        self.assertEqual(out["z"].shape, (4, 1))
+        self.assertIs(fn._execution_plan, plan)
@@ -30,28 +30,33 @@ class Operation:
 
     @traceback_utils.filter_traceback
     def __call__(self, *args, **kwargs):
-        if traceback_utils.is_traceback_filtering_enabled():
-            # Wrap self.call to provide helpful info in case of exception
-            if any_symbolic_tensors(args, kwargs):
-                call_fn = self.symbolic_call
-            else:
-                if getattr(self, "quantization_mode", None) is not None:
-                    call_fn = self.quantized_call
-                else:
-                    call_fn = self.call
-            call_fn = traceback_utils.inject_argument_info_in_traceback(
-                call_fn,
-                object_name=(f"{self.__class__.__name__}.call()"),
-            )
-            return call_fn(*args, **kwargs)
-
-        # Plain flow.
         if any_symbolic_tensors(args, kwargs):
-            return self.symbolic_call(*args, **kwargs)
-        if getattr(self, "quantization_mode", None) is not None:
-            return self.quantized_call(*args, **kwargs)
+            call_fn = self.symbolic_call
+        elif getattr(self, "quantization_mode", None) is not None:
+            call_fn = self.quantized_call
         else:
-            return self.call(*args, **kwargs)
+            call_fn = self.call
+        if not traceback_utils.is_traceback_filtering_enabled():
+            # Plain flow.
+            return call_fn(*args, **kwargs)
+
+        # Provide helpful info in case of exception. This is equivalent to
+        # `traceback_utils.inject_argument_info_in_traceback()`, without
+        # the cost of creating a wrapper for every call.
+        new_e = None
+        try:
+            return call_fn(*args, **kwargs)
+        except Exception as e:
+            new_e = traceback_utils.inject_argument_info(
+                e,
+                call_fn,
+                args,
+                kwargs,
+                object_name=f"{self.__class__.__name__}.call()",
+            )
+            raise new_e.with_traceback(e.__traceback__) from None
+        finally:
+            del new_e
 
     def symbolic_call(self, *args, **kwargs):
         # Perform shape/dtype inference.
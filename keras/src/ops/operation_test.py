@@ -6,6 +6,7 @@ from keras.src import testing
 from keras.src.backend.common import keras_tensor
 from keras.src.ops import numpy as knp
 from keras.src.ops import operation
+from keras.src.utils import traceback_utils
 
 
 class OpWithMultipleInputs(operation.Operation):
@@ -145,6 +146,24 @@ class OperationTest(testing.TestCase):
         self.assertAllClose(out[0], np.ones((2, 3)))
         self.assertAllClose(out[1], np.ones((2, 3)) + 1)
 
+    def test_eager_call_error_argument_info(self):
+        class FailingOp(operation.Operation):
+            def call(self, x, axis=None):
+                raise ValueError("Failing op")
+
+        # The argument info is only added when traceback filtering is on,
+        # which `TestCase` turns off.
+        traceback_utils.enable_traceback_filtering()
+        self.addCleanup(traceback_utils.disable_traceback_filtering)
+        x = knp.ones((2, 3))
+        with self.assertRaisesRegex(ValueError, "Failing op") as e:
+            FailingOp()(x, axis=1)
+        message = str(e.exception)
+        self.assertIn(
+            "Exception encountered when calling FailingOp.call()", message
+        )
+        self.assertIn("axis=1", message)
+
     def test_serialization(self):
         op = OpWithMultipleOutputs(name="test_op")
         config = op.get_config()
@@ -1,9 +1,11 @@
 import collections
 import json
+import os
 import pprint
 import zipfile
 
 import h5py
+import ml_dtypes
 import numpy as np
 import rich.console
 
@@ -41,6 +43,13 @@ class KerasFileEditor:
     an old saved weights file after having made
     architecture changes to a model.
 
+    The weights are read lazily: the editor lists the weights of the file
+    as `LazyWeight` proxies, which only read their values when converted to
+    NumPy arrays, and `save()` copies the weights that were not replaced
+    directly from the opened file to the new one. The file is kept open
+    until `close()` is called, or until the end of a `with` block using
+    the editor.
+
     Args:
         filepath: The path to a local file to inspect and edit.
 
@@ -60,6 +69,9 @@ class KerasFileEditor:
 
     # Save the weights of the edited model
     editor.resave_weights("edited_model.weights.h5")
+
+    # Release the opened file
+    editor.close()
     ```
     """
 
@@ -72,9 +84,11 @@ class KerasFileEditor:
         self.config = None
         self.model = None
         self.console = rich.console.Console(highlight=False)
+        self._archive = None
 
         if filepath.endswith(".keras"):
             zf = zipfile.ZipFile(filepath, "r")
+            self._archive = zf
             weights_store = H5IOStore(
                 saving_lib._VARS_FNAME + ".h5",
                 archive=zf,
@@ -96,10 +110,11 @@ class KerasFileEditor:
                 f"Received: filepath={filepath}"
             )
 
+        # Keep the store open for the weights to be read on demand.
+        self._weights_store = weights_store
         weights_dict, object_metadata = self._extract_weights_from_store(
             weights_store.h5_file
         )
-        weights_store.close()
         self.weights_dict = weights_dict
         self.object_metadata = object_metadata  # {path: object_name}
         self.console.print(self._generate_filepath_info(rich_style=True))
@@ -111,11 +126,32 @@ class KerasFileEditor:
         """Prints the weight structure of the opened file."""
         self._weights_summary_cli()
 
+    def close(self):
+        """Closes the opened file.
+
+        The `LazyWeight` values of `weights_dict` cannot be read anymore
+        after closing the file.
+        """
+        if self._weights_store is not None:
+            self._weights_store.close()
+            self._weights_store = None
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.close()
+
     def compare(self, reference_model):
         """Compares the opened file to a reference model.
 
         This method will list all mismatches between the
         currently opened file and the provided reference model.
+        Only the shapes of the weights are compared, so the values
+        of the weights are not read from the file.
 
         Args:
             reference_model: Model instance to compare to.
@@ -414,9 +450,12 @@ class KerasFileEditor:
     def save(self, filepath):
         """Save the edited weights file.
 
+        The weights that were not replaced are copied from the opened file
+        to the new one by HDF5, without loading them in memory.
+
         Args:
             filepath: Path to save the file to.
-                Must be a `.weights.h5` file.
+                Must be a `.weights.h5` file, other than the opened one.
         """
         filepath = str(filepath)
         if not filepath.endswith(".weights.h5"):
@@ -425,6 +464,12 @@ class KerasFileEditor:
                 "expected a `.weights.h5` extension. "
                 f"Received: filepath={filepath}"
             )
+        if os.path.abspath(filepath) == os.path.abspath(str(self.filepath)):
+            raise ValueError(
+                "Invalid `filepath` argument: cannot overwrite the opened "
+                "file, whose weights are read on demand. "
+                f"Received: filepath={filepath}"
+            )
         weights_store = H5IOStore(filepath, mode="w")
 
         def _save(weights_dict, weights_store, inner_path):
@@ -443,7 +488,10 @@ class KerasFileEditor:
             if vars_to_create:
                 var_store = weights_store.make(inner_path)
                 for name, value in vars_to_create.items():
-                    var_store[name] = value
+                    if isinstance(value, LazyWeight):
+                        value.copy_to(var_store.group, name)
+                    else:
+                        var_store[name] = value
 
         _save(self.weights_dict, weights_store, inner_path="")
         weights_store.close()
@@ -480,7 +528,7 @@ class KerasFileEditor:
                         value, metadata=metadata, inner_path=inner_path
                     )
             else:
-                result[key] = value[()]
+                result[key] = LazyWeight(value)
         return result, metadata
 
     def _generate_filepath_info(self, rich_style=False):
@@ -576,7 +624,7 @@ class KerasFileEditor:
                         + f"<div style="
                         f'"margin-left: {margin_left}px;'
                         f'"margin-top: {margin_left}px;">'
-                        + f"{display_weight(value)}"
+                        + f"{display_weight(np.asarray(value))}"
                         + "</div>"
                         + "</details>"
                     )
@@ -589,6 +637,93 @@ class KerasFileEditor:
         ipython.display.display(ipython.display.HTML(output))
 
 
+class LazyWeight(np.lib.mixins.NDArrayOperatorsMixin):
+    """Weight of a `KerasFileEditor` file, read on demand.
+
+    The shape and dtype are available without reading the weight. The
+    values are read when converting the weight to a NumPy array, e.g. with
+    `np.asarray(weight)`, and slices of the weight can be read by indexing
+    it, e.g. `weight[:10]`, which only reads the requested values.
+
+    Otherwise, the weight behaves like the NumPy array of its values:
+    operators, NumPy functions and array methods or attributes read the
+    whole weight, e.g. `weight * 2`, `np.mean(weight)` or `weight.T`.
+
+    Args:
+        dataset: The `h5py.Dataset` holding the weight.
+    """
+
+    def __init__(self, dataset):
+        self.dataset = dataset
+
+    @property
+    def shape(self):
+        return self.dataset.shape
+
+    @property
+    def dtype(self):
+        if self.dataset.attrs.get("dtype") == "bfloat16":
+            return np.dtype(ml_dtypes.bfloat16)
+        return self.dataset.dtype
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def size(self):
+        return self.dataset.size
+
+    @property
+    def nbytes(self):
+        return self.size * self.dtype.itemsize
+
+    def numpy(self):
+        """Reads the weight as a NumPy array."""
+        return self[()]
+
+    def copy_to(self, group, name):
+        """Copies the weight to `group[name]` without reading it."""
+        group.copy(self.dataset, group, name=name)
+
+    def __getitem__(self, key):
+        value = self.dataset[key]
+        if self.dtype != self.dataset.dtype:
+            value = np.asarray(value).view(self.dtype)
+        return value
+
+    def __array__(self, dtype=None, copy=None):
+        value = np.asarray(self.numpy())
+        if dtype is not None:
+            value = value.astype(dtype)
+        return value
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        inputs = [_read_lazy_weight(x) for x in inputs]
+        if "out" in kwargs:
+            kwargs["out"] = tuple(_read_lazy_weight(x) for x in kwargs["out"])
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+    def __getattr__(self, name):
+        # Only called for the attributes that aren't defined above.
+        if name.startswith("__") or name == "dataset":
+            raise AttributeError(name)
+        return getattr(self.numpy(), name)
+
+    def __iter__(self):
+        return iter(self.numpy())
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __repr__(self):
+        return f"<LazyWeight shape={self.shape}, dtype={self.dtype}>"
+
+
+def _read_lazy_weight(x):
+    return x.numpy() if isinstance(x, LazyWeight) else x
+
+
 def get_weight_spec_of_saveable(saveable, spec, visited_saveables=None):
     from keras.src.saving.keras_saveable import KerasSaveable
 
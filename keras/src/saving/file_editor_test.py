@@ -6,6 +6,7 @@ import pytest
 import keras
 from keras.src import testing
 from keras.src.saving.file_editor import KerasFileEditor
+from keras.src.saving.file_editor import LazyWeight
 
 
 def get_source_model():
@@ -110,3 +111,46 @@ class SavingTest(testing.TestCase):
         self.assertEqual(
             len(keras.src.tree.flatten(model_weights_editor.weights_dict)), 8
         )
+
+    def test_lazy_weights(self):
+        temp_filepath = os.path.join(self.get_temp_dir(), "my.weights.h5")
+        model = get_source_model()
+        model.save_weights(temp_filepath)
+
+        with KerasFileEditor(temp_filepath) as editor:
+            kernel = editor.weights_dict["layers"]["dense"]["0"]
+            self.assertIsInstance(kernel, LazyWeight)
+            self.assertEqual(kernel.shape, (2, 3))
+            self.assertEqual(kernel.dtype, "float32")
+            self.assertAllClose(kernel, model.layers[1].kernel)
+            self.assertAllClose(kernel[1:], model.layers[1].kernel[1:])
+
+            # The weights behave like NumPy arrays.
+            value = np.asarray(kernel)
+            self.assertAllClose(kernel * 2 + 1, value * 2 + 1)
+            self.assertAllClose(1 - kernel, 1 - value)
+            self.assertAllClose(kernel @ value.T, value @ value.T)
+            self.assertAllClose(np.add(kernel, kernel), value + value)
+            self.assertAllClose(np.mean(kernel, axis=0), value.mean(axis=0))
+            self.assertAllClose(kernel.T, value.T)
+            self.assertAllClose(kernel.reshape((3, 2)), value.reshape((3, 2)))
+            self.assertEqual(kernel.astype("float16").dtype, "float16")
+            self.assertAllClose(list(kernel), list(value))
+
+            with self.assertRaisesRegex(ValueError, "opened file"):
+                editor.save(temp_filepath)
+
+            # The weights that are not replaced are copied from the file.
+            new_kernel = np.random.random((3, 3))
+            editor.delete_weight("dense_1", "0")
+            editor.add_weights("dense_1", {"0": new_kernel})
+            resaved_filepath = os.path.join(
+                self.get_temp_dir(), "resaved.weights.h5"
+            )
+            editor.save(resaved_filepath)
+
+        new_model = get_source_model()
+        new_model.load_weights(resaved_filepath)
+        self.assertAllClose(new_model.layers[1].kernel, model.layers[1].kernel)
+        self.assertAllClose(new_model.layers[1].bias, model.layers[1].bias)
+        self.assertAllClose(new_model.layers[2].kernel, new_kernel)
@@ -219,8 +219,16 @@ def load_model(filepath, custom_objects=None, compile=True, safe_mode=True):
 
 
 @keras_export("keras.saving.save_weights")
-def save_weights(model, filepath, overwrite=True, **kwargs):
-    if not str(filepath).endswith(".weights.h5"):
+def save_weights(
+    model, filepath, overwrite=True, max_shard_size=None, **kwargs
+):
+    if max_shard_size is not None:
+        if not str(filepath).endswith(".weights.json"):
+            raise ValueError(
+                "The filename must end in `.weights.json` when "
+                f"`max_shard_size` is set. Received: filepath={filepath}"
+            )
+    elif not str(filepath).endswith(".weights.h5"):
         raise ValueError(
             "The filename must end in `.weights.h5`. "
             f"Received: filepath={filepath}"
@@ -233,7 +241,9 @@ def save_weights(model, filepath, overwrite=True, **kwargs):
         proceed = io_utils.ask_to_proceed_with_overwrite(filepath)
         if not proceed:
             return
-    saving_lib.save_weights_only(model, filepath, **kwargs)
+    saving_lib.save_weights_only(
+        model, filepath, max_shard_size=max_shard_size, **kwargs
+    )
 
 
 @keras_export("keras.saving.load_weights")
@@ -244,7 +254,7 @@ def load_weights(model, filepath, skip_mismatch=False, **kwargs):
         saving_lib.load_weights_only(
             model, filepath, skip_mismatch=skip_mismatch
         )
-    elif str(filepath).endswith(".weights.h5"):
+    elif str(filepath).endswith((".weights.h5", ".weights.json")):
         objects_to_skip = kwargs.pop("objects_to_skip", None)
         if kwargs:
             raise ValueError(f"Invalid keyword arguments: {kwargs}")
@@ -274,6 +284,6 @@ def load_weights(model, filepath, skip_mismatch=False, **kwargs):
     else:
         raise ValueError(
             f"File format not supported: filepath={filepath}. "
-            "Keras 3 only supports V3 `.keras` and `.weights.h5` "
-            "files, or legacy V1/V2 `.h5` files."
+            "Keras 3 only supports V3 `.keras`, `.weights.h5` and "
+            "`.weights.json` files, or legacy V1/V2 `.h5` files."
         )
@@ -1,12 +1,16 @@
 """Python-based idempotent model-saving functionality."""
 
+import concurrent.futures
 import datetime
 import io
 import json
+import mmap
 import os
 import pathlib
 import shutil
+import struct
 import tempfile
+import time
 import warnings
 import zipfile
 
@@ -50,8 +54,17 @@ _METADATA_FILENAME = "metadata.json"
 _VARS_FNAME = "model.weights"  # Will become e.g. "model.weights.h5"
 _VARS_FNAME_H5 = _VARS_FNAME + ".h5"
 _VARS_FNAME_NPZ = _VARS_FNAME + ".npz"
+_VARS_FNAME_RAW = _VARS_FNAME + ".bin"
 _ASSETS_DIRNAME = "assets"
 _MEMORY_UPPER_BOUND = 0.5  # 50%
+# Number of variables read ahead of their assignment when loading weights.
+_PREFETCH_SIZE = 2
+# Alignment of the tensors in the files of the "raw" weights format.
+_RAW_ALIGNMENT = 4096
+_RAW_MAGIC = b"KERASRAW"
+# ID of the zip extra field used to align the data of archive members, as
+# used by Android's zipalign.
+_ALIGNMENT_EXTRA_ID = 0xD935
 
 
 _MODEL_CARD_TEMPLATE = """
@@ -172,10 +185,14 @@ def _save_model_to_dir(model, dirpath, weights_format):
             weights_store = H5IOStore(weights_filepath, mode="w")
         elif weights_format == "npz":
             weights_store = NpzIOStore(weights_filepath, mode="w")
+        elif weights_format == "raw":
+            weights_store = RawIOStore(
+                file_utils.join(dirpath, _VARS_FNAME_RAW), mode="w"
+            )
         else:
             raise ValueError(
                 "Unknown `weights_format` argument. "
-                "Expected 'h5' or 'npz'. "
+                "Expected 'h5', 'npz' or 'raw'. "
                 f"Received: weights_format={weights_format}"
             )
         asset_store = DiskIOStore(assert_dirpath, mode="w")
@@ -235,10 +252,14 @@ def _save_model_to_fileobj(model, fileobj, weights_format):
                 weights_store = NpzIOStore(
                     _VARS_FNAME_NPZ, archive=zf, mode="w"
                 )
+            elif weights_format == "raw":
+                weights_store = RawIOStore(
+                    _VARS_FNAME_RAW, archive=zf, mode="w"
+                )
             else:
                 raise ValueError(
                     "Unknown `weights_format` argument. "
-                    "Expected 'h5' or 'npz'. "
+                    "Expected 'h5', 'npz' or 'raw'. "
                     f"Received: weights_format={weights_format}"
                 )
 
@@ -387,9 +408,13 @@ def _load_model_from_dir(dirpath, custom_objects, compile, safe_mode):
         elif _VARS_FNAME_NPZ in all_filenames:
             weights_file_path = file_utils.join(dirpath, _VARS_FNAME_NPZ)
             weights_store = NpzIOStore(weights_file_path, mode="r")
+        elif _VARS_FNAME_RAW in all_filenames:
+            weights_file_path = file_utils.join(dirpath, _VARS_FNAME_RAW)
+            weights_store = RawIOStore(weights_file_path, mode="r")
         else:
             raise ValueError(
-                f"Expected a {_VARS_FNAME_H5} or {_VARS_FNAME_NPZ} file."
+                f"Expected a {_VARS_FNAME_H5}, {_VARS_FNAME_NPZ} or "
+                f"{_VARS_FNAME_RAW} file."
             )
         if len(all_filenames) > 3:
             asset_store = DiskIOStore(
@@ -452,7 +477,11 @@ def _load_model_from_fileobj(fileobj, custom_objects, compile, safe_mode):
         try:
             if _VARS_FNAME_H5 in all_filenames:
                 try:
-                    if is_memory_sufficient(model):
+                    if _get_stored_member_offset(zf, _VARS_FNAME_H5):
+                        # The weights file is not compressed, stream it from
+                        # the archive with a few tensors in memory at a time.
+                        weights_store = H5IOStore(_VARS_FNAME_H5, zf, mode="r")
+                    elif is_memory_sufficient(model):
                         # Load the entire file into memory if the system memory
                         # is sufficient.
                         io_file = io.BytesIO(
@@ -478,9 +507,12 @@ def _load_model_from_fileobj(fileobj, custom_objects, compile, safe_mode):
                     weights_store = H5IOStore(_VARS_FNAME_H5, zf, mode="r")
             elif _VARS_FNAME_NPZ in all_filenames:
                 weights_store = NpzIOStore(_VARS_FNAME_NPZ, zf, mode="r")
+            elif _VARS_FNAME_RAW in all_filenames:
+                weights_store = RawIOStore(_VARS_FNAME_RAW, zf, mode="r")
             else:
                 raise ValueError(
-                    f"Expected a {_VARS_FNAME_H5} or {_VARS_FNAME_NPZ} file."
+                    f"Expected a {_VARS_FNAME_H5}, {_VARS_FNAME_NPZ} or "
+                    f"{_VARS_FNAME_RAW} file."
                 )
 
             if len(all_filenames) > 3:
@@ -510,10 +542,14 @@ def _load_model_from_fileobj(fileobj, custom_objects, compile, safe_mode):
     return model
 
 
-def save_weights_only(model, filepath, objects_to_skip=None):
+def save_weights_only(
+    model, filepath, objects_to_skip=None, max_shard_size=None
+):
     """Save only the weights of a model to a target filepath.
 
-    Supports both `.weights.h5` and `.keras`.
+    Supports `.weights.h5`, and `.weights.json` when `max_shard_size` is
+    set, in which case the weights are split into H5 shards of at most
+    `max_shard_size` gigabytes, indexed by the `.weights.json` file.
     """
     if not model.built:
         raise ValueError(
@@ -525,7 +561,14 @@ def save_weights_only(model, filepath, objects_to_skip=None):
     filepath = str(filepath)
     tmp_dir = None
     remote_filepath = None
-    if not filepath.endswith(".weights.h5"):
+    if max_shard_size is not None:
+        if not filepath.endswith(".weights.json"):
+            raise ValueError(
+                "Invalid `filepath` argument: expected a `.weights.json` "
+                "extension when `max_shard_size` is set. "
+                f"Received: filepath={filepath}"
+            )
+    elif not filepath.endswith(".weights.h5"):
         raise ValueError(
             "Invalid `filepath` argument: expected a `.weights.h5` extension. "
             f"Received: filepath={filepath}"
@@ -537,7 +580,12 @@ def save_weights_only(model, filepath, objects_to_skip=None):
             remote_filepath = filepath
             filepath = local_filepath
 
-        weights_store = H5IOStore(filepath, mode="w")
+        if max_shard_size is not None:
+            weights_store = ShardedH5IOStore(
+                filepath, max_shard_size=max_shard_size, mode="w"
+            )
+        else:
+            weights_store = H5IOStore(filepath, mode="w")
         if objects_to_skip is not None:
             visited_saveables = set(id(o) for o in objects_to_skip)
         else:
@@ -552,6 +600,13 @@ def save_weights_only(model, filepath, objects_to_skip=None):
         weights_store.close()
     finally:
         if tmp_dir is not None:
+            if max_shard_size is not None:
+                remote_dirname = os.path.dirname(remote_filepath)
+                for filename in weights_store.shard_filenames:
+                    file_utils.copy(
+                        os.path.join(tmp_dir, filename),
+                        file_utils.join(remote_dirname, filename),
+                    )
             file_utils.copy(filepath, remote_filepath)
             shutil.rmtree(tmp_dir)
 
@@ -559,7 +614,11 @@ def save_weights_only(model, filepath, objects_to_skip=None):
 def load_weights_only(
     model, filepath, skip_mismatch=False, objects_to_skip=None
 ):
-    """Load the weights of a model from a filepath (.keras or .weights.h5).
+    """Load the weights of a model from a filepath.
+
+    Supports `.keras`, `.weights.h5` and the `.weights.json` index of
+    sharded weights. Only the shards holding the variables of the objects
+    that are not skipped are read.
 
     Note: only supports h5 for now.
     """
@@ -579,10 +638,21 @@ def load_weights_only(
             tmp_dir = get_temp_dir()
             local_filepath = os.path.join(tmp_dir, os.path.basename(filepath))
             file_utils.copy(filepath, local_filepath)
+            if filepath.endswith(".weights.json"):
+                remote_dirname = os.path.dirname(filepath)
+                with open(local_filepath, "r") as f:
+                    shard_filenames = set(json.load(f)["weight_map"].values())
+                for filename in shard_filenames:
+                    file_utils.copy(
+                        file_utils.join(remote_dirname, filename),
+                        os.path.join(tmp_dir, filename),
+                    )
             filepath = local_filepath
 
         if filepath.endswith(".weights.h5"):
             weights_store = H5IOStore(filepath, mode="r")
+        elif filepath.endswith(".weights.json"):
+            weights_store = ShardedH5IOStore(filepath, mode="r")
         elif filepath.endswith(".keras"):
             archive = zipfile.ZipFile(filepath, "r")
             weights_store = H5IOStore(_VARS_FNAME_H5, archive=archive, mode="r")
@@ -614,6 +684,102 @@ def load_weights_only(
             shutil.rmtree(tmp_dir)
 
 
+class ModelSnapshot:
+    """Copy of the state of a model in host memory, to be saved later.
+
+    Taking the snapshot serializes the config of the model, copies the
+    values of its variables to NumPy arrays and writes its assets to a
+    temporary directory. `save()` then only writes files, so it can run on
+    another thread while the model keeps training.
+
+    Args:
+        model: The model to snapshot.
+        weights_only: Whether to only snapshot the variables, to be saved
+            to a `.weights.h5` file rather than a `.keras` archive.
+    """
+
+    def __init__(self, model, weights_only=False):
+        self.weights_only = weights_only
+        self.config_json = None
+        self.metadata_json = None
+        self.assets_store = None
+        if not weights_only:
+            self.config_json, self.metadata_json = _serialize_model_as_json(
+                model
+            )
+            self.assets_store = DiskIOStore(_ASSETS_DIRNAME, mode="w")
+        self.weights_store = _SnapshotIOStore()
+        _save_state(
+            model,
+            weights_store=self.weights_store,
+            assets_store=self.assets_store,
+            inner_path="",
+            visited_saveables=set(),
+        )
+
+    def save(self, filepath):
+        """Writes the snapshot to a local `.keras` or `.weights.h5` file."""
+        filepath = str(filepath)
+        if self.weights_only:
+            weights_store = H5IOStore(filepath, mode="w")
+            try:
+                self.weights_store.write_to(weights_store)
+            finally:
+                weights_store.close()
+            return
+        with zipfile.ZipFile(filepath, "w") as zf:
+            with zf.open(_METADATA_FILENAME, "w") as f:
+                f.write(self.metadata_json.encode())
+            with zf.open(_CONFIG_FILENAME, "w") as f:
+                f.write(self.config_json.encode())
+            weights_store = H5IOStore(_VARS_FNAME_H5, archive=zf, mode="w")
+            try:
+                self.weights_store.write_to(weights_store)
+            except:
+                weights_store.archive = None
+                raise
+            finally:
+                weights_store.close()
+            _write_to_zip_recursively(
+                zf, self.assets_store.working_dir, _ASSETS_DIRNAME
+            )
+
+    def get_values(self):
+        """Returns the copies of the variables, keyed by their paths.
+
+        The paths are those of the datasets in `.weights.h5` files, e.g.
+        `"layers/dense/vars/0"`. Modifying the arrays modifies the snapshot.
+        """
+        return {
+            _join_var_path(path, key): value
+            for path, _, entry in self.weights_store.entries
+            for key, value in entry.items()
+        }
+
+    def restore(self, model):
+        """Assigns the values of the snapshot to the variables of `model`."""
+        failed_saveables = set()
+        error_msgs = {}
+        _load_state(
+            model,
+            weights_store=self.weights_store,
+            assets_store=None,
+            inner_path="",
+            visited_saveables=set(),
+            failed_saveables=failed_saveables,
+            error_msgs=error_msgs,
+        )
+        if failed_saveables:
+            _raise_loading_failure(error_msgs)
+
+    def close(self):
+        """Releases the copies of the variables and assets."""
+        self.weights_store = None
+        if self.assets_store:
+            self.assets_store.close()
+            self.assets_store = None
+
+
 def _raise_loading_failure(error_msgs, warn_only=False):
     first_key = list(error_msgs.keys())[0]
     ex_saveable, ex_error = error_msgs[first_key]
@@ -903,7 +1069,13 @@ class DiskIOStore:
         if self.archive:
             self.tmp_dir = get_temp_dir()
             if self.mode == "r":
-                self.archive.extractall(path=self.tmp_dir)
+                # Only extract the assets, not the weights.
+                members = [
+                    name
+                    for name in self.archive.namelist()
+                    if name.startswith(self.root_path + "/")
+                ]
+                self.archive.extractall(path=self.tmp_dir, members=members)
             self.working_dir = file_utils.join(
                 self.tmp_dir, self.root_path
             ).replace("\\", "/")
@@ -958,23 +1130,32 @@ class H5IOStore:
         self.mode = mode
         self.archive = archive
         self.io_file = None
+        self.prefetcher = None
 
         if self.archive:
             if self.mode == "w":
                 self.io_file = io.BytesIO()
             else:
-                self.io_file = self.archive.open(self.root_path, "r")
+                # Read uncompressed weights files directly from the archive
+                # file, which supports fast random access.
+                self.io_file = _open_stored_member(
+                    self.archive, self.root_path
+                ) or self.archive.open(self.root_path, "r")
             self.h5_file = h5py.File(self.io_file, mode=self.mode)
         else:
             self.h5_file = h5py.File(root_path, mode=self.mode)
+        if self.mode == "r":
+            self.prefetcher = H5Prefetcher(self.h5_file)
 
     def make(self, path, metadata=None):
         return H5Entry(self.h5_file, path, mode="w", metadata=metadata)
 
     def get(self, path):
-        return H5Entry(self.h5_file, path, mode="r")
+        return H5Entry(self.h5_file, path, mode="r", prefetcher=self.prefetcher)
 
     def close(self):
+        if self.prefetcher:
+            self.prefetcher.close()
         self.h5_file.close()
         if self.mode == "w" and self.archive:
             self.archive.writestr(self.root_path, self.io_file.getvalue())
@@ -985,11 +1166,12 @@ class H5IOStore:
 class H5Entry:
     """Leaf entry in a H5IOStore."""
 
-    def __init__(self, h5_file, path, mode, metadata=None):
+    def __init__(self, h5_file, path, mode, metadata=None, prefetcher=None):
         self.h5_file = h5_file
         self.path = path
         self.mode = mode
         self.metadata = metadata
+        self.prefetcher = prefetcher
 
         if mode == "w":
             if not path:
@@ -1048,11 +1230,329 @@ class H5Entry:
 
     def __getitem__(self, name):
         value = self.group[name]
+        if self.prefetcher is not None and isinstance(value, h5py.Dataset):
+            return self.prefetcher.read(value)
         if "dtype" in value.attrs and value.attrs["dtype"] == "bfloat16":
             value = np.array(value, dtype=ml_dtypes.bfloat16)
         return value
 
 
+class H5Prefetcher:
+    """Reads the datasets of a H5 file ahead of their use.
+
+    The variables are saved in the order in which they are loaded, so the
+    datasets are read in the order of their offsets in the file, on a thread
+    pool, while the previous ones are assigned to the variables. At most
+    `prefetch_size` datasets are read ahead, so that the memory used does
+    not grow with the size of the file. Datasets requested out of order are
+    read directly.
+    """
+
+    def __init__(self, h5_file, prefetch_size=_PREFETCH_SIZE):
+        datasets = []
+
+        def visit(name, obj):
+            if isinstance(obj, h5py.Dataset):
+                offset = obj.id.get_offset()
+                datasets.append((offset is None, offset or 0, obj.name))
+
+        h5_file.visititems(visit)
+        self.h5_file = h5_file
+        self.prefetch_size = prefetch_size
+        self.names = [name for _, _, name in sorted(datasets)]
+        self.positions = {name: i for i, name in enumerate(self.names)}
+        self.futures = {}
+        self.next_position = 0
+        self.executor = None
+        if prefetch_size > 0 and len(self.names) > 1:
+            self.executor = concurrent.futures.ThreadPoolExecutor(
+                prefetch_size, thread_name_prefix="keras_weights_prefetch"
+            )
+
+    def read(self, dataset):
+        """Returns the value of `dataset` as a NumPy array."""
+        if self.executor is None:
+            return _read_dataset(dataset)
+        future = self.futures.pop(dataset.name, None)
+        position = self.positions.get(dataset.name)
+        if position is not None and position >= self.next_position:
+            # The datasets were not requested in the order of the file,
+            # skip the ones before this one.
+            for name in self.names[self.next_position : position]:
+                skipped = self.futures.pop(name, None)
+                if skipped is not None:
+                    skipped.cancel()
+            self.next_position = position + 1
+        while len(
+            self.futures
+        ) < self.prefetch_size and self.next_position < len(self.names):
+            name = self.names[self.next_position]
+            self.futures[name] = self.executor.submit(
+                _read_dataset, self.h5_file[name]
+            )
+            self.next_position += 1
+        if future is None:
+            return _read_dataset(dataset)
+        return future.result()
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+        self.futures = {}
+
+
+def _read_dataset(dataset):
+    if dataset.attrs.get("dtype") == "bfloat16":
+        return np.array(dataset, dtype=ml_dtypes.bfloat16)
+    return dataset[()]
+
+
+class ShardedH5IOStore:
+    def __init__(self, root_path, max_shard_size=None, mode="r"):
+        """Numerical variable store backed by HDF5 files of bounded size.
+
+        `root_path` is the path of a `.weights.json` index file, which maps
+        the path of every variable to the H5 shard that holds it. The shards
+        are written next to the index, e.g. `model_00000.weights.h5` for
+        `model.weights.json`.
+
+        In write mode, a new shard is started whenever writing a variable
+        would make the current one larger than `max_shard_size` gigabytes.
+        In read mode, the shards are only opened when one of their
+        variables is requested, and each shard reads its datasets ahead of
+        their use, so that reads from consecutive shards overlap.
+        """
+        self.root_path = str(root_path)
+        self.mode = mode
+        self.dirname = os.path.dirname(self.root_path)
+        self.prefix = os.path.basename(self.root_path)
+        if self.prefix.endswith(".weights.json"):
+            self.prefix = self.prefix[: -len(".weights.json")]
+        self.stores = {}
+
+        if self.mode == "w":
+            if max_shard_size is None or max_shard_size <= 0:
+                raise ValueError(
+                    "Argument `max_shard_size` must be a positive number of "
+                    f"gigabytes. Received: max_shard_size={max_shard_size}"
+                )
+            self.max_shard_size = int(max_shard_size * 2**30)
+            self.weight_map = {}
+            self.shard_filenames = []
+            self.current_size = 0
+        else:
+            with open(self.root_path, "r") as f:
+                index = json.load(f)
+            self.weight_map = index["weight_map"]
+            self.shard_filenames = list(dict.fromkeys(self.weight_map.values()))
+            self.entries = {}
+            for var_path, filename in self.weight_map.items():
+                path, key = _split_var_path(var_path)
+                self.entries.setdefault(path, {})[key] = filename
+
+    def make(self, path, metadata=None):
+        return _ShardedH5Entry(self, path, mode="w", metadata=metadata)
+
+    def get(self, path):
+        return _ShardedH5Entry(self, path, mode="r")
+
+    def _get_shard_for_write(self, nbytes):
+        """Returns the filename of the shard in which to write a tensor."""
+        if not self.shard_filenames or (
+            self.current_size > 0
+            and self.current_size + nbytes > self.max_shard_size
+        ):
+            if self.shard_filenames:
+                self.stores.pop(self.shard_filenames[-1]).close()
+            filename = (
+                f"{self.prefix}_{len(self.shard_filenames):05d}.weights.h5"
+            )
+            self.stores[filename] = H5IOStore(
+                os.path.join(self.dirname, filename), mode="w"
+            )
+            self.shard_filenames.append(filename)
+            self.current_size = 0
+        self.current_size += nbytes
+        return self.shard_filenames[-1]
+
+    def _get_shard_store(self, filename):
+        if filename not in self.stores:
+            self.stores[filename] = H5IOStore(
+                os.path.join(self.dirname, filename), mode=self.mode
+            )
+        return self.stores[filename]
+
+    def close(self):
+        for store in self.stores.values():
+            store.close()
+        self.stores = {}
+        if self.mode == "w":
+            index = {
+                "metadata": {
+                    "keras_version": keras_version,
+                    "max_shard_size": self.max_shard_size,
+                },
+                "weight_map": self.weight_map,
+            }
+            with open(self.root_path, "w") as f:
+                json.dump(index, f, indent=2)
+
+
+class _ShardedH5Entry:
+    """Leaf entry in a ShardedH5IOStore, spanning one or more shards."""
+
+    def __init__(self, store, path, mode, metadata=None):
+        self.store = store
+        self.path = path
+        self.mode = mode
+        self.metadata = metadata
+        # Entries of the shards holding the variables, keyed by filename.
+        self.shard_entries = {}
+        if mode == "w":
+            self.filenames = {}
+        else:
+            self.filenames = store.entries.get(path, {})
+
+    def _get_shard_entry(self, filename):
+        if filename not in self.shard_entries:
+            shard_store = self.store._get_shard_store(filename)
+            if self.mode == "w":
+                entry = shard_store.make(self.path, metadata=self.metadata)
+            else:
+                entry = shard_store.get(self.path)
+            self.shard_entries[filename] = entry
+        return self.shard_entries[filename]
+
+    def __len__(self):
+        return len(self.filenames)
+
+    def keys(self):
+        return self.filenames.keys()
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def __setitem__(self, key, value):
+        if self.mode != "w":
+            raise ValueError("Setting a value is only allowed in write mode.")
+        value = backend.convert_to_numpy(value)
+        filename = self.store._get_shard_for_write(value.nbytes)
+        self._get_shard_entry(filename)[key] = value
+        self.filenames[key] = filename
+        self.store.weight_map[_join_var_path(self.path, key)] = filename
+
+    def __getitem__(self, key):
+        return self._get_shard_entry(self.filenames[key])[key]
+
+
+def _join_var_path(path, key):
+    if not path:
+        return f"vars/{key}"
+    return f"{path}/vars/{key}"
+
+
+def _split_var_path(var_path):
+    if var_path.startswith("vars/"):
+        return "", var_path[len("vars/") :]
+    path, key = var_path.rsplit("/vars/", 1)
+    return path, key
+
+
+class _ArchiveMemberFile(io.RawIOBase):
+    """Read-only file object for an uncompressed member of a zip file.
+
+    Unlike the file objects returned by `ZipFile.open()`, it supports fast
+    random access, and reads with `os.pread()` so that it does not share a
+    file position with other readers of the archive.
+    """
+
+    def __init__(self, filename, offset, size):
+        self.fd = os.open(filename, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        self.offset = offset
+        self.size = size
+        self.position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += self.size
+        self.position = max(0, offset)
+        return self.position
+
+    def tell(self):
+        return self.position
+
+    def readinto(self, buffer):
+        size = min(len(buffer), self.size - self.position)
+        if size <= 0:
+            return 0
+        data = os.pread(self.fd, size, self.offset + self.position)
+        buffer[: len(data)] = data
+        self.position += len(data)
+        return len(data)
+
+    def close(self):
+        if not self.closed:
+            os.close(self.fd)
+        super().close()
+
+
+def _open_stored_member(archive, name):
+    """Opens an uncompressed member of `archive` with fast random access.
+
+    Args:
+        archive: A `zipfile.ZipFile` opened for reading.
+        name: The name of the member.
+
+    Returns:
+        A `_ArchiveMemberFile`, or `None` if the member is compressed or the
+        archive is not a file on disk.
+    """
+    offset = _get_stored_member_offset(archive, name)
+    if offset is None:
+        return None
+    return _ArchiveMemberFile(
+        archive.filename, offset, archive.getinfo(name).file_size
+    )
+
+
+def _get_stored_member_offset(archive, name):
+    """Returns the offset of the data of an uncompressed archive member."""
+    info = archive.getinfo(name)
+    filename = archive.filename
+    if (
+        info.compress_type != zipfile.ZIP_STORED
+        or info.flag_bits & 0x1  # Encrypted.
+        or not hasattr(os, "pread")
+        or not isinstance(filename, str)
+        or not os.path.isfile(filename)
+    ):
+        return None
+    with open(filename, "rb") as f:
+        f.seek(info.header_offset)
+        header = struct.unpack(
+            zipfile.structFileHeader, f.read(zipfile.sizeFileHeader)
+        )
+    if header[0] != zipfile.stringFileHeader:
+        return None
+    return (
+        info.header_offset
+        + zipfile.sizeFileHeader
+        + header[zipfile._FH_FILENAME_LENGTH]
+        + header[zipfile._FH_EXTRA_FIELD_LENGTH]
+    )
+
+
 class NpzIOStore:
     def __init__(self, root_path, archive=None, mode="r"):
         """Numerical variable store backed by NumPy.savez/load.
@@ -1103,6 +1603,209 @@ class NpzIOStore:
         self.f.close()
 
 
+class RawIOStore:
+    def __init__(self, root_path, archive=None, mode="r"):
+        """Numerical variable store of raw tensor bytes, memory-mapped on load.
+
+        The tensors are written one after the other into a flat file, each
+        at an offset aligned to `_RAW_ALIGNMENT` bytes, followed by a JSON
+        index of the offsets, dtypes and shapes of the tensors, and by a
+        footer with the offset of the index. In archives, the file is stored
+        uncompressed with its data aligned as well.
+
+        On load, the file is memory-mapped and the variables are copied from
+        NumPy views on it, without decompressing the weights or reading the
+        whole file at once. The values are copied since variables may share
+        the memory of the arrays they are assigned, e.g. with JAX on CPU, and
+        the file may be rewritten while they are in use. When not in an
+        archive, the file is written to a temporary file first, which then
+        replaces it.
+
+        If `archive` is specified, then `root_path` refers to the filename
+        inside the archive.
+
+        If `archive` is not specified, then `root_path` refers to the path of
+        the file on disk.
+        """
+        self.root_path = root_path
+        self.mode = mode
+        self.archive = archive
+        self.mmap = None
+        if mode == "w":
+            self.index = {}
+            if self.archive:
+                self.f = tempfile.TemporaryFile()
+            else:
+                self.f = open(root_path + ".tmp", mode="wb")
+            return
+
+        offset = 0
+        if self.archive:
+            offset = _get_stored_member_offset(self.archive, root_path)
+            if offset is None:
+                # Compressed or in-memory archives are read into memory.
+                self.buffer = self.archive.read(root_path)
+                offset = 0
+            else:
+                self.buffer = self._map(self.archive.filename)
+            size = self.archive.getinfo(root_path).file_size
+        else:
+            self.buffer = self._map(root_path)
+            size = len(self.buffer)
+        footer = self.buffer[offset + size - 16 : offset + size]
+        if len(footer) != 16 or footer[:8] != _RAW_MAGIC:
+            raise ValueError(
+                f"The file {root_path} is not a valid raw weights file."
+            )
+        index_offset = offset + int.from_bytes(footer[8:], "little")
+        self.index = json.loads(
+            bytes(self.buffer[index_offset : offset + size - 16])
+        )
+        self.offset = offset
+
+    def _map(self, path):
+        with open(path, "rb") as f:
+            self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self.mmap
+
+    def make(self, path, metadata=None):
+        self.index[path] = {}
+        return _RawEntry(self, self.index[path])
+
+    def get(self, path):
+        if path not in self.index:
+            return {}
+        return {
+            key: _view_from_spec(self.buffer, self.offset, spec).copy()
+            for key, spec in self.index[path].items()
+        }
+
+    def write(self, value):
+        """Writes `value` at the next aligned offset, returns its spec."""
+        value = backend.convert_to_numpy(value)
+        if value.dtype.hasobject:
+            raise ValueError(
+                "The 'raw' weights format only supports numerical arrays. "
+                f"Received an array of dtype {value.dtype}."
+            )
+        shape = list(value.shape)
+        # Note that this makes scalars 1D, hence recording the shape above.
+        value = np.ascontiguousarray(value)
+        offset = self.f.tell()
+        offset += -offset % _RAW_ALIGNMENT
+        self.f.seek(offset)
+        # Write the bytes through a `uint8` view, since buffers do not support
+        # all the dtypes, e.g. bfloat16.
+        self.f.write(value.reshape(-1).view(np.uint8).data)
+        if backend.standardize_dtype(value.dtype) == "bfloat16":
+            dtype = "bfloat16"
+        else:
+            dtype = value.dtype.str
+        return {"offset": offset, "dtype": dtype, "shape": shape}
+
+    def close(self):
+        if self.mode == "w":
+            index_offset = self.f.tell()
+            self.f.write(json.dumps(self.index).encode())
+            self.f.write(_RAW_MAGIC + index_offset.to_bytes(8, "little"))
+            if self.archive:
+                self.f.seek(0)
+                _write_aligned_member(self.archive, self.root_path, self.f)
+            self.f.close()
+            if not self.archive:
+                os.replace(self.root_path + ".tmp", self.root_path)
+            return
+        self.buffer = None
+        if self.mmap is not None:
+            self.mmap.close()
+
+
+class _RawEntry:
+    """Leaf entry in a `RawIOStore` opened for writing."""
+
+    def __init__(self, store, specs):
+        self.store = store
+        self.specs = specs
+
+    def __len__(self):
+        return len(self.specs)
+
+    def keys(self):
+        return self.specs.keys()
+
+    def __setitem__(self, key, value):
+        self.specs[key] = self.store.write(value)
+
+
+def _view_from_spec(buffer, offset, spec):
+    if spec["dtype"] == "bfloat16":
+        dtype = np.dtype(ml_dtypes.bfloat16)
+    else:
+        dtype = np.dtype(spec["dtype"])
+    shape = tuple(spec["shape"])
+    count = int(np.prod(shape))
+    return np.frombuffer(
+        buffer, dtype=dtype, count=count, offset=offset + spec["offset"]
+    ).reshape(shape)
+
+
+def _write_aligned_member(archive, name, f):
+    """Writes the file object `f` into `archive`, with its data aligned.
+
+    The member is stored uncompressed, and the padding needed for its data
+    to start at an offset aligned to `_RAW_ALIGNMENT` bytes in the archive
+    file is added to the extra field of its local header.
+    """
+    f.seek(0, io.SEEK_END)
+    size = f.tell()
+    f.seek(0)
+    zinfo = zipfile.ZipInfo(name, date_time=time.localtime(time.time())[:6])
+    zinfo.compress_type = zipfile.ZIP_STORED
+    zinfo.file_size = size
+    # Set by `ZipFile.open()`, only needed to compute the header size here.
+    zinfo.compress_size = 0
+    zinfo.CRC = 0
+    # Same condition as `ZipFile.open()` to add the zip64 extra field.
+    zip64 = size * 1.05 > zipfile.ZIP64_LIMIT
+    header_size = len(zinfo.FileHeader(zip64))
+    padding = -(archive.start_dir + header_size + 4) % _RAW_ALIGNMENT
+    zinfo.extra = struct.pack("<HH", _ALIGNMENT_EXTRA_ID, padding) + bytes(
+        padding
+    )
+    with archive.open(zinfo, mode="w", force_zip64=zip64) as dst:
+        shutil.copyfileobj(f, dst, 2**20)
+
+
+class _SnapshotIOStore:
+    """Numerical variable store keeping copies of the values in memory."""
+
+    def __init__(self):
+        self.entries = []
+        self.entries_by_path = {}
+
+    def make(self, path, metadata=None):
+        entry = _SnapshotEntry()
+        self.entries.append((path, metadata, entry))
+        self.entries_by_path[path] = entry
+        return entry
+
+    def get(self, path):
+        return self.entries_by_path.get(path, {})
+
+    def write_to(self, weights_store):
+        """Writes the values to `weights_store`, in the order of `make`."""
+        for path, metadata, entry in self.entries:
+            target = weights_store.make(path, metadata=metadata)
+            for key, value in entry.items():
+                target[key] = value
+
+
+class _SnapshotEntry(dict):
+    def __setitem__(self, key, value):
+        # Copy the values, which may share memory with the variables.
+        super().__setitem__(key, np.array(backend.convert_to_numpy(value)))
+
+
 def get_temp_dir():
     temp_dir = tempfile.mkdtemp()
     testfile = tempfile.TemporaryFile(dir=temp_dir)
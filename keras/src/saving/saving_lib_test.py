@@ -469,6 +469,96 @@ class SavingTest(testing.TestCase):
         model.load_weights(temp_filepath)
         self.assertAllClose(model.predict(ref_input), ref_output, atol=1e-6)
 
+    def test_save_load_sharded_weights(self):
+        temp_dir = self.get_temp_dir()
+        temp_filepath = os.path.join(temp_dir, "mymodel.weights.json")
+
+        def get_model():
+            return keras.Sequential(
+                [
+                    keras.Input((16,)),
+                    keras.layers.Dense(16, name="dense_1"),
+                    keras.layers.Dense(16, name="dense_2"),
+                    keras.layers.Dense(4, name="dense_3"),
+                ]
+            )
+
+        model = get_model()
+        ref_input = np.random.random((2, 16))
+        ref_output = model.predict(ref_input)
+        # Each 16x16 kernel takes 1 KiB, so the second one starts a new
+        # shard, which the last layer still fits in.
+        saving_lib.save_weights_only(
+            model, temp_filepath, max_shard_size=1400 / 2**30
+        )
+        with open(temp_filepath) as f:
+            weight_map = json.load(f)["weight_map"]
+        self.assertEqual(
+            weight_map,
+            {
+                "layers/dense/vars/0": "mymodel_00000.weights.h5",
+                "layers/dense/vars/1": "mymodel_00000.weights.h5",
+                "layers/dense_1/vars/0": "mymodel_00001.weights.h5",
+                "layers/dense_1/vars/1": "mymodel_00001.weights.h5",
+                "layers/dense_2/vars/0": "mymodel_00001.weights.h5",
+                "layers/dense_2/vars/1": "mymodel_00001.weights.h5",
+            },
+        )
+        for filename in set(weight_map.values()):
+            self.assertTrue(os.path.exists(os.path.join(temp_dir, filename)))
+
+        model = get_model()
+        model.load_weights(temp_filepath)
+        self.assertAllClose(model.predict(ref_input), ref_output, atol=1e-6)
+
+        # Only the shards of the loaded layers are opened.
+        model = get_model()
+        with mock.patch.object(
+            saving_lib, "H5IOStore", wraps=saving_lib.H5IOStore
+        ) as mock_store:
+            model.load_weights(temp_filepath, objects_to_skip=model.layers[1:])
+        self.assertEqual(mock_store.call_count, 1)
+        self.assertEqual(
+            os.path.basename(mock_store.call_args.args[0]),
+            "mymodel_00000.weights.h5",
+        )
+
+    def test_save_sharded_weights_errors(self):
+        model = _get_basic_functional_model()
+        with self.assertRaisesRegex(ValueError, "`.weights.json`"):
+            model.save_weights(
+                os.path.join(self.get_temp_dir(), "mymodel.weights.h5"),
+                max_shard_size=1,
+            )
+        with self.assertRaisesRegex(ValueError, "max_shard_size"):
+            saving_lib.save_weights_only(
+                model,
+                os.path.join(self.get_temp_dir(), "mymodel.weights.json"),
+                max_shard_size=0,
+            )
+
+    def test_model_snapshot(self):
+        temp_filepath = os.path.join(self.get_temp_dir(), "my_model.keras")
+        model = _get_basic_functional_model()
+        ref_weights = model.get_weights()
+        snapshot = saving_lib.ModelSnapshot(model)
+        # Changing the model after the snapshot does not change the saved
+        # values.
+        model.set_weights([np.zeros_like(w) for w in ref_weights])
+        snapshot.save(temp_filepath)
+        snapshot.close()
+        loaded_model = saving_lib.load_model(temp_filepath)
+        for ref_w, w in zip(ref_weights, loaded_model.get_weights()):
+            self.assertAllClose(ref_w, w)
+
+        temp_filepath = os.path.join(self.get_temp_dir(), "my.weights.h5")
+        snapshot = saving_lib.ModelSnapshot(model, weights_only=True)
+        snapshot.save(temp_filepath)
+        snapshot.close()
+        loaded_model.load_weights(temp_filepath)
+        for w in loaded_model.get_weights():
+            self.assertAllClose(w, np.zeros_like(w))
+
     def test_save_weights_only_with_unbuilt_model(self):
         temp_filepath = Path(
             os.path.join(self.get_temp_dir(), "mymodel.weights.h5")
@@ -750,6 +840,135 @@ class SavingTest(testing.TestCase):
             pool.join()
         [r.get() for r in results]  # No error occurs here
 
+    def test_load_model_streams_stored_weights(self):
+        model = _get_basic_functional_model()
+        filepath = f"{self.get_temp_dir()}/model.keras"
+        saving_lib.save_model(model, filepath)
+
+        # The weights are read from the archive file, without copying them
+        # into memory or extracting them.
+        with (
+            mock.patch.object(
+                saving_lib, "is_memory_sufficient", side_effect=AssertionError
+            ),
+            mock.patch.object(
+                saving_lib,
+                "_ArchiveMemberFile",
+                wraps=saving_lib._ArchiveMemberFile,
+            ) as member_file,
+        ):
+            new_model = saving_lib.load_model(filepath)
+        member_file.assert_called_once()
+        for w1, w2 in zip(model.weights, new_model.weights):
+            self.assertAllClose(w1, w2)
+
+    def test_load_model_with_compressed_weights(self):
+        model = _get_basic_functional_model()
+        filepath = f"{self.get_temp_dir()}/model.keras"
+        compressed_filepath = f"{self.get_temp_dir()}/compressed.keras"
+        saving_lib.save_model(model, filepath)
+        with zipfile.ZipFile(filepath) as zf:
+            with zipfile.ZipFile(
+                compressed_filepath, "w", compression=zipfile.ZIP_DEFLATED
+            ) as compressed_zf:
+                for name in zf.namelist():
+                    compressed_zf.writestr(name, zf.read(name))
+
+        new_model = saving_lib.load_model(compressed_filepath)
+        for w1, w2 in zip(model.weights, new_model.weights):
+            self.assertAllClose(w1, w2)
+
+    @parameterized.named_parameters(
+        ("zipped", True),
+        ("directory", False),
+    )
+    @pytest.mark.requires_trainable_backend
+    def test_raw_weights_format(self, zipped):
+        model = _get_basic_functional_model()
+        model.fit(np.random.random((4, 4)), np.random.random((4, 1)))
+        if zipped:
+            filepath = f"{self.get_temp_dir()}/model.keras"
+        else:
+            filepath = f"{self.get_temp_dir()}/model"
+        saving_lib.save_model(
+            model, filepath, weights_format="raw", zipped=zipped
+        )
+        if zipped:
+            with zipfile.ZipFile(filepath) as zf:
+                offset = saving_lib._get_stored_member_offset(
+                    zf, "model.weights.bin"
+                )
+                self.assertEqual(offset % saving_lib._RAW_ALIGNMENT, 0)
+
+        new_model = saving_lib.load_model(filepath)
+        for w1, w2 in zip(model.weights, new_model.weights):
+            self.assertAllClose(w1, w2)
+        for v1, v2 in zip(
+            model.optimizer.variables, new_model.optimizer.variables
+        ):
+            self.assertAllClose(v1, v2)
+
+        if zipped:
+            # Saving another model to the same path leaves the loaded weights.
+            other_model = keras.Sequential(
+                [keras.Input((4,)), keras.layers.Dense(1, name="d")]
+            )
+            saving_lib.save_model(other_model, filepath, weights_format="raw")
+            for w1, w2 in zip(model.weights, new_model.weights):
+                self.assertAllClose(w1, w2)
+
+    def test_raw_io_store(self):
+        filepath = f"{self.get_temp_dir()}/weights.bin"
+        store = saving_lib.RawIOStore(filepath, mode="w")
+        entry = store.make("layer")
+        values = [
+            np.arange(6, dtype="float32").reshape((2, 3)),
+            np.array(3, dtype="int64"),
+            np.zeros((0, 2), dtype="float16"),
+            np.array([1.5, 2.5], dtype="bfloat16"),
+        ]
+        for i, value in enumerate(values):
+            entry[str(i)] = value
+        store.close()
+
+        store = saving_lib.RawIOStore(filepath, mode="r")
+        self.assertEqual(store.get("missing"), {})
+        loaded = store.get("layer")
+        self.assertEqual(list(loaded.keys()), ["0", "1", "2", "3"])
+        for i, value in enumerate(values):
+            self.assertEqual(loaded[str(i)].dtype, value.dtype)
+            self.assertEqual(loaded[str(i)].shape, value.shape)
+            self.assertAllClose(
+                loaded[str(i)].astype("float32"), value.astype("float32")
+            )
+            # The values are copied from the memory-mapped file.
+            self.assertTrue(loaded[str(i)].flags.owndata)
+        store.close()
+
+        # The file is replaced, and the loaded values are left unchanged.
+        store = saving_lib.RawIOStore(filepath, mode="w")
+        store.make("layer")["0"] = np.ones((4,), dtype="float32")
+        store.close()
+        self.assertAllClose(loaded["0"], values[0])
+        self.assertFalse(os.path.exists(f"{filepath}.tmp"))
+
+    def test_h5_prefetcher(self):
+        import h5py
+
+        filepath = f"{self.get_temp_dir()}/prefetch.h5"
+        with h5py.File(filepath, "w") as f:
+            for i in range(6):
+                f[f"vars/{i}"] = np.full((3,), i, dtype="float32")
+        with h5py.File(filepath, "r") as f:
+            prefetcher = saving_lib.H5Prefetcher(f, prefetch_size=2)
+            # Out of order requests are read directly.
+            for i in [0, 1, 4, 2, 5, 3]:
+                self.assertAllClose(
+                    prefetcher.read(f[f"vars/{i}"]), np.full((3,), i)
+                )
+                self.assertLessEqual(len(prefetcher.futures), 2)
+            prefetcher.close()
+
     def test_load_model_containing_reused_layer(self):
         # https://github.com/keras-team/keras/issues/20307
         inputs = keras.Input((4,))
@@ -29,6 +29,12 @@ BUILTIN_MODULES = (
 )
 
 
+# Classes and functions of Keras resolved from their names and modules, which
+# unlike user-defined ones cannot be redefined. The objects registered as
+# custom objects take precedence and are not cached.
+_BUILTIN_CLASS_OR_FN_CACHE = {}
+
+
 class SerializableDict:
     def __init__(self, **config):
         self.config = config
@@ -498,11 +504,50 @@ def deserialize_keras_object(
     safe_mode = safe_scope_arg if safe_scope_arg is not None else safe_mode
 
     module_objects = kwargs.pop("module_objects", None)
-    custom_objects = custom_objects or {}
+    custom_objects = _merge_custom_objects(custom_objects)
+    return _deserialize_keras_object(
+        config,
+        custom_objects=custom_objects,
+        safe_mode=safe_mode,
+        module_objects=module_objects,
+    )
+
+
+class _MergedCustomObjects(dict):
+    """Custom objects of a deserialization, merged with the global ones.
+
+    Nested deserializations run in a custom object scope of these objects,
+    and reuse them instead of merging all the custom objects again, which is
+    costly when many objects are registered. This is not modified once
+    created, so `copy()`, e.g. when entering a custom object scope, returns
+    the same object.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.num_global_objects = len(object_registration.GLOBAL_CUSTOM_OBJECTS)
+
+    def copy(self):
+        return self
+
+
+def _merge_custom_objects(custom_objects):
     tlco = global_state.get_global_attribute("custom_objects_scope_dict", {})
     gco = object_registration.GLOBAL_CUSTOM_OBJECTS
-    custom_objects = {**custom_objects, **tlco, **gco}
+    if (
+        isinstance(tlco, _MergedCustomObjects)
+        and (not custom_objects or custom_objects is tlco)
+        and tlco.num_global_objects == len(gco)
+    ):
+        # Nested deserialization, the objects are already merged.
+        return tlco
+    return _MergedCustomObjects({**(custom_objects or {}), **tlco, **gco})
 
+
+def _deserialize_keras_object(
+    config, custom_objects, safe_mode, module_objects=None
+):
+    """Deserializes `config` with already merged `custom_objects`."""
     if config is None:
         return None
 
@@ -517,7 +562,7 @@ def deserialize_keras_object(
 
     if isinstance(config, (list, tuple)):
         return [
-            deserialize_keras_object(
+            _deserialize_keras_object(
                 x, custom_objects=custom_objects, safe_mode=safe_mode
             )
             for x in config
@@ -592,7 +637,7 @@ def deserialize_keras_object(
 
     if "class_name" not in config or "config" not in config:
         return {
-            key: deserialize_keras_object(
+            key: _deserialize_keras_object(
                 value, custom_objects=custom_objects, safe_mode=safe_mode
             )
             for key, value in config.items()
@@ -600,7 +645,6 @@ def deserialize_keras_object(
 
     class_name = config["class_name"]
     inner_config = config["config"] or {}
-    custom_objects = custom_objects or {}
 
     # Special cases:
     if class_name == "__keras_tensor__":
@@ -622,17 +666,17 @@ def deserialize_keras_object(
         return Ellipsis
     if config["class_name"] == "__slice__":
         return slice(
-            deserialize_keras_object(
+            _deserialize_keras_object(
                 inner_config["start"],
                 custom_objects=custom_objects,
                 safe_mode=safe_mode,
             ),
-            deserialize_keras_object(
+            _deserialize_keras_object(
                 inner_config["stop"],
                 custom_objects=custom_objects,
                 safe_mode=safe_mode,
             ),
-            deserialize_keras_object(
+            _deserialize_keras_object(
                 inner_config["step"],
                 custom_objects=custom_objects,
                 safe_mode=safe_mode,
@@ -757,6 +801,11 @@ def _retrieve_class_or_fn(
     if custom_obj is not None:
         return custom_obj
 
+    cache_key = (name, registered_name, module, obj_type)
+    obj = _BUILTIN_CLASS_OR_FN_CACHE.get(cache_key)
+    if obj is not None:
+        return obj
+
     if module:
         # If it's a Keras built-in object,
         # we cannot always use direct import, because the exported
@@ -779,6 +828,7 @@ def _retrieve_class_or_fn(
                     "keras." + mod + "." + name
                 )
                 if obj is not None:
+                    _BUILTIN_CLASS_OR_FN_CACHE[cache_key] = obj
                     return obj
 
         # Otherwise, attempt to retrieve the class object given the `module`
@@ -798,6 +848,8 @@ def _retrieve_class_or_fn(
             obj = vars(mod).get(registered_name, None)
 
         if obj is not None:
+            if module == "keras" or module.startswith("keras."):
+                _BUILTIN_CLASS_OR_FN_CACHE[cache_key] = obj
             return obj
 
     raise TypeError(
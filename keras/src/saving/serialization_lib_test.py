@@ -1,6 +1,7 @@
 """Tests for serialization_lib."""
 
 import json
+from unittest import mock
 
 import numpy as np
 import pytest
@@ -166,6 +167,68 @@ class SerializationLibTest(testing.TestCase):
         y2 = new_layer(x)
         self.assertAllClose(y1, y2, atol=1e-5)
 
+    def test_nested_custom_objects_are_merged_once(self):
+        layer = NestedCustomLayer(factor=2)
+        layer.build((None, 2))
+        config = json.loads(
+            json.dumps(serialization_lib.serialize_keras_object(layer))
+        )
+        merges = []
+        merge_custom_objects = serialization_lib._merge_custom_objects
+
+        def counting_merge(custom_objects):
+            merged = merge_custom_objects(custom_objects)
+            if not merges or merged is not merges[-1]:
+                merges.append(merged)
+            return merged
+
+        with mock.patch.object(
+            serialization_lib, "_merge_custom_objects", counting_merge
+        ):
+            new_layer = serialization_lib.deserialize_keras_object(
+                config,
+                custom_objects={
+                    "NestedCustomLayer": NestedCustomLayer,
+                    "custom_fn": custom_fn,
+                },
+            )
+        # The nested `Dense` layer and `custom_fn` reuse the custom objects
+        # of the outer deserialization.
+        self.assertLen(merges, 1)
+        self.assertIs(new_layer.dense.activation, custom_fn)
+        # The custom object scope of the deserialization has been exited.
+        self.assertEqual(
+            keras.saving.get_custom_objects().get("custom_fn"), None
+        )
+        self.assertIsNone(
+            keras.saving.get_registered_object("NestedCustomLayer")
+        )
+
+    def test_builtin_class_or_fn_cache(self):
+        config = {
+            "module": "builtins",
+            "class_name": "function",
+            "config": "relu",
+            "registered_name": "function",
+        }
+        self.assertIs(
+            serialization_lib.deserialize_keras_object(config),
+            keras.activations.relu,
+        )
+        self.assertIs(
+            serialization_lib._BUILTIN_CLASS_OR_FN_CACHE[
+                ("relu", "function", "builtins", "function")
+            ],
+            keras.activations.relu,
+        )
+        # Custom objects take precedence over the cached built-ins.
+        self.assertIs(
+            serialization_lib.deserialize_keras_object(
+                config, custom_objects={"relu": custom_fn}
+            ),
+            custom_fn,
+        )
+
     def test_lambda_fn(self):
         obj = {"activation": lambda x: x**2}
         with self.assertRaisesRegex(ValueError, "arbitrary code execution"):
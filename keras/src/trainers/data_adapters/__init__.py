@@ -4,6 +4,7 @@ from keras.src.distribution import distribution_lib
 from keras.src.trainers.data_adapters import array_data_adapter
 from keras.src.trainers.data_adapters import data_adapter
 from keras.src.trainers.data_adapters import py_dataset_adapter
+from keras.src.trainers.data_adapters import shape_bucketing
 from keras.src.trainers.data_adapters.array_data_adapter import ArrayDataAdapter
 from keras.src.trainers.data_adapters.generator_data_adapter import (
     GeneratorDataAdapter,
@@ -28,17 +29,23 @@ def get_data_adapter(
     if isinstance(x, data_adapter.DataAdapter):
         return x
 
-    # Check for multi-process/worker distribution. Since only tf.dataset
-    # is supported at the moment, we will raise error if the inputs fail
-    # the type check
+    # Check for multi-process/worker distribution. Arrays and `PyDataset`
+    # instances are sharded between the processes here, `tf.data.Dataset`
+    # instances by the distribution. Other inputs are not supported.
     distribution = distribution_lib.distribution()
-    if getattr(distribution, "_is_multi_process", False) and not is_tf_dataset(
-        x
-    ):
-        raise ValueError(
-            "When using multi-worker distribution, the data must be provided "
-            f"as a `tf.data.Dataset` instance. Received: type(x)={type(x)}."
-        )
+    process_shard = None
+    if getattr(distribution, "_is_multi_process", False):
+        if not (
+            is_tf_dataset(x)
+            or isinstance(x, py_dataset_adapter.PyDataset)
+            or array_data_adapter.can_convert_arrays((x, y, sample_weight))
+        ):
+            raise ValueError(
+                "When using multi-worker distribution, the data must be "
+                "provided as a `tf.data.Dataset`, a `keras.utils.PyDataset` "
+                f"or arrays. Received: type(x)={type(x)}."
+            )
+        process_shard = distribution._get_process_shard()
 
     if array_data_adapter.can_convert_arrays((x, y, sample_weight)):
         return ArrayDataAdapter(
@@ -49,6 +56,7 @@ def get_data_adapter(
             shuffle=shuffle,
             batch_size=batch_size,
             steps=steps_per_epoch,
+            process_shard=process_shard,
         )
     elif is_tf_dataset(x):
         # Unsupported args: y, sample_weight, shuffle
@@ -75,7 +83,12 @@ def get_data_adapter(
             raise_unsupported_arg(
                 "sample_weights", "the sample weights", "PyDataset"
             )
-        return PyDatasetAdapter(x, class_weight=class_weight, shuffle=shuffle)
+        return PyDatasetAdapter(
+            x,
+            class_weight=class_weight,
+            shuffle=shuffle,
+            process_shard=process_shard,
+        )
         # TODO: should we warn or not?
         # if x.num_batches is None and shuffle:
         #     warnings.warn(
@@ -102,7 +115,9 @@ def get_data_adapter(
         #     "data `x` was provided as a torch DataLoader. The DataLoader "
         #     "is expected to already be shuffled."
         # )
-    elif isinstance(x, types.GeneratorType):
+    elif isinstance(
+        x, (types.GeneratorType, shape_bucketing.BucketedGenerator)
+    ):
         if y is not None:
             raise_unsupported_arg("y", "the targets", "PyDataset")
         if sample_weight is not None:
@@ -114,6 +129,8 @@ def get_data_adapter(
                 "Argument `class_weight` is not supported for Python "
                 f"generator inputs. Received: class_weight={class_weight}"
             )
+        if isinstance(x, shape_bucketing.BucketedGenerator):
+            return GeneratorDataAdapter(x.generator, bucketing=x.bucketing)
         return GeneratorDataAdapter(x)
         # TODO: should we warn or not?
         # warnings.warn(
@@ -1,16 +1,32 @@
+import concurrent.futures
 import functools
+import itertools
 import math
+import os
 
 import numpy as np
 
 from keras.src import tree
 from keras.src.trainers.data_adapters import array_slicing
 from keras.src.trainers.data_adapters import data_adapter_utils
+from keras.src.trainers.data_adapters import memmap_dataset
 from keras.src.trainers.data_adapters.data_adapter import DataAdapter
 
+# Approximate number of bytes gathered at once when shuffling NumPy arrays.
+GATHER_CHUNK_BYTES = 64 * 2**20
+
 
 class ArrayDataAdapter(DataAdapter):
-    """Adapter for array-like objects, e.g. TF/JAX Tensors, NumPy arrays."""
+    """Adapter for array-like objects, e.g. TF/JAX Tensors, NumPy arrays.
+
+    With `process_shard=(shard_index, num_shards)`, every process only loads
+    its slice of each batch, e.g. for multi-process distributions. The
+    processes shuffle the samples in the same order, with a random number
+    generator seeded from the global NumPy generator, which must then be
+    seeded the same way in every process, e.g. with
+    `keras.utils.set_random_seed()`. The samples of the partial batch which
+    can't be split evenly between the shards are skipped.
+    """
 
     def __init__(
         self,
@@ -21,6 +37,7 @@ class ArrayDataAdapter(DataAdapter):
         steps=None,
         shuffle=False,
         class_weight=None,
+        process_shard=None,
     ):
         if not can_convert_arrays((x, y, sample_weight)):
             raise ValueError(
@@ -85,9 +102,22 @@ class ArrayDataAdapter(DataAdapter):
         if not batch_size:
             batch_size = int(math.ceil(num_samples / steps)) if steps else 32
 
-        self._size = int(math.ceil(num_samples / batch_size))
         self._batch_size = batch_size
         self._partial_batch_size = num_samples % batch_size
+        data_adapter_utils.check_process_shard(process_shard)
+        self._process_shard = process_shard
+        if process_shard is not None:
+            num_shards = process_shard[1]
+            if batch_size % num_shards != 0:
+                raise ValueError(
+                    "The batch size must be divisible by the number of "
+                    "shards to split the batches between the processes. "
+                    f"Received: batch_size={batch_size}, "
+                    f"num_shards={num_shards}"
+                )
+            self._partial_batch_size -= self._partial_batch_size % num_shards
+            self._rng = np.random.default_rng(np.random.randint(2**31 - 1))
+        self._size = num_samples // batch_size + bool(self._partial_batch_size)
         self._shuffle = shuffle
 
     def get_numpy_iterator(self):
@@ -105,6 +135,12 @@ class ArrayDataAdapter(DataAdapter):
     def get_tf_dataset(self):
         from keras.src.utils.module_utils import tensorflow as tf
 
+        if self._process_shard is not None or _has_memmap(self._inputs):
+            # Slicing memory-mapped arrays in NumPy avoids loading the full
+            # arrays into tensors, and the slices of the batches loaded by a
+            # process are computed by the NumPy iterator.
+            return self._get_numpy_tf_dataset()
+
         shuffle = self._shuffle
         batch_size = self._batch_size
         num_samples = self._num_samples
@@ -241,6 +277,26 @@ class ArrayDataAdapter(DataAdapter):
         dataset = dataset.with_options(options)
         return dataset.prefetch(tf.data.AUTOTUNE)
 
+    def _get_numpy_tf_dataset(self):
+        from keras.src.utils.module_utils import tensorflow as tf
+
+        batches = itertools.islice(
+            self.get_numpy_iterator(),
+            data_adapter_utils.NUM_BATCHES_FOR_TENSOR_SPEC,
+        )
+        output_signature = data_adapter_utils.get_tensor_spec(
+            [tree.lists_to_tuples(batch) for batch in batches]
+        )
+
+        def generator():
+            for batch in self.get_numpy_iterator():
+                yield tree.lists_to_tuples(batch)
+
+        dataset = tf.data.Dataset.from_generator(
+            generator, output_signature=output_signature
+        )
+        return dataset.prefetch(tf.data.AUTOTUNE)
+
     def get_jax_iterator(self):
         inputs = array_slicing.convert_to_sliceable(
             self._inputs, target_backend="jax"
@@ -258,6 +314,13 @@ class ArrayDataAdapter(DataAdapter):
 
         from keras.src.backend.torch.core import convert_to_tensor
 
+        if self._process_shard is not None or _has_memmap(self._inputs):
+            # Use the locality-aware shuffling and the process sharding of
+            # the NumPy iterator.
+            return data_adapter_utils.get_torch_dataloader(
+                self.get_numpy_iterator()
+            )
+
         class ArrayDataset(torch.utils.data.Dataset):
             def __init__(self, array):
                 self.array = array
@@ -320,9 +383,31 @@ class ArrayDataAdapter(DataAdapter):
         )
 
     def _get_iterator(self, slice_and_convert_fn, inputs):
+        if self._process_shard is not None:
+            yield from self._get_sharded_iterator(slice_and_convert_fn, inputs)
+            return
+        if self._shuffle and _can_gather(inputs):
+            yield from self._get_gather_iterator(inputs)
+            return
+
+        has_memmap = _has_memmap(inputs)
         global_permutation = None
         if self._shuffle and self._shuffle != "batch":
-            global_permutation = np.random.permutation(self._num_samples)
+            if has_memmap:
+                # Drawing samples uniformly from memory-mapped arrays would
+                # read a different page for almost every sample.
+                block_size = memmap_dataset.get_block_size(
+                    [
+                        x.array
+                        for x in tree.flatten(inputs)
+                        if isinstance(x, array_slicing.NumpySliceable)
+                    ]
+                )
+                global_permutation = memmap_dataset.get_block_permutation(
+                    self._num_samples, block_size
+                )
+            else:
+                global_permutation = np.random.permutation(self._num_samples)
 
         for i in range(self._size):
             start = i * self._batch_size
@@ -331,6 +416,9 @@ class ArrayDataAdapter(DataAdapter):
                 indices = np.random.permutation(stop - start) + start
             elif self._shuffle:
                 indices = global_permutation[start:stop]
+                if has_memmap:
+                    # Read the samples in the order in which they are stored.
+                    indices = np.sort(indices)
             else:
                 indices = slice(start, stop)
 
@@ -339,6 +427,91 @@ class ArrayDataAdapter(DataAdapter):
             )
             yield tree.map_structure(slice_indices_and_convert_fn, inputs)
 
+    def _get_sharded_iterator(self, slice_and_convert_fn, inputs):
+        """Iterator over the slices of the batches loaded by this process.
+
+        All the processes draw the same permutations, so the slices they
+        load together make up the batches of the epoch.
+        """
+        shard_index, num_shards = self._process_shard
+        if self._shuffle and self._shuffle != "batch":
+            global_permutation = self._rng.permutation(self._num_samples)
+
+        for i in range(self._size):
+            start = i * self._batch_size
+            size = self._batch_size
+            if i == self._size - 1 and self._partial_batch_size:
+                size = self._partial_batch_size
+            shard_size = size // num_shards
+            shard_start = shard_index * shard_size
+            if self._shuffle == "batch":
+                indices = self._rng.permutation(size) + start
+                indices = indices[shard_start : shard_start + shard_size]
+            elif self._shuffle:
+                indices = global_permutation[
+                    start + shard_start : start + shard_start + shard_size
+                ]
+            else:
+                indices = slice(
+                    start + shard_start, start + shard_start + shard_size
+                )
+
+            slice_indices_and_convert_fn = functools.partial(
+                slice_and_convert_fn, indices=indices
+            )
+            yield tree.map_structure(slice_indices_and_convert_fn, inputs)
+
+    def _get_gather_iterator(self, inputs):
+        """Shuffled iterator for inputs that are all NumPy arrays.
+
+        Instead of slicing every array for every batch, the samples of many
+        batches are gathered at once with `np.take` into a new array per
+        chunk, of which the batches are views. The arrays are not reused, as
+        the batches may be held for any time, e.g. by tensors sharing their
+        memory. Arrays are gathered in parallel on a thread pool, as
+        `np.take` releases the GIL.
+        """
+        flat_inputs = tree.flatten(inputs)
+        arrays = [x.array for x in flat_inputs if x is not None]
+        sample_bytes = sum(x.nbytes // max(len(x), 1) for x in arrays)
+        batches_per_chunk = max(
+            1, GATHER_CHUNK_BYTES // max(sample_bytes * self._batch_size, 1)
+        )
+        chunk_size = batches_per_chunk * self._batch_size
+
+        if self._shuffle == "batch":
+            permutation = np.concatenate(
+                [
+                    np.random.permutation(
+                        min(self._batch_size, self._num_samples - start)
+                    )
+                    + start
+                    for start in range(0, self._num_samples, self._batch_size)
+                ]
+            )
+        else:
+            permutation = np.random.permutation(self._num_samples)
+
+        def gather(array, indices):
+            return np.take(array, indices, axis=0)
+
+        max_workers = min(len(arrays), os.cpu_count() or 1)
+        executor = None
+        if max_workers > 1:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers)
+        try:
+            for chunk_start in range(0, self._num_samples, chunk_size):
+                indices = permutation[chunk_start : chunk_start + chunk_size]
+                map_fn = map if executor is None else executor.map
+                outs = list(map_fn(gather, arrays, [indices] * len(arrays)))
+                for start in range(0, len(indices), self._batch_size):
+                    yield _pack_batch(
+                        inputs, flat_inputs, outs, start, self._batch_size
+                    )
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
     @property
     def num_batches(self):
         return self._size
@@ -356,6 +529,35 @@ class ArrayDataAdapter(DataAdapter):
         return self._partial_batch_size or None
 
 
+def _has_memmap(inputs):
+    return any(
+        isinstance(x, (np.memmap, array_slicing.NumpyMemmapSliceable))
+        for x in tree.flatten(inputs)
+    )
+
+
+def _can_gather(inputs):
+    return all(
+        x is None
+        or (
+            type(x) is array_slicing.NumpySliceable
+            and not x.array.dtype.hasobject
+        )
+        for x in tree.flatten(inputs)
+    )
+
+
+def _pack_batch(inputs, flat_inputs, outs, start, batch_size):
+    outs = iter(outs)
+    return tree.pack_sequence_as(
+        inputs,
+        [
+            None if x is None else next(outs)[start : start + batch_size]
+            for x in flat_inputs
+        ],
+    )
+
+
 def can_convert_arrays(arrays):
     """Check if array like-inputs can be handled by `ArrayDataAdapter`
 
@@ -1,3 +1,6 @@
+import os
+from unittest import mock
+
 import jax
 import jax.experimental.sparse as jax_sparse
 import numpy as np
@@ -11,6 +14,7 @@ from keras.src import backend
 from keras.src import testing
 from keras.src.testing.test_utils import named_product
 from keras.src.trainers.data_adapters import array_data_adapter
+from keras.src.trainers.data_adapters import array_slicing
 
 
 class TestArrayDataAdapter(testing.TestCase):
@@ -212,6 +216,119 @@ class TestArrayDataAdapter(testing.TestCase):
                 self.assertEqual(tuple(bw[0].shape), (2,))
                 self.assertEqual(tuple(bw[1].shape), (2,))
 
+    @parameterized.named_parameters(named_product(shuffle=["batch", True]))
+    def test_gather_shuffle(self, shuffle):
+        x = np.arange(1000, dtype="float32").reshape((500, 2))
+        y = np.arange(500, dtype="int32")
+        with mock.patch.object(array_data_adapter, "GATHER_CHUNK_BYTES", 1280):
+            adapter = array_data_adapter.ArrayDataAdapter(
+                {"x": x, "x2": x + 1},
+                y=y,
+                batch_size=16,
+                shuffle=shuffle,
+            )
+            # Each chunk gathers 4 batches, and the batches that are held
+            # are not overwritten by the next chunks.
+            batches = [
+                batch
+                for epoch in range(2)
+                for batch in adapter.get_numpy_iterator()
+            ]
+        y_order = []
+        for i, (bx, by) in enumerate(batches):
+            i %= 32
+            self.assertAllClose(bx["x2"], bx["x"] + 1)
+            self.assertEqual(len(bx["x"]), 16 if i < 31 else 4)
+            self.assertAllClose(bx["x"][:, 0], by * 2)
+            if shuffle == "batch":
+                self.assertAllClose(sorted(by), range(i * 16, i * 16 + len(by)))
+            y_order.extend(by)
+        self.assertAllClose(sorted(y_order), np.repeat(np.arange(500), 2))
+        self.assertNotAllClose(y_order[:500], np.arange(500))
+        self.assertLen({id(bx["x"].base) for bx, _ in batches}, 16)
+
+    @parameterized.named_parameters(
+        named_product(shuffle=[False, "batch", True])
+    )
+    def test_process_shard(self, shuffle):
+        x = np.arange(68, dtype="float32").reshape((34, 2))
+        y = np.arange(34, dtype="int32")
+        # One adapter per process, the processes having the same seed.
+        shard_batches = []
+        for shard_index in range(3):
+            np.random.seed(1337)
+            adapter = array_data_adapter.ArrayDataAdapter(
+                x,
+                y=y,
+                batch_size=6,
+                shuffle=shuffle,
+                process_shard=(shard_index, 3),
+            )
+            self.assertEqual(adapter.num_batches, 6)
+            # One sample of the partial batch of 4 samples is skipped.
+            self.assertEqual(adapter.partial_batch_size, 3)
+            shard_batches.append(list(adapter.get_numpy_iterator()))
+
+        y_order = []
+        for i, batches in enumerate(zip(*shard_batches)):
+            by = np.concatenate([batch[1] for batch in batches])
+            self.assertLen(by, 6 if i < 5 else 3)
+            for bx, _ in batches:
+                self.assertLen(bx, len(by) // 3)
+            if shuffle is False:
+                self.assertAllClose(by, range(i * 6, i * 6 + len(by)))
+            elif shuffle == "batch":
+                self.assertAllClose(sorted(by), range(i * 6, i * 6 + len(by)))
+            y_order.extend(by)
+        self.assertLen(y_order, 33)
+        self.assertLen(set(y_order), 33)
+
+        with self.assertRaisesRegex(ValueError, "must be divisible"):
+            array_data_adapter.ArrayDataAdapter(
+                x, y=y, batch_size=8, process_shard=(0, 3)
+            )
+        with self.assertRaisesRegex(ValueError, "shard index"):
+            array_data_adapter.ArrayDataAdapter(
+                x, y=y, batch_size=6, process_shard=(3, 3)
+            )
+
+    @parameterized.named_parameters(named_product(shuffle=[False, True]))
+    def test_memmap(self, shuffle):
+        path = os.path.join(self.get_temp_dir(), "x.npy")
+        np.save(path, np.arange(200, dtype="float64").reshape((100, 2)))
+        x = np.load(path, mmap_mode="r")
+        y = np.arange(100, dtype="int32")
+        adapter = array_data_adapter.ArrayDataAdapter(
+            x, y=y, batch_size=16, shuffle=shuffle
+        )
+        # The memory-mapped array is not cast, and loaded, as a whole.
+        inputs = array_slicing.convert_to_sliceable(
+            adapter._inputs, target_backend="numpy"
+        )
+        self.assertIsInstance(inputs[0].array, np.memmap)
+        self.assertEqual(inputs[0].array.dtype, "float64")
+
+        if backend.backend() == "numpy":
+            it = adapter.get_numpy_iterator()
+        elif backend.backend() == "tensorflow":
+            it = adapter.get_tf_dataset()
+        elif backend.backend() == "jax":
+            it = adapter.get_jax_iterator()
+        elif backend.backend() == "torch":
+            it = adapter.get_torch_dataloader()
+
+        y_order = []
+        for bx, by in it:
+            self.assertEqual(
+                backend.standardize_dtype(bx.dtype), backend.floatx()
+            )
+            bx, by = np.asarray(bx), np.asarray(by)
+            self.assertAllClose(bx[:, 0], by * 2)
+            y_order.extend(by)
+        self.assertAllClose(sorted(y_order), np.arange(100))
+        if not shuffle:
+            self.assertAllClose(y_order, np.arange(100))
+
     @parameterized.named_parameters(
         named_product(target_encoding=["int", "categorical"])
     )
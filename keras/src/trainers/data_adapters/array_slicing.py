@@ -122,6 +122,35 @@ class NumpySliceable(Sliceable):
     pass
 
 
+class NumpyMemmapSliceable(NumpySliceable):
+    """`Sliceable` for NumPy arrays memory-mapped from disk.
+
+    The slices are only read into memory, and cast, when they are converted,
+    so that the full array is never loaded into memory.
+    """
+
+    @classmethod
+    def cast(cls, x, dtype):
+        # Casting the full array would load it into memory, the slices are
+        # cast when they are converted instead.
+        return x
+
+    @classmethod
+    def convert_to_numpy(cls, x):
+        x = np.array(x)
+        if backend.is_float_dtype(x.dtype):
+            x = x.astype(backend.floatx(), copy=False)
+        return x
+
+    @classmethod
+    def convert_to_jax_compatible(cls, x):
+        return cls.convert_to_numpy(x)
+
+    @classmethod
+    def convert_to_torch_compatible(cls, x):
+        return cls.convert_to_numpy(x)
+
+
 class TensorflowSliceable(Sliceable):
     def __getitem__(self, indices):
         from keras.src.utils.module_utils import tensorflow as tf
@@ -380,7 +409,9 @@ def convert_to_sliceable(arrays, target_backend=None):
             x = tf.convert_to_tensor(x, dtype="string")
 
         # Step 1. Determine which Sliceable class to use.
-        if isinstance(x, np.ndarray):
+        if isinstance(x, np.memmap):
+            sliceable_class = NumpyMemmapSliceable
+        elif isinstance(x, np.ndarray):
             sliceable_class = NumpySliceable
         elif data_adapter_utils.is_tensorflow_tensor(x):
             if data_adapter_utils.is_tensorflow_ragged(x):
@@ -114,6 +114,18 @@ def check_data_cardinality(data):
         raise ValueError(msg)
 
 
+def check_process_shard(process_shard):
+    """Checks a `(shard_index, num_shards)` tuple of the data adapters."""
+    if process_shard is None:
+        return
+    shard_index, num_shards = process_shard
+    if num_shards < 1 or not 0 <= shard_index < num_shards:
+        raise ValueError(
+            "The shard index must be in `[0, num_shards)`. Received: "
+            f"process_shard={process_shard}"
+        )
+
+
 def class_weight_to_sample_weights(y, class_weight):
     sample_weight = np.ones(shape=(y.shape[0],), dtype=backend.floatx())
     if len(y.shape) > 1:
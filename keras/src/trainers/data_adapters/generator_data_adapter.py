@@ -6,11 +6,18 @@ from keras.src.trainers.data_adapters.data_adapter import DataAdapter
 
 
 class GeneratorDataAdapter(DataAdapter):
-    """Adapter for Python generators."""
+    """Adapter for Python generators.
 
-    def __init__(self, generator):
+    Args:
+        generator: The Python generator.
+        bucketing: Optional `ShapeBucketing` padding the sequences of every
+            batch to a bucket length.
+    """
+
+    def __init__(self, generator, bucketing=None):
         first_batches, generator = peek_and_restore(generator)
         self.generator = generator
+        self.bucketing = bucketing
         self._first_batches = first_batches
         self._output_signature = None
         if not isinstance(first_batches[0], tuple):
@@ -22,11 +29,16 @@ class GeneratorDataAdapter(DataAdapter):
                 f"Received: {first_batches[0]}"
             )
 
+    def _get_iterator(self):
+        if self.bucketing is not None:
+            return map(self.bucketing, self.generator())
+        return self.generator()
+
     def get_numpy_iterator(self):
-        return data_adapter_utils.get_numpy_iterator(self.generator())
+        return data_adapter_utils.get_numpy_iterator(self._get_iterator())
 
     def get_jax_iterator(self):
-        return data_adapter_utils.get_jax_iterator(self.generator())
+        return data_adapter_utils.get_jax_iterator(self._get_iterator())
 
     def get_tf_dataset(self):
         from keras.src.utils.module_utils import tensorflow as tf
@@ -49,16 +61,21 @@ class GeneratorDataAdapter(DataAdapter):
             return x
 
         def get_tf_iterator():
-            for batch in self.generator():
+            for batch in self._get_iterator():
                 batch = tree.map_structure(
                     convert_to_tf, batch, self._output_signature
                 )
                 yield batch
 
         if self._output_signature is None:
-            self._output_signature = data_adapter_utils.get_tensor_spec(
-                self._first_batches
-            )
+            if self.bucketing is not None:
+                self._output_signature = self.bucketing.get_tensor_spec(
+                    self._first_batches
+                )
+            else:
+                self._output_signature = data_adapter_utils.get_tensor_spec(
+                    self._first_batches
+                )
         ds = tf.data.Dataset.from_generator(
             get_tf_iterator,
             output_signature=self._output_signature,
@@ -67,7 +84,7 @@ class GeneratorDataAdapter(DataAdapter):
         return ds
 
     def get_torch_dataloader(self):
-        return data_adapter_utils.get_torch_dataloader(self.generator())
+        return data_adapter_utils.get_torch_dataloader(self._get_iterator())
 
     @property
     def num_batches(self):
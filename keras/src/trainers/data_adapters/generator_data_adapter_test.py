@@ -14,6 +14,7 @@ from keras.src import backend
 from keras.src import testing
 from keras.src.testing.test_utils import named_product
 from keras.src.trainers.data_adapters import generator_data_adapter
+from keras.src.trainers.data_adapters import shape_bucketing
 
 
 def example_generator(x, y, sample_weight=None, batch_size=32):
@@ -136,6 +137,32 @@ class GeneratorDataAdapterTest(testing.TestCase):
                 self.assertEqual(bx.shape, (2, 6))
                 self.assertEqual(by.shape, (2, 2))
 
+    def test_bucketing(self):
+        def generator():
+            # The first two batches have the same length, the sequence axis
+            # must still be left unknown in the `tf.data` signature.
+            yield np.ones([16, 2], "float32"), np.ones([16, 1], "float32")
+            yield np.ones([16, 2], "float32"), np.ones([16, 1], "float32")
+            yield np.ones([2, 6], "float32"), np.ones([2, 1], "float32")
+
+        bucketing = shape_bucketing.ShapeBucketing([4, 8])
+        adapter = generator_data_adapter.GeneratorDataAdapter(
+            generator(), bucketing=bucketing
+        )
+
+        if backend.backend() == "numpy":
+            it = adapter.get_numpy_iterator()
+        elif backend.backend() == "tensorflow":
+            it = adapter.get_tf_dataset()
+        elif backend.backend() == "jax":
+            it = adapter.get_jax_iterator()
+        elif backend.backend() == "torch":
+            it = adapter.get_torch_dataloader()
+
+        shapes = [tuple(bx.shape) for bx, _ in it]
+        self.assertEqual(shapes, [(16, 4), (16, 4), (2, 8)])
+        self.assertEqual(dict(bucketing.bucket_counts), {4: 2, 8: 1})
+
     @pytest.mark.skipif(
         backend.backend() != "tensorflow",
         reason="tf.data.Dataset specific behavior",
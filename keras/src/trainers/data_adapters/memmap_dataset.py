@@ -0,0 +1,213 @@
+import math
+import mmap
+import os
+
+import numpy as np
+
+from keras.src import tree
+from keras.src.api_export import keras_export
+from keras.src.trainers.data_adapters import data_adapter_utils
+from keras.src.trainers.data_adapters.py_dataset_adapter import PyDataset
+
+# Minimum size of the contiguous blocks of samples used by block shuffles.
+BLOCK_BYTES = 2**20
+# Number of blocks whose samples are shuffled together by block shuffles.
+SHUFFLE_BUFFER_BLOCKS = 16
+
+
+@keras_export("keras.utils.MemmapDataset")
+class MemmapDataset(PyDataset):
+    """`PyDataset` streaming batches from arrays memory-mapped from disk.
+
+    Only the samples of the requested batches are read from disk, so the
+    arrays can be much larger than the available memory.
+
+    When shuffling, samples are not drawn uniformly at random from the whole
+    arrays, which would read a different page of the files for almost every
+    sample. Instead, the samples are split into contiguous blocks of at
+    least `block_bytes` bytes, the order of the blocks is shuffled, and the
+    samples of every `shuffle_buffer_blocks` consecutive blocks are shuffled
+    together. A batch then only reads from a few contiguous regions of the
+    files, which keeps the page cache effective.
+
+    Example:
+
+    ```python
+    np.save("x.npy", x)
+    np.save("y.npy", y)
+    dataset = keras.utils.MemmapDataset(
+        "x.npy", "y.npy", batch_size=128, shuffle=True
+    )
+    model.fit(dataset, epochs=10)
+    ```
+
+    Args:
+        x: Input data. A path to a `.npy` file, which is opened with
+            `mmap_mode="r"`, a `np.memmap` or NumPy array, or a nested
+            structure (list, tuple or dict) of those.
+        y: Optional target data, in the same formats as `x`.
+        sample_weight: Optional sample weights, in the same formats as `x`.
+        batch_size: Number of samples per batch. Defaults to 32.
+        shuffle: Whether to shuffle the samples at the end of each epoch,
+            using a block shuffle. Defaults to `False`.
+        block_bytes: Minimum number of bytes in a block of contiguous samples
+            used by the block shuffle. Rounded up to a multiple of the page
+            size. Defaults to 1 MiB.
+        shuffle_buffer_blocks: Number of blocks whose samples are shuffled
+            together. Larger values shuffle better but read from more regions
+            of the files per batch. Defaults to 16.
+        **kwargs: Arguments passed to `keras.utils.PyDataset`, such as
+            `workers` and `use_multiprocessing`.
+    """
+
+    def __init__(
+        self,
+        x,
+        y=None,
+        sample_weight=None,
+        batch_size=32,
+        shuffle=False,
+        block_bytes=BLOCK_BYTES,
+        shuffle_buffer_blocks=SHUFFLE_BUFFER_BLOCKS,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self._arrays = tree.map_structure(
+            _open_array,
+            data_adapter_utils.pack_x_y_sample_weight(x, y, sample_weight),
+        )
+        data_adapter_utils.check_data_cardinality(self._arrays)
+        self._num_samples = len(tree.flatten(self._arrays)[0])
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.block_size = get_block_size(self._arrays, block_bytes)
+        self.shuffle_buffer_blocks = shuffle_buffer_blocks
+        self._permutation = None
+        if self.shuffle:
+            self._shuffle_samples()
+
+    def _shuffle_samples(self):
+        self._permutation = get_block_permutation(
+            self._num_samples, self.block_size, self.shuffle_buffer_blocks
+        )
+
+    @property
+    def num_batches(self):
+        return math.ceil(self._num_samples / self.batch_size)
+
+    def __getitem__(self, index):
+        start = index * self.batch_size
+        stop = min(start + self.batch_size, self._num_samples)
+        if self._permutation is None:
+            indices = slice(start, stop)
+        else:
+            # Read the samples in the order in which they are stored.
+            indices = np.sort(self._permutation[start:stop])
+        return tree.map_structure(lambda x: np.array(x[indices]), self._arrays)
+
+    def on_epoch_end(self):
+        if self.shuffle:
+            self._shuffle_samples()
+
+    def __getstate__(self):
+        # Memory-mapped arrays would be pickled with all their data when
+        # sent to worker processes, send how to map them again instead.
+        state = self.__dict__.copy()
+        state["_arrays"] = tree.map_structure(
+            _MemmapReference.from_array, self._arrays
+        )
+        return state
+
+    def __setstate__(self, state):
+        state["_arrays"] = tree.map_structure(
+            lambda x: x.open() if isinstance(x, _MemmapReference) else x,
+            state["_arrays"],
+        )
+        self.__dict__.update(state)
+
+
+def _open_array(x):
+    if isinstance(x, (str, os.PathLike)):
+        return np.load(x, mmap_mode="r")
+    return x
+
+
+class _MemmapReference:
+    """Reference to a memory-mapped file, used to pickle `np.memmap`s."""
+
+    def __init__(self, filename, dtype, shape, offset, order):
+        self.filename = filename
+        self.dtype = dtype
+        self.shape = shape
+        self.offset = offset
+        self.order = order
+
+    @classmethod
+    def from_array(cls, x):
+        # Views on a `np.memmap` do not keep track of their offset in the
+        # file, only the arrays mapping a file directly can be referenced.
+        if not isinstance(x, np.memmap) or not isinstance(x.base, mmap.mmap):
+            return x
+        order = "F" if x.flags.f_contiguous and x.ndim > 1 else "C"
+        return cls(x.filename, x.dtype, x.shape, x.offset, order)
+
+    def open(self):
+        return np.memmap(
+            self.filename,
+            dtype=self.dtype,
+            mode="r",
+            offset=self.offset,
+            shape=self.shape,
+            order=self.order,
+        )
+
+
+def get_block_size(arrays, block_bytes=BLOCK_BYTES):
+    """Returns the number of samples in a block of at least `block_bytes`.
+
+    Args:
+        arrays: structure of arrays with the same number of samples.
+        block_bytes: minimum size of a block in bytes, rounded up to a
+            multiple of the page size.
+
+    Returns:
+        The number of samples per block, based on the array using the most
+        bytes per sample.
+    """
+    block_bytes = math.ceil(block_bytes / mmap.PAGESIZE) * mmap.PAGESIZE
+    sample_bytes = max(
+        x.dtype.itemsize * math.prod(x.shape[1:])
+        for x in tree.flatten(arrays)
+        if x is not None
+    )
+    return max(1, math.ceil(block_bytes / max(sample_bytes, 1)))
+
+
+def get_block_permutation(
+    num_samples, block_size, shuffle_buffer_blocks=SHUFFLE_BUFFER_BLOCKS
+):
+    """Returns a locality-aware permutation of `range(num_samples)`.
+
+    The samples are split into contiguous blocks of `block_size` samples and
+    the order of the blocks is shuffled. Then the samples of every
+    `shuffle_buffer_blocks` consecutive blocks are shuffled together.
+
+    Args:
+        num_samples: number of samples to permute.
+        block_size: number of contiguous samples in a block.
+        shuffle_buffer_blocks: number of blocks shuffled together.
+
+    Returns:
+        A NumPy array with the permuted indices.
+    """
+    num_blocks = math.ceil(num_samples / block_size)
+    block_order = np.random.permutation(num_blocks)
+    offsets = np.arange(block_size)
+    permutation = []
+    for start in range(0, num_blocks, shuffle_buffer_blocks):
+        blocks = block_order[start : start + shuffle_buffer_blocks]
+        indices = (blocks[:, None] * block_size + offsets).ravel()
+        indices = indices[indices < num_samples]
+        np.random.shuffle(indices)
+        permutation.append(indices)
+    return np.concatenate(permutation)
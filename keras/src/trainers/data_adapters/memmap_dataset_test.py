@@ -0,0 +1,94 @@
+import os
+import pickle
+
+import numpy as np
+import pytest
+from absl.testing import parameterized
+
+from keras.src import layers
+from keras.src import models
+from keras.src import testing
+from keras.src.trainers.data_adapters import memmap_dataset
+from keras.src.trainers.data_adapters import py_dataset_adapter
+
+
+class MemmapDatasetTest(testing.TestCase):
+    def save_arrays(self, num_samples=100):
+        x = np.arange(num_samples * 4, dtype="float32").reshape((-1, 4))
+        y = np.arange(num_samples, dtype="int32")
+        x_path = os.path.join(self.get_temp_dir(), "x.npy")
+        y_path = os.path.join(self.get_temp_dir(), "y.npy")
+        np.save(x_path, x)
+        np.save(y_path, y)
+        return x_path, y_path
+
+    @parameterized.named_parameters(
+        [
+            {"testcase_name": "ordered", "shuffle": False},
+            {"testcase_name": "shuffled", "shuffle": True},
+        ]
+    )
+    def test_basic_flow(self, shuffle):
+        x_path, y_path = self.save_arrays()
+        dataset = memmap_dataset.MemmapDataset(
+            x_path, y_path, batch_size=16, shuffle=shuffle, block_bytes=1
+        )
+        self.assertIsInstance(dataset._arrays[0], np.memmap)
+        self.assertEqual(dataset.num_batches, 7)
+
+        y_order = []
+        for i in range(dataset.num_batches):
+            bx, by = dataset[i]
+            self.assertNotIsInstance(bx, np.memmap)
+            self.assertEqual(len(bx), 16 if i < 6 else 4)
+            self.assertAllClose(bx[:, 0], by * 4)
+            y_order.extend(by)
+        dataset.on_epoch_end()
+        self.assertAllClose(sorted(y_order), np.arange(100))
+        if shuffle:
+            self.assertNotAllClose(y_order, np.arange(100))
+        else:
+            self.assertAllClose(y_order, np.arange(100))
+
+    def test_block_permutation(self):
+        permutation = memmap_dataset.get_block_permutation(
+            1000, block_size=10, shuffle_buffer_blocks=4
+        )
+        self.assertAllClose(sorted(permutation), np.arange(1000))
+        self.assertNotAllClose(permutation, np.arange(1000))
+        # Every window of 40 samples is made of 4 whole blocks.
+        for start in range(0, 1000, 40):
+            blocks = np.unique(permutation[start : start + 40] // 10)
+            self.assertLen(blocks, 4)
+
+    def test_block_size(self):
+        arrays = (np.zeros((10, 256), "float32"), np.zeros((10,), "int32"))
+        self.assertEqual(memmap_dataset.get_block_size(arrays, 2**20), 1024)
+        self.assertEqual(memmap_dataset.get_block_size(arrays, 1), 4)
+
+    def test_pickling_keeps_memmap(self):
+        x_path, y_path = self.save_arrays()
+        dataset = memmap_dataset.MemmapDataset(x_path, y_path, batch_size=16)
+        state = pickle.dumps(dataset)
+        self.assertLess(len(state), 1000)
+        restored = pickle.loads(state)
+        self.assertIsInstance(restored._arrays[0], np.memmap)
+        self.assertAllClose(restored[2][0], dataset[2][0])
+
+    @pytest.mark.requires_trainable_backend
+    def test_fit(self):
+        x_path, y_path = self.save_arrays()
+        dataset = memmap_dataset.MemmapDataset(
+            x_path,
+            y_path,
+            batch_size=16,
+            shuffle=True,
+            workers=2,
+            use_multiprocessing=True,
+        )
+        adapter = py_dataset_adapter.PyDatasetAdapter(dataset)
+        self.assertIsNotNone(adapter.enqueuer)
+        model = models.Sequential([layers.Dense(1)])
+        model.compile(optimizer="sgd", loss="mse")
+        history = model.fit(dataset, epochs=2, verbose=0)
+        self.assertLen(history.history["loss"], 2)
@@ -1,5 +1,9 @@
+import collections
 import itertools
 import multiprocessing.dummy
+import multiprocessing.resource_tracker
+import multiprocessing.shared_memory
+import os
 import queue
 import random
 import threading
@@ -9,9 +13,12 @@ from contextlib import closing
 
 import numpy as np
 
+from keras.src import backend
+from keras.src import tree
 from keras.src.api_export import keras_export
 from keras.src.trainers.data_adapters import data_adapter_utils
 from keras.src.trainers.data_adapters.data_adapter import DataAdapter
+from keras.src.trainers.data_adapters.shape_bucketing import ShapeBucketing
 
 
 @keras_export(["keras.utils.PyDataset", "keras.utils.Sequence"])
@@ -40,6 +47,42 @@ class PyDataset:
             multiprocessed setting.
             Reduce this value to reduce the CPU memory consumption of
             your dataset. Defaults to 10.
+        use_shared_memory: Whether worker processes should send batches
+            back through a ring of shared memory buffers instead of
+            pickling them. Only used when `use_multiprocessing=True`.
+            Batches made of NumPy arrays are then received as zero-copy
+            views, which avoids serializing large batches. These views are
+            only valid until `keras.config.data_prefetch_size() + 1` more
+            batches are requested, so copy them if you need to keep them
+            around. The batches are copied out of the shared memory for the
+            JAX, TensorFlow and PyTorch iterators, since tensors may keep
+            referencing the memory of the arrays. Defaults to `False`.
+        persistent_workers: Whether to keep the workers and their queue
+            alive from one epoch to the next instead of starting them again
+            at each epoch. The first batches of an epoch are then prefetched
+            while the previous epoch is still finishing, which removes the
+            startup stall at epoch boundaries and validation passes. Since
+            the workers keep running, they do not see changes made by
+            `on_epoch_begin()` or `on_epoch_end()`, and the batches of the
+            next epoch may be requested before these methods are called.
+            Defaults to `False`.
+        bucket_lengths: Optional list of sequence lengths. When set, the
+            sequences of every batch are padded with zeros along their
+            second axis to the smallest of these lengths that fits them.
+            Compiled step functions are traced again for every new input
+            shape, padding to a few lengths bounds the number of traces
+            when the sequences have variable lengths. All the inputs with
+            at least 2 dimensions are padded, so they must have the same
+            length within a batch. Dict inputs also get a boolean mask of
+            the sequence steps under the `"padding_mask"` key, see
+            `keras.utils.ShapeBucketing`. The number of batches padded to
+            each length is reported in `bucket_counts`. Defaults to `None`.
+        bucket_targets: Whether the targets are sequences of the same
+            length as the inputs, to be padded as well when `bucket_lengths`
+            is set. The sample weights are then multiplied by a mask of
+            shape `(batch_size, bucket_length)`, which is added as sample
+            weights if the batches have none, so that the padded steps do
+            not contribute to the loss. Defaults to `False`.
 
     Notes:
 
@@ -90,10 +133,23 @@ class PyDataset:
     ```
     """
 
-    def __init__(self, workers=1, use_multiprocessing=False, max_queue_size=10):
+    def __init__(
+        self,
+        workers=1,
+        use_multiprocessing=False,
+        max_queue_size=10,
+        use_shared_memory=False,
+        persistent_workers=False,
+        bucket_lengths=None,
+        bucket_targets=False,
+    ):
         self._workers = workers
         self._use_multiprocessing = use_multiprocessing
         self._max_queue_size = max_queue_size
+        self._use_shared_memory = use_shared_memory
+        self._persistent_workers = persistent_workers
+        self._bucket_lengths = bucket_lengths
+        self._bucket_targets = bucket_targets
 
     def _warn_if_super_not_called(self):
         warn = False
@@ -106,12 +162,26 @@ class PyDataset:
         if not hasattr(self, "_max_queue_size"):
             self._max_queue_size = 10
             warn = True
+        if not hasattr(self, "_use_shared_memory"):
+            self._use_shared_memory = False
+            warn = True
+        if not hasattr(self, "_persistent_workers"):
+            self._persistent_workers = False
+            warn = True
+        if not hasattr(self, "_bucket_lengths"):
+            self._bucket_lengths = None
+            warn = True
+        if not hasattr(self, "_bucket_targets"):
+            self._bucket_targets = False
+            warn = True
         if warn:
             warnings.warn(
                 "Your `PyDataset` class should call "
                 "`super().__init__(**kwargs)` in its constructor. "
                 "`**kwargs` can include `workers`, "
-                "`use_multiprocessing`, `max_queue_size`. Do not pass "
+                "`use_multiprocessing`, `max_queue_size`, "
+                "`use_shared_memory`, `persistent_workers`, "
+                "`bucket_lengths`, `bucket_targets`. Do not pass "
                 "these arguments to `fit()`, as they will be ignored.",
                 stacklevel=2,
             )
@@ -143,6 +213,55 @@ class PyDataset:
     def max_queue_size(self, value):
         self._max_queue_size = value
 
+    @property
+    def use_shared_memory(self):
+        self._warn_if_super_not_called()
+        return self._use_shared_memory
+
+    @use_shared_memory.setter
+    def use_shared_memory(self, value):
+        self._use_shared_memory = value
+
+    @property
+    def persistent_workers(self):
+        self._warn_if_super_not_called()
+        return self._persistent_workers
+
+    @persistent_workers.setter
+    def persistent_workers(self, value):
+        self._persistent_workers = value
+
+    @property
+    def bucket_lengths(self):
+        self._warn_if_super_not_called()
+        return self._bucket_lengths
+
+    @bucket_lengths.setter
+    def bucket_lengths(self, value):
+        self._bucket_lengths = value
+
+    @property
+    def bucket_targets(self):
+        self._warn_if_super_not_called()
+        return self._bucket_targets
+
+    @bucket_targets.setter
+    def bucket_targets(self, value):
+        self._bucket_targets = value
+
+    @property
+    def bucket_counts(self):
+        """Number of batches padded to each of the `bucket_lengths`.
+
+        Returns:
+            A `collections.Counter` mapping the bucket lengths to the number
+            of batches padded to them, across all the iterations over the
+            dataset.
+        """
+        if not hasattr(self, "_bucket_counts"):
+            self._bucket_counts = collections.Counter()
+        return self._bucket_counts
+
     def __getitem__(self, index):
         """Gets batch at position `index`.
 
@@ -180,20 +299,42 @@ class PyDataset:
 
 
 class PyDatasetAdapter(DataAdapter):
-    """Adapter for `keras.utils.PyDataset` instances."""
+    """Adapter for `keras.utils.PyDataset` instances.
+
+    With `process_shard=(shard_index, num_shards)`, every process only
+    loads its share of the batches, e.g. for multi-process distributions.
+    The batches of the `PyDataset` are then the per-process batches. The
+    processes shuffle the batches in the same order, with a random number
+    generator seeded from the global NumPy generator, which must then be
+    seeded the same way in every process, e.g. with
+    `keras.utils.set_random_seed()`.
+    """
 
     def __init__(
         self,
         x,
         class_weight=None,
         shuffle=False,
+        process_shard=None,
     ):
         self.py_dataset = x
         self.class_weight = class_weight
         self.enqueuer = None
         self.shuffle = shuffle
+        data_adapter_utils.check_process_shard(process_shard)
+        self.process_shard = process_shard
+        self.rng = None
+        if process_shard is not None:
+            self.rng = np.random.default_rng(np.random.randint(2**31 - 1))
         self._output_signature = None
         self._within_epoch = False
+        self.bucketing = None
+        if self.py_dataset.bucket_lengths:
+            self.bucketing = ShapeBucketing(
+                self.py_dataset.bucket_lengths,
+                pad_targets=self.py_dataset.bucket_targets,
+                bucket_counts=self.py_dataset.bucket_counts,
+            )
 
         workers = self.py_dataset.workers
         use_multiprocessing = self.py_dataset.use_multiprocessing
@@ -204,6 +345,12 @@ class PyDatasetAdapter(DataAdapter):
                 use_multiprocessing=use_multiprocessing,
                 max_queue_size=self.py_dataset.max_queue_size,
                 shuffle=self.shuffle,
+                use_shared_memory=(
+                    use_multiprocessing and self.py_dataset.use_shared_memory
+                ),
+                persistent_workers=self.py_dataset.persistent_workers,
+                process_shard=self.process_shard,
+                rng=self.rng,
             )
 
     def _standardize_batch(self, batch):
@@ -235,15 +382,16 @@ class PyDatasetAdapter(DataAdapter):
         return batch
 
     def _infinite_generator(self):
-        for i in itertools.count():
+        for i in _get_infinite_indices(self.process_shard):
             yield self.py_dataset[i]
 
     def _finite_generator(self):
-        indices = range(self.py_dataset.num_batches)
-        if self.shuffle:
-            indices = list(indices)
-            random.shuffle(indices)
-
+        indices = _get_epoch_indices(
+            self.py_dataset.num_batches,
+            self.shuffle,
+            process_shard=self.process_shard,
+            rng=self.rng,
+        )
         for i in indices:
             yield self.py_dataset[i]
 
@@ -254,30 +402,45 @@ class PyDatasetAdapter(DataAdapter):
 
     def _finite_enqueuer_generator(self):
         self.enqueuer.start()
-        num_batches = self.py_dataset.num_batches
+        num_batches = self.num_batches
         for i, batch in enumerate(self.enqueuer.get()):
             yield batch
             if i >= num_batches - 1:
-                self.enqueuer.stop()
+                if not self.enqueuer.persistent_workers:
+                    self.enqueuer.stop()
                 return
 
     def _get_iterator(self):
         if self.enqueuer is None:
             if self.py_dataset.num_batches is None:
-                return self._infinite_generator()
+                iterator = self._infinite_generator()
             else:
-                return self._finite_generator()
+                iterator = self._finite_generator()
         else:
             if self.py_dataset.num_batches is None:
-                return self._infinite_enqueuer_generator()
+                iterator = self._infinite_enqueuer_generator()
             else:
-                return self._finite_enqueuer_generator()
+                iterator = self._finite_enqueuer_generator()
+        if self.bucketing is not None:
+            iterator = map(self.bucketing, iterator)
+        return iterator
+
+    def _get_copied_iterator(self):
+        """Iterator of batches copied out of the shared memory ring, if any.
+
+        Tensors may share the memory of the arrays they are created from,
+        e.g. with JAX on CPU, and outlive the slabs of the ring.
+        """
+        iterator = self._get_iterator()
+        if self.enqueuer is None or self.enqueuer.shared_memory_ring is None:
+            return iterator
+        return (tree.map_structure(np.copy, batch) for batch in iterator)
 
     def get_numpy_iterator(self):
         return data_adapter_utils.get_numpy_iterator(self._get_iterator())
 
     def get_jax_iterator(self):
-        return data_adapter_utils.get_jax_iterator(self._get_iterator())
+        return data_adapter_utils.get_jax_iterator(self._get_copied_iterator())
 
     def get_tf_dataset(self):
         from keras.src.utils.module_utils import tensorflow as tf
@@ -293,10 +456,35 @@ class PyDatasetAdapter(DataAdapter):
             ]
             if len(batches) == 0:
                 raise ValueError("The PyDataset has length 0")
-            self._output_signature = data_adapter_utils.get_tensor_spec(batches)
+            if self.bucketing is not None:
+                self._output_signature = self.bucketing.get_tensor_spec(batches)
+            else:
+                self._output_signature = data_adapter_utils.get_tensor_spec(
+                    batches
+                )
+
+        if self.enqueuer is not None and self.enqueuer.persistent_workers:
+            # `tf.data` keeps its generators alive, only reference the adapter
+            # weakly so that persistent workers are stopped once it is deleted.
+            adapter = weakref.ref(self)
+        else:
+            adapter = lambda: self
+        copy_batches = (
+            self.enqueuer is not None
+            and self.enqueuer.shared_memory_ring is not None
+        )
+
+        def generator():
+            for batch in adapter()._get_iterator():
+                if copy_batches:
+                    # `tf.data` may keep referencing the yielded arrays after
+                    # the next batch is requested, so copy them out of the
+                    # shared memory ring.
+                    batch = tree.map_structure(np.copy, batch)
+                yield batch
 
         ds = tf.data.Dataset.from_generator(
-            self._get_iterator,
+            generator,
             output_signature=self._output_signature,
         )
         if self.enqueuer is not None:
@@ -312,7 +500,9 @@ class PyDatasetAdapter(DataAdapter):
         return ds
 
     def get_torch_dataloader(self):
-        return data_adapter_utils.get_torch_dataloader(self._get_iterator())
+        return data_adapter_utils.get_torch_dataloader(
+            self._get_copied_iterator()
+        )
 
     def on_epoch_begin(self):
         if self._within_epoch:
@@ -326,20 +516,66 @@ class PyDatasetAdapter(DataAdapter):
         self.py_dataset.on_epoch_begin()
 
     def on_epoch_end(self):
-        if self.enqueuer:
+        if self.enqueuer and not self.enqueuer.persistent_workers:
             self.enqueuer.stop()
         self.py_dataset.on_epoch_end()
         self._within_epoch = False
 
+    def __del__(self):
+        # Persistent workers keep running between epochs, stop them once the
+        # adapter is no longer used.
+        enqueuer = getattr(self, "enqueuer", None)
+        if enqueuer is not None and enqueuer.persistent_workers:
+            enqueuer.stop()
+
     @property
     def num_batches(self):
-        return self.py_dataset.num_batches
+        num_batches = self.py_dataset.num_batches
+        if num_batches is not None and self.process_shard is not None:
+            num_batches //= self.process_shard[1]
+        return num_batches
 
     @property
     def batch_size(self):
         return None
 
 
+def _get_epoch_indices(num_batches, shuffle, process_shard=None, rng=None):
+    """Returns the indices of the batches of one epoch of a finite dataset.
+
+    Args:
+        num_batches: The number of batches of the dataset.
+        shuffle: Whether to shuffle the batches.
+        process_shard: Optional tuple `(shard_index, num_shards)`. Only
+            the indices of the batches loaded by this process are returned:
+            the batches are dealt out to the processes in turn, and the last
+            batches are dropped so that every process loads the same number
+            of batches.
+        rng: Optional NumPy random `Generator` to shuffle the batches with,
+            instead of the global Python generator. It must produce the same
+            permutations in every process.
+    """
+    indices = list(range(num_batches))
+    if shuffle:
+        if rng is None:
+            random.shuffle(indices)
+        else:
+            rng.shuffle(indices)
+    if process_shard is not None:
+        shard_index, num_shards = process_shard
+        num_batches -= num_batches % num_shards
+        indices = indices[shard_index:num_batches:num_shards]
+    return indices
+
+
+def _get_infinite_indices(process_shard=None):
+    """Returns the indices of the batches of an infinite dataset."""
+    if process_shard is None:
+        return itertools.count()
+    shard_index, num_shards = process_shard
+    return itertools.count(shard_index, num_shards)
+
+
 # Global variables to be shared across processes
 _SHARED_SEQUENCES = {}
 # We use a Value to provide unique id to different processes.
@@ -352,6 +588,10 @@ _SEQUENCE_COUNTER = None
 _DATA_POOLS = weakref.WeakSet()
 _WORKER_ID_QUEUE = None  # Only created if needed.
 _FORCE_THREADPOOL = False
+# Shared memory slabs attached by a worker, keyed by slab index.
+_ATTACHED_SLABS = {}
+# Alignment of the arrays written in a shared memory slab.
+_SHARED_MEMORY_ALIGNMENT = 64
 
 
 def get_pool_class(use_multiprocessing):
@@ -388,6 +628,192 @@ def get_index(uid, i):
     return _SHARED_SEQUENCES[uid][i]
 
 
+def get_index_shared_memory(uid, i, slab_index, slab_name, slab_size):
+    """Get the value at index `i` and write it in a shared memory slab.
+
+    This methods is called from worker processes.
+
+    Args:
+        uid: int, PyDataset identifier
+        i: index
+        slab_index: index of the slab in the `SharedMemoryRing`.
+        slab_name: name of the shared memory block backing the slab.
+        slab_size: size of the slab in bytes.
+
+    Returns:
+        A `SharedMemoryBatch`. If the batch is not made of NumPy arrays or
+        does not fit in the slab, the batch itself is attached to it and
+        will be pickled.
+    """
+    batch = _SHARED_SEQUENCES[uid][i]
+    flat_batch = tree.flatten(batch)
+    offsets = []
+    nbytes = 0
+    for x in flat_batch:
+        if not isinstance(x, np.ndarray) or x.dtype.hasobject:
+            return SharedMemoryBatch(slab_index, batch=batch)
+        nbytes = _align(nbytes)
+        offsets.append(nbytes)
+        nbytes += x.nbytes
+    if slab_name is None or nbytes > slab_size:
+        return SharedMemoryBatch(slab_index, batch=batch, nbytes=nbytes)
+
+    slab = _ATTACHED_SLABS.get(slab_index)
+    if slab is None or slab.name != slab_name:
+        if slab is not None:
+            slab.close()
+        slab = multiprocessing.shared_memory.SharedMemory(name=slab_name)
+        _ATTACHED_SLABS[slab_index] = slab
+    specs = []
+    for x, offset in zip(flat_batch, offsets):
+        view = np.ndarray(x.shape, x.dtype, buffer=slab.buf, offset=offset)
+        view[...] = x
+        specs.append(SharedArraySpec(offset, x.shape, x.dtype))
+    return SharedMemoryBatch(
+        slab_index, specs=tree.pack_sequence_as(batch, specs), nbytes=nbytes
+    )
+
+
+def _align(nbytes, alignment=_SHARED_MEMORY_ALIGNMENT):
+    return -(-nbytes // alignment) * alignment
+
+
+class SharedArraySpec:
+    """Location of an array within a shared memory slab."""
+
+    __slots__ = ("offset", "shape", "dtype")
+
+    def __init__(self, offset, shape, dtype):
+        self.offset = offset
+        self.shape = shape
+        self.dtype = dtype
+
+
+class SharedMemoryBatch:
+    """Batch returned by a worker using the shared memory transport.
+
+    Args:
+        slab_index: index of the slab assigned to the worker.
+        specs: structure of `SharedArraySpec` matching the batch, if the
+            batch was written in the slab.
+        batch: the batch itself, if it could not be written in the slab.
+        nbytes: number of bytes needed to write the batch in a slab, or
+            `None` if the batch cannot be written in shared memory.
+    """
+
+    def __init__(self, slab_index, specs=None, batch=None, nbytes=None):
+        self.slab_index = slab_index
+        self.specs = specs
+        self.batch = batch
+        self.nbytes = nbytes
+
+
+class SharedMemoryRing:
+    """Ring of shared memory slabs used to send batches from workers.
+
+    Slabs are handed to workers with `acquire()`, read as zero-copy NumPy
+    views with `load()` and given back with `release()` once the batch has
+    been consumed. Slabs are created lazily and grown to fit the largest
+    batch seen so far, batches that do not fit are pickled instead.
+
+    Args:
+        num_slabs: number of slabs in the ring.
+    """
+
+    def __init__(self, num_slabs):
+        self.num_slabs = num_slabs
+        self.slab_size = 0
+        self._slabs = [None] * num_slabs
+        self._retired_slabs = []
+        self._free_slabs = queue.Queue()
+        for i in range(num_slabs):
+            self._free_slabs.put(i)
+        if os.name == "posix":
+            # Workers attaching to the slabs must share the resource tracker
+            # of this process, otherwise they unlink the slabs when exiting.
+            multiprocessing.resource_tracker.ensure_running()
+
+    def acquire(self, is_running):
+        """Acquires a free slab, blocking until one is available.
+
+        Args:
+            is_running: callable returning whether to keep waiting.
+
+        Returns:
+            A tuple `(slab_index, slab_name, slab_size)` or `None` if
+            `is_running()` became `False` while waiting.
+        """
+        while is_running():
+            try:
+                slab_index = self._free_slabs.get(block=True, timeout=0.1)
+            except queue.Empty:
+                continue
+            slab = self._slabs[slab_index]
+            if self.slab_size and (slab is None or slab.size < self.slab_size):
+                self._retire(slab)
+                slab = multiprocessing.shared_memory.SharedMemory(
+                    create=True, size=self.slab_size
+                )
+                self._slabs[slab_index] = slab
+            if slab is None:
+                return slab_index, None, 0
+            return slab_index, slab.name, slab.size
+        return None
+
+    def release(self, slab_index):
+        """Gives a slab back to the ring so that it can be reused."""
+        self._free_slabs.put(slab_index)
+
+    def load(self, shared_batch):
+        """Reads a `SharedMemoryBatch` without copying it.
+
+        The returned arrays are views on the slab and are only valid until
+        the slab is released. If the batch had to be pickled, the slab is
+        released right away and grown for the next batches.
+        """
+        if shared_batch.specs is None:
+            if shared_batch.nbytes is not None:
+                # Grow the slabs with some headroom for batches of varying
+                # sizes, rounded up to the page size.
+                self.slab_size = max(
+                    self.slab_size,
+                    _align(int(shared_batch.nbytes * 1.25), 4096),
+                )
+            self.release(shared_batch.slab_index)
+            return shared_batch.batch
+
+        buffer = self._slabs[shared_batch.slab_index].buf
+        return tree.map_structure(
+            lambda spec: np.ndarray(
+                spec.shape, spec.dtype, buffer=buffer, offset=spec.offset
+            ),
+            shared_batch.specs,
+        )
+
+    def close(self):
+        """Frees all the slabs of the ring."""
+        for slab in self._slabs:
+            self._retire(slab)
+        self._slabs = [None] * self.num_slabs
+        self._close_retired_slabs()
+
+    def _retire(self, slab):
+        if slab is not None:
+            slab.unlink()
+            self._retired_slabs.append(slab)
+        self._close_retired_slabs()
+
+    def _close_retired_slabs(self):
+        # Slabs can only be closed once all the views on them are gone.
+        retired_slabs = []
+        for slab in self._retired_slabs:
+            try:
+                slab.close()
+            except BufferError:
+                retired_slabs.append(slab)
+        self._retired_slabs = retired_slabs
+
+
 class PyDatasetEnqueuer:
     """Base class to enqueue inputs.
 
@@ -415,6 +841,7 @@ class PyDatasetEnqueuer:
         workers=1,
         use_multiprocessing=False,
         max_queue_size=10,
+        use_shared_memory=False,
     ):
         self.py_dataset = py_dataset
 
@@ -442,6 +869,17 @@ class PyDatasetEnqueuer:
         self.running = False
         self.start_stop_lock = threading.Lock()
         self.run_thread = None
+        self.shared_memory_ring = None
+        # Slabs holding the last batches yielded by `get()`, which may still
+        # be used by the consumer, e.g. when it prefetches batches.
+        self._pinned_slab_indices = collections.deque()
+        self._num_pinned_slabs = backend.config.data_prefetch_size() + 1
+        if use_shared_memory:
+            # One slab per queued batch, plus one for the batch being
+            # submitted and the pinned ones.
+            self.shared_memory_ring = SharedMemoryRing(
+                max_queue_size + 1 + self._num_pinned_slabs
+            )
         if use_multiprocessing:
             self.executor_fn = self._get_executor_init(workers)
         else:
@@ -501,12 +939,20 @@ class PyDatasetEnqueuer:
                         inputs = value.get()
                         self.future_queue.task_done()
                         if inputs is not None:
-                            self.ready_queue.put(inputs)
+                            self.ready_queue.put(
+                                self._copy_shared_batch(inputs)
+                            )
                     except queue.Empty:
                         break
                 self.run_thread.join()
+                if self.shared_memory_ring is not None:
+                    # Unlink the slabs, the batches still in use keep their
+                    # memory until they are garbage collected.
+                    self._release_pinned_slabs()
+                    self.shared_memory_ring.close()
 
             self.run_thread = None
+            self._release_pinned_slabs()
             _SHARED_SEQUENCES[self.uid] = None
 
     def _send_py_dataset(self):
@@ -514,8 +960,38 @@ class PyDatasetEnqueuer:
         # For new processes that may spawn
         _SHARED_SEQUENCES[self.uid] = self.py_dataset
 
+    def _release_pinned_slabs(self, num_pinned_slabs=0):
+        while len(self._pinned_slab_indices) > num_pinned_slabs:
+            self.shared_memory_ring.release(self._pinned_slab_indices.popleft())
+
+    def _load_shared_memory_batch(self, inputs):
+        """Turns a `SharedMemoryBatch` into views on the shared memory slab.
+
+        The slab is held until `self._num_pinned_slabs` more batches are
+        requested.
+        """
+        if not isinstance(inputs, SharedMemoryBatch):
+            return inputs
+        batch = self.shared_memory_ring.load(inputs)
+        if inputs.specs is not None:
+            self._pinned_slab_indices.append(inputs.slab_index)
+            self._release_pinned_slabs(self._num_pinned_slabs)
+        return batch
+
+    def _copy_shared_batch(self, inputs):
+        """Copies a `SharedMemoryBatch` out of its slab and releases it."""
+        if not isinstance(inputs, SharedMemoryBatch):
+            return inputs
+        batch = self.shared_memory_ring.load(inputs)
+        if inputs.specs is not None:
+            batch = tree.map_structure(np.copy, batch)
+            self.shared_memory_ring.release(inputs.slab_index)
+        return batch
+
     def __del__(self):
         self.stop(drain_queue_and_join=False)
+        if self.shared_memory_ring is not None:
+            self.shared_memory_ring.close()
 
     def _run(self):
         """Submits request to the executor and queue the `Future` objects."""
@@ -554,6 +1030,16 @@ class OrderedEnqueuer(PyDatasetEnqueuer):
         py_dataset: A `keras.utils.PyDataset` object.
         use_multiprocessing: use multiprocessing if True, otherwise threading
         shuffle: whether to shuffle the data at the beginning of each epoch
+        use_shared_memory: send batches back from the workers through a
+            `SharedMemoryRing` instead of pickling them.
+        persistent_workers: keep the workers and the queue running at the end
+            of an epoch for finite datasets, so that the batches of the next
+            epoch are requested before the current epoch is over. The
+            enqueuer then runs until `stop()` is called.
+        process_shard: optional tuple `(shard_index, num_shards)`, to
+            only request the batches loaded by this process.
+        rng: optional NumPy random `Generator` used to shuffle the batches
+            in the same order in every process.
     """
 
     def __init__(
@@ -563,15 +1049,26 @@ class OrderedEnqueuer(PyDatasetEnqueuer):
         use_multiprocessing=False,
         max_queue_size=10,
         shuffle=False,
+        use_shared_memory=False,
+        persistent_workers=False,
+        process_shard=None,
+        rng=None,
     ):
         super().__init__(
-            py_dataset, workers, use_multiprocessing, max_queue_size
+            py_dataset,
+            workers,
+            use_multiprocessing,
+            max_queue_size,
+            use_shared_memory,
         )
         self.shuffle = shuffle
+        self.persistent_workers = persistent_workers
+        self.process_shard = process_shard
+        self.rng = rng
         if self.py_dataset.num_batches is None:
             # For infinite datasets, `self.indices` is created here once for all
             # so that subsequent runs resume from where they stopped.
-            self.indices = itertools.count()
+            self.indices = _get_infinite_indices(process_shard)
 
     def _get_executor_init(self, workers):
         """Gets the Pool initializer for multiprocessing.
@@ -594,6 +1091,21 @@ class OrderedEnqueuer(PyDatasetEnqueuer):
 
         return pool_fn
 
+    def _epoch_indices(self):
+        """Returns an iterator over the indices of one epoch.
+
+        For finite datasets, the indices are created for each epoch so that
+        shuffling creates a different order each time.
+        """
+        return iter(
+            _get_epoch_indices(
+                self.py_dataset.num_batches,
+                self.shuffle,
+                process_shard=self.process_shard,
+                rng=self.rng,
+            )
+        )
+
     def _run(self):
         """Submits request to the executor and queue the `Future` objects.
 
@@ -601,25 +1113,34 @@ class OrderedEnqueuer(PyDatasetEnqueuer):
         """
         try:
             if self.py_dataset.num_batches is not None:
-                # For finite datasets, `self.indices` is created here so that
-                # shuffling creates different a order each time.
-                indices = range(self.py_dataset.num_batches)
-                if self.shuffle:
-                    indices = list(indices)
-                    random.shuffle(indices)
-                self.indices = iter(indices)
+                self.indices = self._epoch_indices()
             self._send_py_dataset()  # Share the initial py_dataset
 
             with closing(self.executor_fn(_SHARED_SEQUENCES)) as executor:
                 while self.is_running():
+                    slab = None
+                    if self.shared_memory_ring is not None:
+                        slab = self.shared_memory_ring.acquire(self.is_running)
+                        if slab is None:
+                            break
                     try:
                         i = next(self.indices)
-                        self.future_queue.put(
-                            executor.apply_async(get_index, (self.uid, i)),
-                            block=True,
-                        )
                     except StopIteration:
-                        break
+                        if self.persistent_workers:
+                            # Start prefetching the next epoch right away.
+                            self.indices = self._epoch_indices()
+                            i = next(self.indices)
+                        else:
+                            if slab is not None:
+                                self.shared_memory_ring.release(slab[0])
+                            break
+                    if slab is None:
+                        future = executor.apply_async(get_index, (self.uid, i))
+                    else:
+                        future = executor.apply_async(
+                            get_index_shared_memory, (self.uid, i, *slab)
+                        )
+                    self.future_queue.put(future, block=True)
         except Exception as e:
             self.future_queue.put(e)  # Report exception
 
@@ -638,7 +1159,7 @@ class OrderedEnqueuer(PyDatasetEnqueuer):
         while self.is_running():
             try:
                 inputs = self.ready_queue.get(block=False)
-                yield inputs
+                yield self._load_shared_memory_batch(inputs)
                 continue  # Retry the ready_queue
             except queue.Empty:
                 pass
@@ -650,7 +1171,7 @@ class OrderedEnqueuer(PyDatasetEnqueuer):
                     raise value  # Propagate exception from other thread
                 inputs = value.get()
                 if inputs is not None:
-                    yield inputs
+                    yield self._load_shared_memory_batch(inputs)
             except queue.Empty:
                 pass
             except Exception as e:
@@ -105,6 +105,14 @@ class PyDatasetAdapterTest(testing.TestCase):
                     "max_queue_size": 10,
                     "dataset_type": "np",
                 },
+                {
+                    "testcase_name": "multiprocessing_shared_memory",
+                    "workers": 2,
+                    "use_multiprocessing": True,
+                    "use_shared_memory": True,
+                    "max_queue_size": 10,
+                    "dataset_type": "np",
+                },
                 {
                     "testcase_name": "multithreading",
                     "workers": 2,
@@ -140,6 +148,7 @@ class PyDatasetAdapterTest(testing.TestCase):
         infinite,
         workers=0,
         use_multiprocessing=False,
+        use_shared_memory=False,
         max_queue_size=0,
     ):
         if use_multiprocessing and shuffle:
@@ -167,6 +176,7 @@ class PyDatasetAdapterTest(testing.TestCase):
             batch_size=16,
             workers=workers,
             use_multiprocessing=use_multiprocessing,
+            use_shared_memory=use_shared_memory,
             max_queue_size=max_queue_size,
             infinite=infinite,
         )
@@ -217,6 +227,129 @@ class PyDatasetAdapterTest(testing.TestCase):
         else:
             self.assertAllClose(sample_order, expected_order)
 
+    def test_shared_memory_ring(self):
+        x = np.random.random((160, 4)).astype("float32")
+        y = np.array([[i, i] for i in range(160)], dtype="float32")
+        py_dataset = DictPyDataset(
+            {"x": x, "y": y},
+            batch_size=16,
+            workers=2,
+            use_multiprocessing=True,
+            use_shared_memory=True,
+            max_queue_size=2,
+        )
+        adapter = py_dataset_adapter.PyDatasetAdapter(py_dataset)
+        ring = adapter.enqueuer.shared_memory_ring
+        num_pinned_slabs = backend.config.data_prefetch_size() + 1
+        self.assertEqual(ring.num_slabs, 3 + num_pinned_slabs)
+
+        for _ in range(3):
+            adapter.on_epoch_begin()
+            batches = []
+            for batch in adapter.get_numpy_iterator():
+                batches.append(
+                    (batch, {k: np.copy(v) for k, v in batch.items()})
+                )
+                # The last batches are not overwritten by the next ones.
+                for view, copy in batches[-num_pinned_slabs:]:
+                    self.assertAllClose(view["x"], copy["x"])
+                    self.assertAllClose(view["y"], copy["y"])
+            adapter.on_epoch_end()
+            self.assertAllClose(
+                np.concatenate([batch["x"] for _, batch in batches]), x
+            )
+            self.assertAllClose(
+                np.concatenate([batch["y"] for _, batch in batches]), y
+            )
+            # The slabs are unlinked when the workers are stopped.
+            self.assertEqual(ring._slabs, [None] * ring.num_slabs)
+        # The ring has grown to fit the batches and all slabs were recycled.
+        self.assertGreaterEqual(ring.slab_size, 16 * 6 * 4)
+        self.assertEqual(ring._free_slabs.qsize(), ring.num_slabs)
+
+        # The batches of the JAX and PyTorch iterators are copies.
+        adapter.on_epoch_begin()
+        batch = next(iter(adapter._get_copied_iterator()))
+        self.assertTrue(batch["x"].flags.owndata)
+        adapter.on_epoch_end()
+
+    @parameterized.named_parameters(
+        [
+            {"testcase_name": "multiprocessing", "use_multiprocessing": True},
+            {"testcase_name": "multithreading", "use_multiprocessing": False},
+        ]
+    )
+    def test_persistent_workers(self, use_multiprocessing):
+        x = np.random.random((64, 4)).astype("float32")
+        y = np.array([[i, i] for i in range(64)], dtype="float32")
+        py_dataset = ExamplePyDataset(
+            x,
+            y,
+            batch_size=16,
+            workers=2,
+            use_multiprocessing=use_multiprocessing,
+            max_queue_size=2,
+            persistent_workers=True,
+        )
+        adapter = py_dataset_adapter.PyDatasetAdapter(py_dataset, shuffle=True)
+        enqueuer = adapter.enqueuer
+        num_executors = [0]
+        executor_fn = enqueuer.executor_fn
+
+        def counting_executor_fn(*args):
+            num_executors[0] += 1
+            return executor_fn(*args)
+
+        enqueuer.executor_fn = counting_executor_fn
+
+        for _ in range(3):
+            adapter.on_epoch_begin()
+            sample_order = []
+            for _, by in adapter.get_numpy_iterator():
+                sample_order.extend(by[:, 0])
+            adapter.on_epoch_end()
+            self.assertAllClose(sorted(sample_order), list(range(64)))
+            # The workers keep running between epochs.
+            self.assertTrue(enqueuer.is_running())
+        self.assertEqual(num_executors[0], 1)
+
+        del adapter
+        self.assertFalse(enqueuer.is_running())
+
+    @parameterized.named_parameters(
+        named_product(workers=[1, 2], shuffle=[False, True])
+    )
+    def test_process_shard(self, workers, shuffle):
+        x = np.random.random((20, 4)).astype("float32")
+        y = np.arange(20, dtype="float32")
+        py_dataset = ExamplePyDataset(x, y, batch_size=4, workers=workers)
+        # One adapter per process, the processes having the same seed.
+        shard_batches = []
+        for shard_index in range(2):
+            np.random.seed(1337)
+            adapter = py_dataset_adapter.PyDatasetAdapter(
+                py_dataset, shuffle=shuffle, process_shard=(shard_index, 2)
+            )
+            # The last of the 5 batches is skipped.
+            self.assertEqual(adapter.num_batches, 2)
+            adapter.on_epoch_begin()
+            shard_batches.append(
+                [tuple(by) for _, by in adapter.get_numpy_iterator()]
+            )
+            adapter.on_epoch_end()
+
+        self.assertLen(shard_batches[0], 2)
+        self.assertLen(shard_batches[1], 2)
+        batches = shard_batches[0] + shard_batches[1]
+        self.assertLen(set(batches), 4)
+        if not shuffle:
+            self.assertEqual([batch[0] for batch in batches], [0, 8, 4, 12])
+
+        with self.assertRaisesRegex(ValueError, "shard index"):
+            py_dataset_adapter.PyDatasetAdapter(
+                py_dataset, process_shard=(2, 2)
+            )
+
     # TODO: test class_weight
     # TODO: test sample weights
     # TODO: test inference mode (single output)
@@ -337,6 +470,42 @@ class PyDatasetAdapterTest(testing.TestCase):
                 self.assertEqual(bx.shape, (2, 6))
                 self.assertEqual(by.shape, (2, 2))
 
+    def test_bucket_lengths(self):
+        lengths = [3, 5, 4, 8]
+
+        class TestPyDataset(py_dataset_adapter.PyDataset):
+            @property
+            def num_batches(self):
+                return len(lengths)
+
+            def __getitem__(self, idx):
+                x = np.ones([2, lengths[idx]], "int32")
+                return x, x.astype("float32")
+
+        dataset = TestPyDataset(bucket_lengths=[4, 8], bucket_targets=True)
+        adapter = py_dataset_adapter.PyDatasetAdapter(dataset, shuffle=False)
+
+        if backend.backend() == "numpy":
+            it = adapter.get_numpy_iterator()
+        elif backend.backend() == "tensorflow":
+            it = adapter.get_tf_dataset()
+        elif backend.backend() == "jax":
+            it = adapter.get_jax_iterator()
+        elif backend.backend() == "torch":
+            it = adapter.get_torch_dataloader()
+
+        for i, batch in enumerate(it):
+            self.assertEqual(len(batch), 3)
+            bx, by, bsw = batch
+            bucket_length = 4 if lengths[i] <= 4 else 8
+            self.assertEqual(tuple(bx.shape), (2, bucket_length))
+            self.assertEqual(tuple(by.shape), (2, bucket_length))
+            self.assertContainsExactSubsequence(str(bx.dtype), "int32")
+            mask = np.arange(bucket_length) < lengths[i]
+            self.assertAllClose(bx, np.tile(mask, (2, 1)))
+            self.assertAllClose(bsw, np.tile(mask, (2, 1)))
+        self.assertEqual(dict(dataset.bucket_counts), {4: 2, 8: 2})
+
     @parameterized.named_parameters(
         [
             {
@@ -345,6 +514,13 @@ class PyDatasetAdapterTest(testing.TestCase):
                 "use_multiprocessing": True,
                 "max_queue_size": 10,
             },
+            {
+                "testcase_name": "multiprocessing_shared_memory",
+                "workers": 2,
+                "use_multiprocessing": True,
+                "use_shared_memory": True,
+                "max_queue_size": 10,
+            },
             {
                 "testcase_name": "multithreading",
                 "workers": 2,
@@ -359,11 +535,13 @@ class PyDatasetAdapterTest(testing.TestCase):
         self,
         workers=0,
         use_multiprocessing=False,
+        use_shared_memory=False,
         max_queue_size=0,
     ):
         dataset = ExceptionPyDataset(
             workers=workers,
             use_multiprocessing=use_multiprocessing,
+            use_shared_memory=use_shared_memory,
             max_queue_size=max_queue_size,
         )
         adapter = py_dataset_adapter.PyDatasetAdapter(dataset, shuffle=False)
@@ -0,0 +1,244 @@
+import bisect
+import collections
+
+import numpy as np
+
+from keras.src import backend
+from keras.src import tree
+from keras.src.api_export import keras_export
+from keras.src.trainers.data_adapters import data_adapter_utils
+
+
+@keras_export("keras.utils.ShapeBucketing")
+class ShapeBucketing:
+    """Pads batches of sequences to a fixed set of lengths.
+
+    Compiled step functions are traced again for every new input shape, so
+    batches of sequences of variable lengths would trigger a new compilation
+    for almost every batch. This pads the sequences of every batch to the
+    smallest bucket length that fits them, which bounds the number of
+    distinct shapes to the number of buckets.
+
+    The sequence length of a batch is the size of the second axis of its
+    first input array with at least 2 dimensions. All the input arrays with
+    at least 2 dimensions are padded along their second axis with
+    `pad_value`, so they must all have this length. When the inputs are a
+    dict, a boolean mask of the sequence steps, `False` for the padded
+    steps, is added to them under the `mask_key` key. When `pad_targets` is
+    `True`, the target arrays with at least 2 dimensions are padded as well
+    and the sample weights are set to the mask of the sequence steps, so
+    that the padded steps do not contribute to the loss and the metrics.
+
+    Python generators are padded with `bucket()`, `keras.utils.PyDataset`
+    instances with their `bucket_lengths` argument.
+
+    Example:
+
+    ```python
+    def generator():
+        for tokens, labels in batches:
+            yield {"token_ids": tokens}, labels
+
+    bucketing = keras.utils.ShapeBucketing([32, 64, 128])
+    model.fit(bucketing.bucket(generator()), epochs=1)
+    ```
+
+    Args:
+        bucket_lengths: List of the lengths to pad the sequences to.
+        pad_value: Value used to pad the arrays. Defaults to `0`, which
+            matches the padding value masked by
+            `keras.layers.Embedding(mask_zero=True)`.
+        pad_targets: Whether the targets are sequences of the same length
+            as the inputs, to be padded and masked. Defaults to `False`.
+        mask_key: Key of the mask of the sequence steps in dict inputs, or
+            `None` to not add it. If the inputs already have this key, it
+            is padded with `False`. Defaults to `"padding_mask"`, the
+            padding mask input of the KerasHub models.
+        bucket_counts: Optional `collections.Counter` in which to count the
+            number of batches padded to each bucket length.
+    """
+
+    def __init__(
+        self,
+        bucket_lengths,
+        pad_value=0,
+        pad_targets=False,
+        mask_key="padding_mask",
+        bucket_counts=None,
+    ):
+        if (
+            not bucket_lengths
+            or not all(isinstance(x, int) for x in bucket_lengths)
+            or min(bucket_lengths) < 1
+        ):
+            raise ValueError(
+                "Argument `bucket_lengths` must be a non-empty list of "
+                f"positive integers. Received: bucket_lengths={bucket_lengths}"
+            )
+        self.bucket_lengths = sorted(set(bucket_lengths))
+        self.pad_value = pad_value
+        self.pad_targets = pad_targets
+        self.mask_key = mask_key
+        if bucket_counts is None:
+            bucket_counts = collections.Counter()
+        self.bucket_counts = bucket_counts
+
+    def get_bucket_length(self, length):
+        """Returns the smallest bucket length greater or equal to `length`."""
+        index = bisect.bisect_left(self.bucket_lengths, length)
+        if index == len(self.bucket_lengths):
+            raise ValueError(
+                f"Received a batch of sequences of length {length}, which is "
+                "longer than the largest bucket length "
+                f"{self.bucket_lengths[-1]}. Add a larger length to "
+                f"`bucket_lengths`. Received: "
+                f"bucket_lengths={self.bucket_lengths}"
+            )
+        return self.bucket_lengths[index]
+
+    def __call__(self, batch):
+        """Pads `batch` to its bucket length.
+
+        Args:
+            batch: A batch, either `x`, `(x,)`, `(x, y)` or
+                `(x, y, sample_weight)`.
+
+        Returns:
+            The padded batch, in the same format as `batch`, except that the
+            sample weights are added when padding the targets.
+        """
+        batch, bucket_length = self._pad_batch(batch)
+        if bucket_length is not None:
+            self.bucket_counts[bucket_length] += 1
+        return batch
+
+    def bucket(self, generator):
+        """Pads the batches of a Python generator to their bucket lengths.
+
+        Args:
+            generator: A Python generator of batches, to be passed to
+                `fit()`, `evaluate()` or `predict()`.
+
+        Returns:
+            An iterable of the padded batches, which can be passed to
+            `fit()`, `evaluate()` or `predict()` in place of `generator`.
+        """
+        return BucketedGenerator(generator, self)
+
+    def _pad_batch(self, batch):
+        x, y, sample_weight = data_adapter_utils.unpack_x_y_sample_weight(batch)
+        sequences = [v for v in tree.flatten(x) if _is_sequence(v)]
+        if not sequences:
+            return batch, None
+        length = sequences[0].shape[1]
+        bucket_length = self.get_bucket_length(length)
+
+        def pad(v, name, pad_value=self.pad_value):
+            if not _is_sequence(v):
+                return v
+            if v.shape[1] != length:
+                raise ValueError(
+                    "All the sequences of a batch must have the same length "
+                    f"to be padded to a bucket length. The batch has "
+                    f"sequences of length {length} and {name} of shape "
+                    f"{v.shape}."
+                )
+            if length == bucket_length:
+                return v
+            v = np.asarray(v)
+            padded = np.full(
+                (v.shape[0], bucket_length) + v.shape[2:],
+                pad_value,
+                dtype=v.dtype,
+            )
+            padded[:, :length] = v
+            return padded
+
+        padded_x = tree.map_structure(lambda v: pad(v, "inputs"), x)
+        mask = np.zeros((sequences[0].shape[0], bucket_length), "bool")
+        mask[:, :length] = True
+        if isinstance(x, dict) and self.mask_key is not None:
+            if self.mask_key in x:
+                padded_x[self.mask_key] = pad(
+                    x[self.mask_key], "inputs", pad_value=False
+                )
+            else:
+                padded_x[self.mask_key] = mask
+        x = padded_x
+        if not self.pad_targets or y is None:
+            if not isinstance(batch, (tuple, list)):
+                return x, bucket_length
+            return (x, y, sample_weight)[: len(batch)], bucket_length
+
+        y = tree.map_structure(lambda v: pad(v, "targets"), y)
+        mask = mask.astype(backend.floatx())
+
+        def mask_sample_weight(v):
+            if v is None:
+                return mask
+            if len(v.shape) == 1:
+                return np.asarray(v, dtype=mask.dtype)[:, None] * mask
+            return pad(v, "sample weights") * mask.reshape(
+                mask.shape + (1,) * (len(v.shape) - 2)
+            ).astype(v.dtype, copy=False)
+
+        if sample_weight is None:
+            sample_weight = tree.map_structure(lambda _: mask, y)
+        else:
+            sample_weight = tree.map_structure(
+                mask_sample_weight, sample_weight
+            )
+        return (x, y, sample_weight), bucket_length
+
+    def get_tensor_spec(self, batches):
+        """Returns the common tensor spec of `batches` once padded.
+
+        The sequence axis of the padded arrays is left unknown, since it
+        varies from one bucket to the next.
+
+        Args:
+            batches: list of batches, which are not counted in
+                `bucket_counts`.
+
+        Returns:
+            The common tensor spec for all the padded batches.
+        """
+        spec = data_adapter_utils.get_tensor_spec(
+            [self._pad_batch(batch)[0] for batch in batches]
+        )
+
+        def relax(s):
+            if s.shape.rank is None or s.shape.rank < 2:
+                return s
+            shape = list(s.shape)
+            shape[1] = None
+            return type(s)(shape=shape, dtype=s.dtype)
+
+        if not isinstance(spec, tuple):
+            return tree.map_structure(relax, spec)
+        if self.pad_targets:
+            return tuple(tree.map_structure(relax, s) for s in spec)
+        return (tree.map_structure(relax, spec[0]),) + spec[1:]
+
+
+def _is_sequence(x):
+    return (
+        hasattr(x, "shape")
+        and len(x.shape) >= 2
+        and not data_adapter_utils.is_scipy_sparse(x)
+    )
+
+
+class BucketedGenerator:
+    """A Python generator padded by a `ShapeBucketing`.
+
+    Returned by `ShapeBucketing.bucket()`, so that the data adapters know
+    the sequence lengths of the batches vary from one bucket to the next.
+    """
+
+    def __init__(self, generator, bucketing):
+        self.generator = generator
+        self.bucketing = bucketing
+
+    def __iter__(self):
+        return map(self.bucketing, self.generator)
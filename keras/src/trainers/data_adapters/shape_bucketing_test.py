@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from keras.src import layers
+from keras.src import models
+from keras.src import ops
+from keras.src import testing
+from keras.src.trainers.data_adapters import get_data_adapter
+from keras.src.trainers.data_adapters.shape_bucketing import ShapeBucketing
+
+
+class ShapeBucketingTest(testing.TestCase):
+    def test_pad_inputs(self):
+        bucketing = ShapeBucketing([8, 4])
+        self.assertEqual(bucketing.bucket_lengths, [4, 8])
+        x = np.arange(6).reshape((2, 3)) + 1
+        y = np.ones((2, 1))
+
+        bx, by = bucketing((x, y))
+        self.assertAllClose(bx, [[1, 2, 3, 0], [4, 5, 6, 0]])
+        self.assertIs(by, y)
+
+        bx = bucketing(np.ones((2, 5, 3)))
+        self.assertEqual(bx.shape, (2, 8, 3))
+        self.assertAllClose(bx[:, 5:], np.zeros((2, 3, 3)))
+
+        # Inputs already at a bucket length are not copied.
+        x = np.ones((2, 4))
+        self.assertIs(bucketing((x,))[0], x)
+        self.assertEqual(dict(bucketing.bucket_counts), {4: 2, 8: 1})
+
+    def test_pad_dict_inputs(self):
+        bucketing = ShapeBucketing([4], pad_value=-1)
+        x = {"tokens": np.ones((2, 3)), "features": np.ones((2,))}
+        bx = bucketing(x)
+        self.assertAllClose(bx["tokens"], [[1, 1, 1, -1], [1, 1, 1, -1]])
+        self.assertIs(bx["features"], x["features"])
+        self.assertEqual(bx["padding_mask"].dtype, "bool")
+        self.assertAllEqual(bx["padding_mask"], [[1, 1, 1, 0], [1, 1, 1, 0]])
+        self.assertNotIn("padding_mask", x)
+
+        # An existing mask is padded with `False`.
+        x = {"tokens": np.ones((2, 3)), "mask": np.array([[1, 1, 0]] * 2)}
+        bucketing = ShapeBucketing([4], pad_value=-1, mask_key="mask")
+        self.assertAllEqual(bucketing(x)["mask"], [[1, 1, 0, 0]] * 2)
+
+        bucketing = ShapeBucketing([4], mask_key=None)
+        self.assertEqual(list(bucketing(x)), ["tokens", "mask"])
+
+    def test_pad_targets(self):
+        bucketing = ShapeBucketing([4], pad_targets=True)
+        x = np.ones((2, 3))
+        y = np.ones((2, 3, 5))
+
+        bx, by, bsw = bucketing((x, y))
+        self.assertEqual(by.shape, (2, 4, 5))
+        self.assertAllClose(bsw, [[1, 1, 1, 0], [1, 1, 1, 0]])
+
+        _, _, bsw = bucketing((x, y, np.array([1.0, 2.0])))
+        self.assertAllClose(bsw, [[1, 1, 1, 0], [2, 2, 2, 0]])
+
+        _, _, bsw = bucketing((x, y, np.full((2, 3), 3.0)))
+        self.assertAllClose(bsw, [[3, 3, 3, 0], [3, 3, 3, 0]])
+
+    @pytest.mark.requires_trainable_backend
+    def test_fit(self):
+        def generator():
+            for length in (3, 5, 2, 7, 4, 8):
+                tokens = np.random.randint(1, 10, size=(4, length))
+                yield {"tokens": tokens}, np.ones((4, 1))
+
+        tokens = layers.Input((None,), dtype="int32", name="tokens")
+        padding_mask = layers.Input((None,), dtype="bool", name="padding_mask")
+        x = layers.Embedding(10, 4)(tokens)
+        x = x * ops.expand_dims(ops.cast(padding_mask, x.dtype), -1)
+        outputs = layers.Dense(1)(layers.GlobalAveragePooling1D()(x))
+        model = models.Model(
+            {"tokens": tokens, "padding_mask": padding_mask}, outputs
+        )
+        model.compile(optimizer="sgd", loss="mse")
+
+        bucketing = ShapeBucketing([4, 8])
+        adapter = get_data_adapter(bucketing.bucket(generator()))
+        self.assertIs(adapter.bucketing, bucketing)
+        history = model.fit(bucketing.bucket(generator()), verbose=0)
+        self.assertLen(history.history["loss"], 1)
+        self.assertEqual(set(bucketing.bucket_counts), {4, 8})
+
+    def test_errors(self):
+        with self.assertRaisesRegex(ValueError, "positive integers"):
+            ShapeBucketing([])
+        with self.assertRaisesRegex(ValueError, "positive integers"):
+            ShapeBucketing([0, 4])
+        bucketing = ShapeBucketing([4])
+        with self.assertRaisesRegex(ValueError, "largest bucket length"):
+            bucketing(np.ones((2, 5)))
+        with self.assertRaisesRegex(ValueError, "same length"):
+            bucketing(((np.ones((2, 3)), np.ones((2, 2))),))
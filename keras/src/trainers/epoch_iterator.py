@@ -40,8 +40,12 @@ or until there is no data
 """
 
 import contextlib
+import queue
+import threading
+import time
 import warnings
 
+from keras.src import backend
 from keras.src.trainers import data_adapters
 
 
@@ -56,12 +60,24 @@ class EpochIterator:
         shuffle=False,
         class_weight=None,
         steps_per_execution=1,
+        prefetch_size=None,
     ):
         self.steps_per_epoch = steps_per_epoch
         self.steps_per_execution = steps_per_execution
+        if prefetch_size is None:
+            prefetch_size = backend.config.data_prefetch_size()
+        self.prefetch_size = prefetch_size
         self._current_iterator = None
         self._epoch_iterator = None
         self._steps_seen = 0
+        # Time spent waiting for data, in seconds, when recorded by
+        # `_timed_iterator()`.
+        self.last_data_wait_time = 0.0
+        self.data_wait_time = 0.0
+        # Prevent the prefetching threads from reading batches between the
+        # end of an epoch and the beginning of the next one.
+        self._epoch_lock = threading.Lock()
+        self._in_epoch = threading.Event()
         self.data_adapter = data_adapters.get_data_adapter(
             x=x,
             y=y,
@@ -86,15 +102,113 @@ class EpochIterator:
             stacklevel=2,
         )
 
+    def _on_epoch_begin(self):
+        self.data_adapter.on_epoch_begin()
+        self._in_epoch.set()
+
+    def _on_epoch_end(self):
+        # Waits for the batch being read by a prefetching thread, if any.
+        with self._epoch_lock:
+            self._in_epoch.clear()
+            self.data_adapter.on_epoch_end()
+
+    def _timed_iterator(self, iterator):
+        """Records how long each step waits for its batch of data."""
+        while True:
+            start_time = time.perf_counter()
+            try:
+                data = next(iterator)
+            except StopIteration:
+                return
+            self.last_data_wait_time = time.perf_counter() - start_time
+            self.data_wait_time += self.last_data_wait_time
+            yield data
+
+    def _prefetch_iterator(self, iterator, scope=None):
+        """Prefetches the batches of `iterator` in a background thread.
+
+        Up to `self.prefetch_size` batches, including the one in use by the
+        training loop, are read ahead of time. This overlaps the input
+        pipeline, and any conversion or host to device copy done by
+        `iterator`, with the computation of the training steps.
+
+        Args:
+            iterator: iterator of batches.
+            scope: optional function returning a context manager entered by
+                the background thread, to apply thread local settings such as
+                the current distribution or device.
+        """
+        if self.prefetch_size == 0:
+            yield from iterator
+            return
+
+        buffer = queue.Queue()
+        # Bounds the number of batches read ahead of the training loop. A
+        # batch is not read before there is room for it, as the batches read
+        # from the iterator of a generator would be lost for the next epochs.
+        slots = threading.Semaphore(self.prefetch_size)
+        stop_event = threading.Event()
+        # The thread must not hold a reference to `self`, which holds this
+        # generator, otherwise neither would ever be released.
+        epoch_lock = self._epoch_lock
+        in_epoch = self._in_epoch
+
+        def read():
+            while not stop_event.is_set():
+                if not slots.acquire(timeout=0.1):
+                    continue
+                while not in_epoch.wait(timeout=0.1):
+                    if stop_event.is_set():
+                        return
+                with epoch_lock:
+                    if stop_event.is_set():
+                        return
+                    if not in_epoch.is_set():
+                        slots.release()
+                        continue
+                    data = next(iterator)
+                buffer.put((data, None))
+
+        def run():
+            try:
+                with scope() if scope else contextlib.nullcontext():
+                    read()
+            except StopIteration:
+                buffer.put((None, None))
+            except Exception as e:
+                buffer.put((None, e))
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        try:
+            while True:
+                data, error = buffer.get()
+                if error is not None:
+                    raise error
+                if data is None:
+                    return
+                yield data
+                # The slot of a batch is kept until the next one is requested,
+                # so that the batch in use counts towards `prefetch_size`.
+                slots.release()
+        finally:
+            # Also reached when the iterator is discarded before the end. Wait
+            # for the thread so that it no longer reads from `iterator`, which
+            # may share its source with the next iterator.
+            stop_event.set()
+            thread.join()
+
     def reset(self):
         self._current_iterator = None
         self._num_batches = self.data_adapter.num_batches
         self._steps_seen = 0
         self._epoch_iterator = None
-        self.data_adapter.on_epoch_end()
+        self.last_data_wait_time = 0.0
+        self.data_wait_time = 0.0
+        self._on_epoch_end()
 
     def _enumerate_iterator(self):
-        self.data_adapter.on_epoch_begin()
+        self._on_epoch_begin()
         steps_per_epoch = self.steps_per_epoch or self._num_batches or -1
 
         if steps_per_epoch > 0:
@@ -118,7 +232,7 @@ class EpochIterator:
                 step += self.steps_per_execution
                 self._steps_seen = step + self.steps_per_execution
                 yield step, iterator
-        self.data_adapter.on_epoch_end()
+        self._on_epoch_end()
 
     def __iter__(self):
         self._epoch_iterator = self._enumerate_iterator()
@@ -150,7 +264,7 @@ class EpochIterator:
                 self._num_batches = self._steps_seen
             self._interrupted_warning()
             self._current_iterator = None
-            self.data_adapter.on_epoch_end()
+            self._on_epoch_end()
 
     @property
     def num_batches(self):
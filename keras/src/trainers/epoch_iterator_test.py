@@ -1,3 +1,6 @@
+import threading
+import time
+
 import numpy as np
 import pytest
 import tensorflow as tf
@@ -230,3 +233,123 @@ class TestEpochIterator(testing.TestCase):
                 pass
 
         self.assertAllEqual(ds.tracker, [1, 2] * num_epochs)
+
+    @parameterized.named_parameters(
+        [
+            ("no_prefetch", 0),
+            ("prefetch_1", 1),
+            ("prefetch_3", 3),
+        ]
+    )
+    def test_prefetch_iterator(self, prefetch_size):
+        iterator = epoch_iterator.EpochIterator(
+            x=np.zeros((8, 2)), prefetch_size=prefetch_size
+        )
+        batches_read = []
+
+        def generator():
+            for i in range(8):
+                batches_read.append(i)
+                yield i
+
+        iterator._on_epoch_begin()
+        values = []
+        for value in iterator._timed_iterator(
+            iterator._prefetch_iterator(generator())
+        ):
+            values.append(value)
+            # At most `prefetch_size` batches are read ahead, including the
+            # one in use.
+            self.assertLessEqual(
+                len(batches_read), len(values) + max(prefetch_size - 1, 0)
+            )
+            self.assertGreaterEqual(iterator.last_data_wait_time, 0.0)
+            self.assertGreaterEqual(
+                iterator.data_wait_time, iterator.last_data_wait_time
+            )
+        self.assertEqual(values, list(range(8)))
+
+        iterator.reset()
+        self.assertEqual(iterator.data_wait_time, 0.0)
+
+    def test_prefetch_iterator_exception_and_stop(self):
+        iterator = epoch_iterator.EpochIterator(
+            x=np.zeros((8, 2)), prefetch_size=2
+        )
+        iterator._on_epoch_begin()
+
+        def failing_generator():
+            yield 0
+            raise ValueError("Expected error")
+
+        with self.assertRaisesRegex(ValueError, "Expected error"):
+            for _ in iterator._prefetch_iterator(failing_generator()):
+                pass
+
+        # Discarding the iterator before the end stops the background thread.
+        num_threads = threading.active_count()
+        prefetch_iterator = iterator._prefetch_iterator(iter(range(100)))
+        self.assertEqual(next(prefetch_iterator), 0)
+        self.assertEqual(threading.active_count(), num_threads + 1)
+        del prefetch_iterator
+        self.assertEqual(threading.active_count(), num_threads)
+
+    def test_prefetch_iterator_waits_for_epoch(self):
+        iterator = epoch_iterator.EpochIterator(
+            x=np.zeros((8, 2)), prefetch_size=3
+        )
+        batches_read = []
+
+        def generator():
+            for i in range(8):
+                batches_read.append(i)
+                yield i
+
+        iterator._on_epoch_begin()
+        prefetch_iterator = iterator._prefetch_iterator(generator())
+        self.assertEqual(next(prefetch_iterator), 0)
+        iterator._on_epoch_end()
+        num_batches_read = len(batches_read)
+        time.sleep(0.3)
+        # No batch is read between the end and the beginning of epochs.
+        self.assertEqual(len(batches_read), num_batches_read)
+        iterator._on_epoch_begin()
+        self.assertEqual(list(prefetch_iterator), list(range(1, 8)))
+
+    @pytest.mark.skipif(
+        backend.backend() != "jax", reason="Need the JAX epoch iterator"
+    )
+    def test_jax_prefetch(self):
+        from keras.src.backend.jax.trainer import JAXEpochIterator
+
+        x = np.arange(32, dtype="float32").reshape((16, 2))
+        iterator = JAXEpochIterator(x=x, batch_size=4, prefetch_size=2)
+        batches = []
+        for _, data_iterator in iterator:
+            batches.append(next(data_iterator))
+        self.assertAllClose(np.concatenate(batches), x)
+        self.assertGreater(iterator.data_wait_time, 0.0)
+
+    @pytest.mark.skipif(
+        backend.backend() != "torch", reason="Need the torch epoch iterator"
+    )
+    def test_torch_prefetch(self):
+        import torch
+
+        from keras.src.backend.torch.trainer import TorchEpochIterator
+        from keras.src.backend.torch.trainer import _stage_batch
+
+        x = np.arange(32, dtype="float32").reshape((16, 2))
+        iterator = TorchEpochIterator(x=x, batch_size=4, prefetch_size=2)
+        batches = []
+        for _, batch in iterator:
+            batches.append(backend.convert_to_numpy(batch[0]))
+        self.assertAllClose(np.concatenate(batches), x)
+        self.assertGreater(iterator.data_wait_time, 0.0)
+
+        batch = (torch.zeros((4, 2)), {"a": torch.ones((4,))})
+        self.assertIs(_stage_batch(batch, "cpu"), batch)
+        if torch.cuda.is_available():
+            staged = _stage_batch(batch, "cuda", pin_memory=True)
+            self.assertEqual(staged[0].device.type, "cuda")
+            self.assertEqual(staged[1]["a"].device.type, "cuda")
@@ -1,3 +1,4 @@
+import collections
 import inspect
 import platform
 import warnings
@@ -7,6 +8,7 @@ from keras.src import metrics as metrics_module
 from keras.src import ops
 from keras.src import optimizers
 from keras.src import tree
+from keras.src.distribution import distribution_lib
 from keras.src.optimizers.loss_scale_optimizer import LossScaleOptimizer
 from keras.src.saving import serialization_lib
 from keras.src.trainers.compile_utils import CompileLoss
@@ -16,6 +18,11 @@ from keras.src.utils import python_utils
 from keras.src.utils import traceback_utils
 from keras.src.utils import tracking
 
+# Maximum number of step functions kept by `Trainer._get_step_function()`.
+STEP_FUNCTION_CACHE_SIZE = 8
+# Number of traces of a step function from which a warning is issued.
+RETRACING_WARNING_THRESHOLD = 5
+
 
 class Trainer:
     def __init__(self):
@@ -36,6 +43,10 @@ class Trainer:
         self._compile_metrics = None
         self._loss_tracker = None
 
+        # Step functions by kind and settings. They hold no variables to track.
+        with tracking.DotNotTrackScope():
+            self._step_functions = collections.OrderedDict()
+
     @traceback_utils.filter_traceback
     @tracking.no_automatic_dependency_tracking
     def compile(
@@ -126,8 +137,9 @@ class Trainer:
                 epoch. Note that if `steps_per_execution` is set to `N`,
                 `Callback.on_batch_begin` and `Callback.on_batch_end` methods
                 will only be called every `N` batches (i.e. before/after
-                each compiled function execution).
-                Not supported with the PyTorch backend.
+                each compiled function execution). With the PyTorch
+                backend, the batches of an execution run one compiled step
+                after the other.
             jit_compile: Bool or `"auto"`. Whether to use XLA compilation when
                 compiling a model. For `jax` and `tensorflow` backends,
                 `jit_compile="auto"` enables XLA compilation if the model
@@ -188,6 +200,7 @@ class Trainer:
         self.train_function = None
         self.test_function = None
         self.predict_function = None
+        self._step_functions.clear()
 
         self._compile_config = serialization_lib.SerializableDict(
             optimizer=optimizer,
@@ -1041,6 +1054,95 @@ class Trainer:
             return results[0]
         return results
 
+    def _get_step_function(self, kind, make_function, force=False):
+        """Returns the step function of `kind` for the current settings.
+
+        The step functions are cached by kind, `steps_per_execution`,
+        `jit_compile`, `run_eagerly` and distribution, so that going back to
+        previous settings does not build and compile them again. The least
+        recently used ones are dropped from the cache, and `compile()` clears
+        it. Setting e.g. `train_function` to `None` drops the cached step
+        functions of that kind.
+
+        Args:
+            kind: One of `"train"`, `"test"` and `"predict"`.
+            make_function: Function building the step function.
+            force: Whether to build the step function again, e.g. after a
+                change of the `trainable` attribute of a layer. This also
+                drops the other cached step functions.
+
+        Returns:
+            The step function.
+        """
+        if force:
+            self._step_functions.clear()
+        elif getattr(self, f"{kind}_function", None) is None:
+            for key in list(self._step_functions):
+                if key[0] == kind:
+                    del self._step_functions[key]
+        key = (
+            kind,
+            self.steps_per_execution,
+            self.jit_compile,
+            self.run_eagerly,
+            distribution_lib.distribution(),
+        )
+        if key in self._step_functions:
+            self._step_functions.move_to_end(key)
+            return self._step_functions[key]
+        function = make_function()
+        self._step_functions[key] = function
+        if len(self._step_functions) > STEP_FUNCTION_CACHE_SIZE:
+            self._step_functions.popitem(last=False)
+        return function
+
+    def _count_traces(self, kind, step_function):
+        """Wraps `step_function` to count and warn about its traces.
+
+        The wrapped function must be traced by the compiler, its Python code
+        then only runs when the step function is traced, e.g. for new input
+        shapes. A warning is issued once it was traced for
+        `RETRACING_WARNING_THRESHOLD` different input shapes and dtypes.
+
+        Args:
+            kind: One of `"train"`, `"test"` and `"predict"`.
+            step_function: Function taking a batch of data as last argument.
+
+        Returns:
+            The wrapped function.
+        """
+
+        # Input shapes and dtypes for which this function was traced.
+        signatures = set()
+        warned = [False]
+
+        def traced_step_function(*args):
+            shapes = tree.map_structure(
+                lambda x: tuple(x.shape) if hasattr(x, "shape") else x,
+                args[-1],
+            )
+            dtypes = tree.map_structure(
+                lambda x: str(x.dtype) if hasattr(x, "dtype") else None,
+                args[-1],
+            )
+            signatures.add(repr((shapes, dtypes)))
+            if len(signatures) >= RETRACING_WARNING_THRESHOLD and not warned[0]:
+                warned[0] = True
+                warnings.warn(
+                    f"The {kind} step function of the model was traced for "
+                    f"{RETRACING_WARNING_THRESHOLD} different input shapes or "
+                    "dtypes, which is expensive. Retracing happens when the "
+                    "step function is called with batches of new shapes or "
+                    "dtypes. "
+                    "Consider passing batches with a fixed shape, by "
+                    "padding them or by dropping the last incomplete batch. "
+                    f"Last input shapes: {shapes}",
+                    stacklevel=traceback_utils.get_user_stacklevel(),
+                )
+            return step_function(*args)
+
+        return traced_step_function
+
     def _assert_compile_called(self, method_name=None):
         if not self.compiled:
             msg = "You must call `compile()` before "
@@ -1,3 +1,5 @@
+import os
+import warnings
 from unittest import mock
 
 import numpy as np
@@ -18,7 +20,9 @@ from keras.src.backend.common.symbolic_scope import in_symbolic_scope
 from keras.src.callbacks.callback import Callback
 from keras.src.optimizers.rmsprop import RMSprop
 from keras.src.testing.test_utils import named_product
+from keras.src.trainers import trainer as trainer_module
 from keras.src.trainers.data_adapters import py_dataset_adapter
+from keras.src.utils import traceback_utils
 
 if backend.backend() == "jax":
     from keras.src.backend.jax.trainer import JAXTrainer as Trainer
@@ -906,10 +910,6 @@ class TestTrainer(testing.TestCase):
         )
     )
     @pytest.mark.requires_trainable_backend
-    @pytest.mark.skipif(
-        backend.backend() == "torch",
-        reason="`steps_per_execution` not implemented for torch yet",
-    )
     def test_steps_per_execution_steps_count(self, steps_per_execution, mode):
         data_size = 100
         batch_size = 16
@@ -1043,9 +1043,6 @@ class TestTrainer(testing.TestCase):
         )
     )
     def test_predict_preserve_order(self, steps_per_execution, mode):
-        if steps_per_execution > 1 and backend.backend() == "torch":
-            self.skipTest("`steps_per_execution` not implemented for torch yet")
-
         def generate_uneven_batches():
             batch_sizes = [2, 3, 4]
 
@@ -1093,9 +1090,6 @@ class TestTrainer(testing.TestCase):
         )
     )
     def test_predict_generator(self, steps_per_execution, mode):
-        if steps_per_execution > 1 and backend.backend() == "torch":
-            self.skipTest("`steps_per_execution` not implemented for torch yet")
-
         batch_size = 2
 
         def generate_batches():
@@ -1137,10 +1131,6 @@ class TestTrainer(testing.TestCase):
         )
     )
     @pytest.mark.requires_trainable_backend
-    @pytest.mark.skipif(
-        backend.backend() == "torch",
-        reason="`steps_per_execution` not implemented for torch yet",
-    )
     def test_steps_per_execution_steps_count_unknown_dataset_size(
         self, steps_per_execution, mode
     ):
@@ -1223,10 +1213,6 @@ class TestTrainer(testing.TestCase):
         )
     )
     @pytest.mark.requires_trainable_backend
-    @pytest.mark.skipif(
-        backend.backend() == "torch",
-        reason="`steps_per_execution` not implemented for torch yet",
-    )
     def test_steps_per_execution_steps_per_epoch(
         self, steps_per_epoch_test, mode
     ):
@@ -1457,10 +1443,6 @@ class TestTrainer(testing.TestCase):
         )
     )
     @pytest.mark.requires_trainable_backend
-    @pytest.mark.skipif(
-        backend.backend() == "torch",
-        reason="`steps_per_execution` not implemented for torch yet",
-    )
     def test_steps_per_execution_steps_per_epoch_unknown_data_size(
         self, steps_per_epoch_test, mode
     ):
@@ -1576,10 +1558,6 @@ class TestTrainer(testing.TestCase):
                 model.evaluate(dataset), model_2.evaluate(dataset)
             )
 
-    @pytest.mark.skipif(
-        backend.backend() == "torch",
-        reason="`steps_per_execution` not implemented for torch yet",
-    )
     def test_steps_per_execution_steps_count_without_training(self):
         class StepCount(Callback):
             def __init__(self):
@@ -2644,7 +2622,7 @@ class TestTrainer(testing.TestCase):
     @pytest.mark.requires_trainable_backend
     @pytest.mark.skipif(
         backend.backend() == "torch",
-        reason="`steps_per_execution` not implemented for torch yet",
+        reason="The torch steps are not traced",
     )
     def test_retracing(self):
         x = np.ones((100, 4))
@@ -2680,7 +2658,7 @@ class TestTrainer(testing.TestCase):
     @pytest.mark.requires_trainable_backend
     @pytest.mark.skipif(
         backend.backend() == "torch",
-        reason="`steps_per_execution` not implemented for torch yet",
+        reason="The torch steps are not traced",
     )
     @pytest.mark.skipif(
         backend.backend() == "tensorflow",
@@ -2714,6 +2692,89 @@ class TestTrainer(testing.TestCase):
         )
         self.assertLessEqual(tracing_count[0], 2)
 
+    @pytest.mark.requires_trainable_backend
+    def test_step_functions_cache(self):
+        model = ExampleModel(units=3)
+        model.compile(optimizer="sgd", loss="mse")
+        x = np.ones((8, 2))
+        y = np.ones((8, 3))
+
+        model.fit(x, y, batch_size=2, verbose=0)
+        train_function = model.train_function
+        model.steps_per_execution = 2
+        model.fit(x, y, batch_size=2, verbose=0)
+        self.assertIsNot(model.train_function, train_function)
+        model.steps_per_execution = 1
+        model.fit(x, y, batch_size=2, verbose=0)
+        self.assertIs(model.train_function, train_function)
+
+        model.evaluate(x, y, batch_size=2, verbose=0)
+        test_function = model.test_function
+        model.evaluate(x, y, batch_size=2, verbose=0)
+        self.assertIs(model.test_function, test_function)
+
+        # Resetting a step function builds it again.
+        model.train_function = None
+        model.fit(x, y, batch_size=2, verbose=0)
+        self.assertIsNot(model.train_function, train_function)
+        train_function = model.train_function
+
+        # The step functions capture the loss and the optimizer.
+        model.compile(optimizer="sgd", loss="mae")
+        model.fit(x, y, batch_size=2, verbose=0)
+        self.assertIsNot(model.train_function, train_function)
+
+    @pytest.mark.requires_trainable_backend
+    def test_step_functions_cache_size(self):
+        model = ExampleModel(units=3)
+        model.compile(optimizer="sgd", loss="mse")
+        x = np.ones((8, 2))
+        for steps_per_execution in range(1, 12):
+            model.steps_per_execution = steps_per_execution
+            model.predict(x, batch_size=2, verbose=0)
+        self.assertLen(
+            model._step_functions, trainer_module.STEP_FUNCTION_CACHE_SIZE
+        )
+
+    @pytest.mark.requires_trainable_backend
+    @pytest.mark.skipif(
+        backend.backend() == "torch",
+        reason="The torch steps are not traced",
+    )
+    def test_retracing_warning(self):
+        model = ExampleModel(units=3)
+        model.compile(optimizer="sgd", loss="mse")
+        num_traces = trainer_module.RETRACING_WARNING_THRESHOLD
+        dtypes = ["float16", "float32", "float64", "int32", "int64"]
+        # This file is considered as user code instead of Keras code.
+        src_dir = os.path.dirname(os.path.dirname(trainer_module.__file__))
+        with (
+            mock.patch.object(
+                traceback_utils,
+                "include_frame",
+                lambda fname: fname == __file__ or src_dir not in fname,
+            ),
+            pytest.warns(UserWarning, match=f"traced for {num_traces}") as r,
+        ):
+            # Change both the shapes and the dtypes, as tf.function relaxes
+            # the shapes after a few traces.
+            for i in range(num_traces + 1):
+                model.train_on_batch(
+                    np.ones((i + 1, 2), dtype=dtypes[i % len(dtypes)]),
+                    np.ones((i + 1, 3)),
+                )
+        # The warning points to the user code.
+        records = [w for w in r if "traced for" in str(w.message)]
+        self.assertLen(records, 1)
+        self.assertEqual(records[0].filename, __file__)
+
+        # The traces of previous compilations aren't counted.
+        for _ in range(num_traces + 1):
+            model.compile(optimizer="sgd", loss="mse")
+            with warnings.catch_warnings():
+                warnings.filterwarnings("error", message=".*traced for")
+                model.fit(np.ones((4, 2)), np.ones((4, 3)), verbose=0)
+
 
 class TrainerDistributeTest(testing.TestCase):
     @pytest.mark.skipif(
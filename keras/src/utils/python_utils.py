@@ -1,5 +1,6 @@
 import binascii
 import codecs
+import collections.abc
 import marshal
 import os
 import types as python_types
@@ -175,3 +176,67 @@ def pythonify_logs(logs):
                 pass
             result[key] = value
     return result
+
+
+def _flatten_log_keys(logs):
+    keys = []
+    for key, value in sorted(logs.items()):
+        if isinstance(value, dict):
+            keys.extend(_flatten_log_keys(value))
+        else:
+            keys.append(key)
+    return keys
+
+
+class LazyLogs(collections.abc.Mapping):
+    """Logs converted to Python-native types when their values are read.
+
+    Converting the log values, which are usually tensors, to Python floats
+    waits for the computation of the step that produced them. `LazyLogs`
+    defers the conversion of all values, done by `pythonify_logs()`, to the
+    first time one of them is read. Listing the keys does not convert them.
+
+    Args:
+        logs: A dict containing log values.
+        on_sync: Optional function called when the values are converted.
+    """
+
+    def __init__(self, logs, on_sync=None):
+        self._logs = logs or {}
+        self._on_sync = on_sync
+        self._keys = None
+        self._values = None
+
+    @property
+    def synced(self):
+        return self._values is not None
+
+    def _sync(self):
+        if self._values is None:
+            self._values = pythonify_logs(self._logs)
+            self._logs = None
+            if self._on_sync is not None:
+                self._on_sync()
+        return self._values
+
+    def _get_keys(self):
+        if self._values is not None:
+            return list(self._values)
+        if self._keys is None:
+            self._keys = list(dict.fromkeys(_flatten_log_keys(self._logs)))
+        return self._keys
+
+    def __getitem__(self, key):
+        return self._sync()[key]
+
+    def __iter__(self):
+        return iter(self._get_keys())
+
+    def __len__(self):
+        return len(self._get_keys())
+
+    def __contains__(self, key):
+        return key in self._get_keys()
+
+    def __repr__(self):
+        return repr(self._sync())
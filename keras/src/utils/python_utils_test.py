@@ -99,3 +99,35 @@ class PythonUtilsTest(testing.TestCase):
         bad_encoded_code = "This isn't valid base64!"
         with self.assertRaises(AttributeError):
             python_utils.func_load(bad_encoded_code)
+
+    def test_lazy_logs(self):
+        class Value:
+            def __init__(self, value):
+                self.value = value
+                self.num_reads = 0
+
+            def __float__(self):
+                self.num_reads += 1
+                return self.value
+
+        loss = Value(1.0)
+        mae = Value(2.0)
+        num_syncs = []
+        logs = python_utils.LazyLogs(
+            {"loss": loss, "metrics": {"mae": mae}},
+            on_sync=lambda: num_syncs.append(1),
+        )
+        # Listing the keys does not convert the values.
+        self.assertLen(logs, 2)
+        self.assertIn("mae", logs)
+        self.assertEqual(sorted(logs), ["loss", "mae"])
+        self.assertFalse(logs.synced)
+        self.assertEqual(loss.num_reads, 0)
+
+        # Reading a value converts all of them, once.
+        self.assertEqual(logs["loss"], 1.0)
+        self.assertEqual(dict(logs), {"loss": 1.0, "mae": 2.0})
+        self.assertTrue(logs.synced)
+        self.assertEqual(loss.num_reads, 1)
+        self.assertEqual(mae.num_reads, 1)
+        self.assertLen(num_syncs, 1)
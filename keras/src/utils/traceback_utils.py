@@ -1,5 +1,6 @@
 import inspect
 import os
+import sys
 import traceback
 import types
 from functools import wraps
@@ -89,6 +90,31 @@ def include_frame(fname):
     return True
 
 
+def get_user_stacklevel():
+    """Returns the `stacklevel` of a warning issued by the caller.
+
+    The warning then points to the first frame of the stack that isn't in
+    Keras or in the loaded frameworks, e.g. while a step function is traced
+    by JAX or TensorFlow.
+    """
+    excluded_paths = ["__autograph_generated_file"]
+    for name in ("jax", "jaxlib", "tensorflow", "torch"):
+        module = sys.modules.get(name)
+        if getattr(module, "__file__", None):
+            excluded_paths.append(os.path.dirname(module.__file__))
+    frame = sys._getframe(1)
+    stacklevel = 1
+    while frame.f_back is not None:
+        fname = frame.f_code.co_filename
+        if include_frame(fname) and not any(
+            path in fname for path in excluded_paths
+        ):
+            break
+        frame = frame.f_back
+        stacklevel += 1
+    return stacklevel
+
+
 def _process_traceback_frames(tb):
     """Iterate through traceback frames and return a new, filtered traceback."""
     last_tb = None
@@ -140,85 +166,108 @@ def inject_argument_info_in_traceback(fn, object_name=None):
     Returns:
         A wrapped version of `fn`.
     """
-    if backend.backend() == "tensorflow":
-        from tensorflow import errors as tf_errors
-    else:
-        tf_errors = None
 
     @wraps(fn)
     def error_handler(*args, **kwargs):
         if not is_traceback_filtering_enabled():
             return fn(*args, **kwargs)
 
-        signature = None
-        bound_signature = None
+        new_e = None
         try:
             return fn(*args, **kwargs)
         except Exception as e:
-            if hasattr(e, "_keras_call_info_injected"):
-                # Only inject info for the innermost failing call
-                raise e
-            signature = inspect.signature(fn)
-            try:
-                # The first argument is `self`, so filter it out
-                bound_signature = signature.bind(*args, **kwargs)
-            except TypeError:
-                # Likely unbindable arguments
-                raise e
-
-            # Add argument context
-            arguments_context = []
-            for arg in list(signature.parameters.values()):
-                if arg.name in bound_signature.arguments:
-                    value = tree.map_structure(
-                        format_argument_value,
-                        bound_signature.arguments[arg.name],
-                    )
-                else:
-                    value = arg.default
-                arguments_context.append(f"  • {arg.name}={value}")
-            if arguments_context:
-                arguments_context = "\n".join(arguments_context)
-                # Get original error message and append information to it.
-                if tf_errors is not None and isinstance(e, tf_errors.OpError):
-                    message = e.message
-                elif e.args:
-                    # Canonically, the 1st argument in an exception is the error
-                    # message. This works for all built-in Python exceptions.
-                    message = e.args[0]
-                else:
-                    message = ""
-                display_name = f"{object_name if object_name else fn.__name__}"
-                message = (
-                    f"Exception encountered when calling {display_name}.\n\n"
-                    f"\x1b[1m{message}\x1b[0m\n\n"
-                    f"Arguments received by {display_name}:\n"
-                    f"{arguments_context}"
-                )
-
-                # Reraise exception, with added context
-                if tf_errors is not None and isinstance(e, tf_errors.OpError):
-                    new_e = e.__class__(e.node_def, e.op, message, e.error_code)
-                else:
-                    try:
-                        # For standard exceptions such as ValueError, TypeError,
-                        # etc.
-                        new_e = e.__class__(message)
-                    except TypeError:
-                        # For any custom error that doesn't have a standard
-                        # signature.
-                        new_e = RuntimeError(message)
-                new_e._keras_call_info_injected = True
-            else:
-                new_e = e
+            new_e = inject_argument_info(e, fn, args, kwargs, object_name)
             raise new_e.with_traceback(e.__traceback__) from None
         finally:
-            del signature
-            del bound_signature
+            del new_e
 
     return error_handler
 
 
+def inject_argument_info(e, fn, args, kwargs, object_name=None):
+    """Returns `e` with information about the arguments of `fn` added to it.
+
+    This is what `inject_argument_info_in_traceback()` does when the wrapped
+    function raises. Use it directly in hot code paths, to avoid creating a
+    wrapper on every call.
+
+    Arguments:
+        e: Exception raised by `fn`.
+        fn: The function which raised `e`.
+        args: Positional arguments `fn` was called with.
+        kwargs: Keyword arguments `fn` was called with.
+        object_name: String, display name of the class/function being called,
+            e.g. `'layer "layer_name" (LayerClass)'`.
+
+    Returns:
+        A new exception with the same type as `e` (or a `RuntimeError` if it
+        cannot be created) or `e` itself, to re-raise with the traceback of
+        `e`.
+    """
+    if hasattr(e, "_keras_call_info_injected"):
+        # Only inject info for the innermost failing call
+        return e
+    if backend.backend() == "tensorflow":
+        from tensorflow import errors as tf_errors
+    else:
+        tf_errors = None
+
+    signature = inspect.signature(fn)
+    try:
+        # The first argument is `self`, so filter it out
+        bound_signature = signature.bind(*args, **kwargs)
+    except TypeError:
+        # Likely unbindable arguments
+        return e
+
+    # Add argument context
+    arguments_context = []
+    for arg in list(signature.parameters.values()):
+        if arg.name in bound_signature.arguments:
+            value = tree.map_structure(
+                format_argument_value,
+                bound_signature.arguments[arg.name],
+            )
+        else:
+            value = arg.default
+        arguments_context.append(f"  • {arg.name}={value}")
+    if not arguments_context:
+        return e
+
+    arguments_context = "\n".join(arguments_context)
+    # Get original error message and append information to it.
+    if tf_errors is not None and isinstance(e, tf_errors.OpError):
+        message = e.message
+    elif e.args:
+        # Canonically, the 1st argument in an exception is the error
+        # message. This works for all built-in Python exceptions.
+        message = e.args[0]
+    else:
+        message = ""
+    display_name = f"{object_name if object_name else fn.__name__}"
+    message = (
+        f"Exception encountered when calling {display_name}.\n\n"
+        f"\x1b[1m{message}\x1b[0m\n\n"
+        f"Arguments received by {display_name}:\n"
+        f"{arguments_context}"
+    )
+
+    # Reraise exception, with added context
+    if tf_errors is not None and isinstance(e, tf_errors.OpError):
+        new_e = e.__class__(e.node_def, e.op, message, e.error_code)
+    else:
+        try:
+            # For standard exceptions such as ValueError, TypeError,
+            # etc.
+            new_e = e.__class__(message)
+        except TypeError:
+            # For any custom error that doesn't have a standard
+            # signature.
+            new_e = RuntimeError(message)
+    new_e._keras_call_info_injected = True
+    return new_e
+
+
 def format_argument_value(value):
     if backend.is_tensor(value):
         # Simplified representation for eager / graph tensors